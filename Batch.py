@@ -0,0 +1,144 @@
+"""
+Module of Shtonda Yelizaveta, contains functions for running many .ini files at once, every distinct .csv file
+is loaded only once
+"""
+import os
+import json
+from concurrent.futures import ThreadPoolExecutor
+import Loading
+import Writers
+
+SHARED = ('backend', 'streaming', 'engine', 'trusted', 'memory_budget', 'memory_action', 'quarantine')
+
+
+def read_jobs(paths):
+    """
+    :param paths: list of relative paths to .ini files and manifests -- .json files with key "jobs", which contains
+    list of relative paths to .ini files and (or) dictionaries with the same keys as .ini file
+    opens every .ini file and prints 'OK' if there are no errors, otherwise prints proper information
+    :return: list of jobs -- pairs of name of job and list of keys like in function Loading.load_ini()
+    (None if job is improper)
+    """
+    jobs = []
+    for path in paths:
+        print(f'ini {path}: ', end='')
+        try:
+            with open(path, 'r', encoding='utf8') as f:
+                r = json.load(f)
+            if not isinstance(r, dict) or 'jobs' not in r:
+                jobs.append((path, Loading.ini_keys(r)))
+                print('OK')
+                continue
+            if not isinstance(r['jobs'], list):
+                raise ValueError('Something wrong with jobs in manifest')
+            print(f'{len(r["jobs"])} jobs')
+        except BaseException as b:
+            jobs.append((path, None))
+            _abort(b)
+            continue
+        for i, job in enumerate(r['jobs']):
+            name = job if isinstance(job, str) else f'{path}[{i}]'
+            print(f'ini {name}: ', end='')
+            try:
+                if isinstance(job, str):
+                    jobs.append((name, Loading.load_ini(job)))
+                    continue
+                jobs.append((name, Loading.ini_keys(job)))
+                print('OK')
+            except BaseException as b:
+                jobs.append((name, None))
+                _abort(b)
+    return jobs
+
+
+def input_key(keys):
+    """
+    :param keys: list of keys like in function Loading.load_ini()
+    :return: key of loaded data -- paths to .csv files (or glob patterns), their encoding and options, which change
+    loaded object, jobs with the same key share one loaded object
+    """
+    main_file, additional_file, input_encoding, output_file, output_encoding, options = keys
+    files = tuple(os.path.abspath(i) for i in ([main_file] if isinstance(main_file, str) else main_file))
+    return (files, input_encoding) + tuple(options[i] for i in SHARED)
+
+
+def run(paths, workers=None):
+    """
+    :param paths: list of relative paths to .ini files and manifests
+    :param workers: quantity of threads, which write output files of one .csv file, by default quantity of CPU
+    reads jobs, groups them by input_key(), loads .csv file of every group once (other options like "workers",
+    "parser" and "snapshot" are taken from the first job of group), checks accordance with .json file of every job
+    and writes output files of group concurrently, then frees loaded data before next group,
+    error of one job (or of loading of group) is printed and other jobs are continued
+    :return: list of names of failed jobs
+    """
+    jobs = read_jobs(paths)
+    failed = [name for name, keys in jobs if keys is None]
+    groups = {}
+    for name, keys in jobs:
+        if keys is not None:
+            groups.setdefault(input_key(keys), []).append((name, keys))
+    with ThreadPoolExecutor(workers or os.cpu_count() or 1) as pool:
+        for group in groups.values():
+            failed.extend(_run_group(group, pool))
+    print(f'batch: {len(jobs) - len(failed)} of {len(jobs)} jobs OK')
+    return failed
+
+
+def _run_group(group, pool):
+    """
+    :param group: list of jobs with the same input_key()
+    :param pool: ThreadPoolExecutor for writing output files
+    loads data of group without .json file, checks .json file of every job (error of this file fails only its
+    job) and writes their output files
+    :return: list of names of failed jobs
+    """
+    main_file, additional_file, input_encoding, output_file, output_encoding, options = group[0][1]
+    try:
+        data = Loading.load_main(main_file, input_encoding, options)
+    except BaseException as b:
+        _abort(b)
+        return [name for name, keys in group]
+    failed = []
+    outputs = []
+    for name, keys in group:
+        try:
+            if Loading.fit(data, Loading.load_stat(keys[1], keys[2])):
+                print('OK')
+            else:
+                print('UPS')
+            outputs.append((name, keys[3], pool.submit(_output, data, keys[3], keys[4], keys[5]['format'])))
+        except BaseException as b:
+            failed.append(name)
+            _abort(b)
+    for name, output_file, future in outputs:
+        print(f'output {output_file}: ', end='')
+        try:
+            future.result()
+            print('OK')
+        except BaseException as b:
+            failed.append(name)
+            _abort(b)
+    return failed
+
+
+def _output(data, output_file, output_encoding, output_format):
+    """
+    :param data: loaded object of class Information or ColumnInformation
+    :param output_file: relative path to file where information is outputed
+    :param output_encoding: type of encoding of output_file
+    :param output_format: 'tsv', 'jsonl' or 'binary'
+    writes report like method output() of data, but without printing (it is done in order of jobs), data is
+    only read, so many reports can be written at once
+    """
+    with Writers.open_writer(output_file, output_encoding, output_format) as writer:
+        data.report(writer)
+
+
+def _abort(error):
+    """
+    :param error: error of job
+    prints information about error like function main.process()
+    """
+    print('\n***** program aborted *****')
+    print(error)
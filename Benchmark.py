@@ -0,0 +1,227 @@
+"""
+Module of Shtonda Yelizaveta, contains generator of big .csv files and harness, which measures time and memory
+of every stage of program
+"""
+import io
+import os
+import sys
+import json
+import math
+import time
+import random
+import tempfile
+import datetime
+import platform
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import Builder
+import Loading
+import Validation
+import Profiling
+import main
+
+NAMES = ['Анастасія', 'Михайло', 'Олена', 'Іван', 'Марія', 'Олег', 'Ганна', 'Петро', 'Ольга', 'Тарас']
+SURNAMES = ['Петренко', 'Тесленко', 'Коваль', 'Мельник', 'Шевченко', 'Бондар', 'Ткаченко', 'Лисенко']
+MIDDLE_NAMES = ['Олександрівна', 'Олексійович', 'Петрівна', 'Іванович', 'Сергіївна', 'Миколайович']
+TOPICS = ['Задача на біноміальні коефіцієнти', 'Розвязати біквадратне рівняння', 'Знайти площу трикутника']
+LETTERS = 'абвгдежзийклмнопрстуфхцчшщюя'
+FIRST_DATE = datetime.date(2001, 1, 1)
+DATES = [f'{i.year};{i.month};{i.day}' for i in (FIRST_DATE + datetime.timedelta(j) for j in range(24 * 365 + 6))]
+DATE_STEP = 365
+STAGES = ('load_ini', 'load', 'fit', 'output')
+BATCH = 1 << 16
+RESULTS = os.path.join(tempfile.gettempdir(), 'benchmark.json')
+
+
+def _letters(number):
+    """
+    :param number: non-negative integer
+    :return: number written with LETTERS (empty for 0), names of students can not contain digits
+    """
+    text = ''
+    while number:
+        number, digit = divmod(number, len(LETTERS))
+        text = LETTERS[digit] + text
+    return text
+
+
+def _student(number):
+    """
+    :param number: number of student
+    :return: name, surname and middle_name of student, different numbers give different students
+    """
+    number, name = divmod(number, len(NAMES))
+    number, surname = divmod(number, len(SURNAMES))
+    return NAMES[name], SURNAMES[surname] + _letters(number), MIDDLE_NAMES[name % len(MIDDLE_NAMES)]
+
+
+def generate(main_file, rows, problems=1000, students=10000, attempts=3, seed=1, good=0.5,
+             input_encoding='utf_8_sig'):
+    """
+    :param main_file: relative path to .csv file, which is created
+    :param rows: quantity of records
+    :param problems: quantity of problems
+    :param students: quantity of students
+    :param attempts: quantity of attempts of every student in every his problem
+    :param seed: seed of random numbers, the same parameters give the same files
+    :param good: part of problems, which get only attempts with 60 points or more (they are printed)
+    :param input_encoding: type of encoding of created files
+    writes main_file, .json file with sum of lengths of surnames and quantity of records and .ini file with
+    the same name (output file gets extension .txt), all records are proper, pairs of problem and student are
+    taken in random order without repeats, dates of attempts of pair are different
+    :return: relative path to created .ini file
+    """
+    pairs = math.ceil(rows / attempts)
+    size = problems * students
+    if pairs > size or attempts > len(DATES):
+        raise ValueError('Too many rows for such quantities of problems, students and attempts')
+    rnd = random.Random(seed)
+    step = rnd.randrange(1, size) if size > 1 else 1
+    while math.gcd(step, size) != 1:
+        step += 1
+    shift = rnd.randrange(size)
+    conds = [f'{TOPICS[i % len(TOPICS)]} {i}' for i in range(problems)]
+    good_problems = [rnd.random() < good for _ in range(problems)]
+    people = [_student(i) for i in range(students)]
+    prefixes = [f'{name};{surname};' for name, surname, middle_name in people]
+    surnames = 0
+    with open(main_file, 'w', encoding=input_encoding) as f:
+        for start in range(0, rows, BATCH):
+            lines = []
+            for i in range(start, min(start + BATCH, rows)):
+                attempt, pair = divmod(i, pairs)
+                pair = (pair * step + shift) % size
+                problem, student = divmod(pair, students)
+                percent = int(rnd.random() * 41) + 60 if good_problems[problem] else int(rnd.random() * 101)
+                date = DATES[(pair + attempt * DATE_STEP) % len(DATES)]
+                lines.append(f'{prefixes[student]}{percent};{people[student][2]};{conds[problem]};{date}\n')
+                surnames += len(people[student][1])
+            f.write(''.join(lines))
+    base = os.path.splitext(main_file)[0]
+    with open(f'{base}.json', 'w', encoding=input_encoding) as f:
+        json.dump({"сума довжин всіх прізвищ": surnames, "кількість записів": rows}, f, ensure_ascii=False)
+    with open(f'{base}.ini', 'w', encoding='utf8') as f:
+        json.dump({'input': {'csv': main_file, 'json': f'{base}.json', 'encoding': input_encoding},
+                   'output': {'fname': f'{base}.txt', 'encoding': 'utf-8'}}, f, indent=4)
+    return f'{base}.ini'
+
+
+def measure(path):
+    """
+    :param path: relative path to .ini file
+    runs stages of program one by one like main.process() (snapshot is not used, so .csv file is always parsed)
+    and measures time of every stage, printed text is hidden
+    :return: dictionary with times of stages (in seconds), quantity of records, speed of loading, result of
+    fit() and peak memory of process
+    """
+    times = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        main_file, additional_file, input_encoding, output_file, output_encoding, options = Loading.load_ini(path)
+        times['load_ini'] = time.perf_counter() - start
+        start = time.perf_counter()
+        data = Loading.new_data(options)
+        Validation.trust(options['trusted'])
+        builder = Builder.Builder(options['workers'], options['parser'], pipeline=options['pipeline'])
+        builder.load(data, main_file, input_encoding)
+        times['load'] = time.perf_counter() - start
+        start = time.perf_counter()
+        fitted = Loading.fit(data, Loading.load_stat(additional_file, input_encoding))
+        times['fit'] = time.perf_counter() - start
+        start = time.perf_counter()
+        data.output(output_file, output_encoding, options['format'], options['pipeline'])
+        times['output'] = time.perf_counter() - start
+    return {'stages': times, 'records': data.records_sum, 'rows_per_second': data.records_sum / times['load'],
+            'fit': fitted, 'peak_memory': Profiling.peak_memory()}
+
+
+def run(paths, repeat=1):
+    """
+    :param paths: list of relative paths to .ini files
+    :param repeat: quantity of measurements of every .ini file
+    measures every .ini file in new process (so peak memory belongs only to this run), the best time of every
+    stage and the biggest peak memory are kept
+    :return: dictionary of results, which can be saved with save() and compared with compare()
+    """
+    cases = []
+    context = multiprocessing.get_context('spawn')
+    for path in paths:
+        runs = []
+        for _ in range(repeat):
+            with ProcessPoolExecutor(1, mp_context=context) as pool:
+                runs.append(pool.submit(measure, path).result())
+        stages = {i: min(j['stages'][i] for j in runs) for i in STAGES}
+        memory = [j['peak_memory'] for j in runs if j['peak_memory'] is not None]
+        cases.append({'ini': path, 'records': runs[0]['records'], 'fit': runs[0]['fit'], 'stages': stages,
+                      'total': sum(stages.values()), 'rows_per_second': runs[0]['records'] / stages['load'],
+                      'peak_memory': max(memory) if memory else None, 'repeat': repeat})
+    return {'created': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(), 'platform': platform.platform(), 'cases': cases}
+
+
+def save(results, path):
+    """
+    :param results: dictionary returned by run()
+    :param path: relative path to .json file with results
+    """
+    with open(path, 'w', encoding='utf8') as f:
+        json.dump(results, f, indent=4, ensure_ascii=False)
+
+
+def compare(old, new, tolerance=0.1):
+    """
+    :param old: dictionary of previous results
+    :param new: dictionary of new results
+    :param tolerance: allowed relative growth of time or memory
+    compares cases with the same .ini file
+    :return: list of regressions -- tuples of .ini file, stage (or 'peak_memory'), old and new value
+    """
+    previous = {i['ini']: i for i in old['cases']}
+    regressions = []
+    for case in new['cases']:
+        found = previous.get(case['ini'])
+        if found is None:
+            continue
+        values = [(i, found['stages'].get(i), case['stages'][i]) for i in STAGES]
+        values.append(('peak_memory', found['peak_memory'], case['peak_memory']))
+        for stage, old_value, new_value in values:
+            if old_value is not None and new_value is not None and new_value > old_value * (1 + tolerance):
+                regressions.append((case['ini'], stage, old_value, new_value))
+    return regressions
+
+
+def _print_case(case):
+    """
+    :param case: dictionary of results of one .ini file
+    prints times of stages, speed of loading and peak memory
+    """
+    stages = '  '.join(f'{i} {case["stages"][i]:.3f}s' for i in STAGES)
+    memory = 'unknown' if case['peak_memory'] is None else f'{case["peak_memory"] / (1 << 20):.1f} MiB'
+    print(f'{case["ini"]}: {stages}  total {case["total"]:.3f}s  {case["rows_per_second"]:.0f} rows/s  '
+          f'peak memory {memory}')
+
+
+if __name__ == '__main__':
+    flags, paths = main.parse_args(sys.argv[1:])
+    command = paths.pop(0) if paths else None
+    if command == 'generate' and len(paths) == 2:
+        print(generate(paths[0], int(paths[1]), int(flags.get('problems', 1000)),
+                       int(flags.get('students', 10000)), int(flags.get('attempts', 3)), int(flags.get('seed', 1)),
+                       float(flags.get('good', 0.5)), flags.get('encoding', 'utf_8_sig')))
+    elif command == 'run' and paths:
+        results = run(paths, int(flags.get('repeat', 1)))
+        for i in results['cases']:
+            _print_case(i)
+        save(results, flags.get('results') or RESULTS)
+        print(f'results {flags.get("results") or RESULTS}: OK')
+    elif command == 'compare' and len(paths) == 2:
+        with open(paths[0], 'r', encoding='utf8') as old, open(paths[1], 'r', encoding='utf8') as new:
+            regressions = compare(json.load(old), json.load(new), float(flags.get('tolerance', 0.1)))
+        for ini, stage, old_value, new_value in regressions:
+            print(f'{ini}: {stage} {old_value:.3f} -> {new_value:.3f}')
+        print('UPS' if regressions else 'OK')
+    else:
+        print('usage: Benchmark.py generate csv_file rows [--problems=] [--students=] [--attempts=] [--seed=] '
+              '[--good=] [--encoding=]\n       Benchmark.py run ini_file ... [--repeat=] [--results=]\n'
+              '       Benchmark.py compare old.json new.json [--tolerance=]')
@@ -1,60 +1,640 @@
-"""
-Module of Shtonda Yelizaveta, contains class Builder
-"""
-import Information
-import Loading
-import json
-import csv
-
-
-class Builder:
-    """
-    contains functions, which open and process main_file, and pass data to object of class Information
-    """
-
-    def load(self, data, main_file, input_encoding):
-        """
-        :param data: instance of the class Information
-        :param main_file: relative path to .csv file
-        :param input_encoding: type of encoding of main_file
-        opens main_file, process it, counts number of records and sum of lengths of surnames in main_file,
-        after processing pass data to class Information
-        """
-        with open(main_file, 'r', encoding=input_encoding) as f, data:
-            r = csv.reader(f, delimiter=';', skipinitialspace=True)
-            records = 0
-            surnames = 0
-            for i in r:
-                line = list(i)
-                if not line:
-                    continue
-                if len(line) != 8:
-                    raise BaseException('Some troubles with csv_file')
-                surnames += self._process_cur_line(line)
-                records += 1
-                data.load(self._name, self._surname, self._points, self._mid_name,
-                          self._cond, self._year, self._month, self._day)
-        data.load_add_inf(records, surnames)
-
-    def _process_cur_line(self, line):
-        """
-        :param line: current line, which was read from main_file
-        :return: result of processing method _convert_fields() -- length of surname
-        """
-        return self._convert_fields(line)
-
-    def _convert_fields(self, line):
-        """
-        :param line: current line, which was read from main_file
-        divides current line into object fields and converts some values to integer
-        :return: surname length of surname from current line
-        """
-        self._name = line[0]
-        self._surname = line[1]
-        self._points = int(line[2])
-        self._mid_name = line[3]
-        self._cond = line[4]
-        self._year = int(line[5])
-        self._month = int(line[6])
-        self._day = int(line[7])
-        return len(self._surname)
+"""
+Module of Shtonda Yelizaveta, contains class Builder
+"""
+import Information
+import Loading
+import Validation
+import Memory
+import Pipeline
+import json
+import csv
+import io
+import os
+import bz2
+import time
+import glob
+import gzip
+import lzma
+import mmap
+import codecs
+import itertools
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+BLOCK_SIZE = 1 << 20
+INTEGERS = {str(i): i for i in range(10000)}
+BATCH_ROWS = 1 << 14
+COMPRESSIONS = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open, '.lzma': lzma.open}
+
+
+def input_files(main_file):
+    """
+    :param main_file: relative path to .csv file, glob pattern (like "exports/*.csv.gz") or list of them
+    finds files of glob patterns (in sorted order), in case of pattern without files raises error
+    :return: list of relative paths to .csv files in order of loading
+    """
+    files = []
+    for pattern in [main_file] if isinstance(main_file, str) else main_file:
+        if not glob.has_magic(pattern):
+            files.append(pattern)
+            continue
+        found = sorted(glob.glob(pattern))
+        if not found:
+            raise FileNotFoundError(f'There are no files {pattern}')
+        files.extend(found)
+    return files
+
+
+def compressed(path):
+    """
+    :param path: relative path to .csv file
+    :return: function, which opens compressed file like open() (chosen by extension of file), None if file is not
+    compressed
+    """
+    return COMPRESSIONS.get(os.path.splitext(path)[1].lower())
+
+
+class Builder:
+    """
+    contains functions, which open and process main_file, and pass data to object of class Information
+    """
+
+    def __init__(self, workers=1, parser='fast', budget=None, quarantine=None, pipeline=None):
+        """
+        :param workers: quantity of processes, which process main_file in parallel
+        :param parser: 'fast' to split lines of main_file by hand, 'csv' to read main_file only with module csv
+        :param budget: the biggest quantity of bytes, which loaded data can use (every worker gets its part),
+        None if memory is not limited
+        :param quarantine: relative path to file for rejected rows, None if the first bad row stops loading
+        :param pipeline: size of queues between stages of pipelined loading, None to load by one thread
+        times of parsing, checking and loading of rows are summed in self.times by stages 'parse', 'validate' and
+        'aggregate' (times of workers are summed too, in pipelined mode parsing includes waiting for read blocks)
+        """
+        self.workers = workers
+        self.parser = parser
+        self.budget = budget
+        self.quarantine = quarantine
+        self.pipeline = pipeline
+        self.rejected = Counter()
+        self.queues = {}
+        self.times = Counter()
+
+    def load(self, data, main_file, input_encoding):
+        """
+        :param data: instance of the class Information or ColumnInformation
+        :param main_file: relative path to .csv file, glob pattern or list of them (files can be compressed)
+        :param input_encoding: type of encoding of main_file
+        opens main_file, process it, counts number of records and sum of lengths of surnames in main_file,
+        after processing pass data to class Information, if there are several workers, main_file is
+        processed in parallel by parts (several files or compressed file are processed by _load_files() method)
+        """
+        files = input_files(main_file)
+        if self.quarantine is not None:
+            return self._load_quarantine(data, files, input_encoding)
+        if self.pipeline is not None:
+            return self._load_pipeline(data, files, input_encoding)
+        if len(files) > 1 or compressed(files[0]) is not None:
+            return self._load_files(data, files, input_encoding)
+        main_file = files[0]
+        if not self._bytes_splittable(input_encoding):
+            self.parser = 'csv'
+        elif self.workers > 1:
+            return self._load_parallel(data, main_file, input_encoding)
+        if self.parser == 'csv':
+            with open(main_file, 'r', encoding=input_encoding) as f, data:
+                records, surnames = self._load_lines(data, f)
+                data.load_add_inf(records, surnames)
+            return
+        with open(main_file, 'rb') as f, data:
+            size = os.fstat(f.fileno()).st_size
+            if size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    records, surnames = self._load_buffer(data, buffer, 0, size, input_encoding)
+            else:
+                records, surnames = 0, 0
+            data.load_add_inf(records, surnames)
+
+    def load_from(self, data, main_file, input_encoding, offset, whole=False):
+        """
+        :param data: instance of the class Information
+        :param main_file: relative path to .csv file, which is appended by other program
+        :param input_encoding: type of encoding of main_file (utf-8 or one-byte encoding)
+        :param offset: quantity of bytes of main_file, which have already been loaded
+        :param whole: True if the last line without new line symbol is complete too
+        loads all complete lines of main_file after offset into data, the last line without new line symbol
+        is left for the next call (it can be written now), data is not cleared in case of error
+        :return: number of loaded records, sum of lengths of their surnames and new offset
+        """
+        with open(main_file, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size <= offset:
+                return 0, 0, offset
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                end = size if whole else buffer.rfind(b'\n', offset, size) + 1
+                if end <= offset:
+                    return 0, 0, offset
+                records, surnames = self._load_buffer(data, buffer, offset, end, input_encoding)
+        return records, surnames, end
+
+    def _load_files(self, data, files, input_encoding):
+        """
+        :param data: instance of the class Information or ColumnInformation
+        :param files: list of relative paths to .csv files
+        :param input_encoding: type of encoding of files
+        loads files one by one into data, or, if there are several workers, processes (decompresses and parses)
+        every file in separate process into empty copy of data and merges them into data in order of files,
+        quantities of records and sums of lengths of surnames of all files are summed
+        """
+        with data:
+            records = 0
+            surnames = 0
+            if self.workers > 1 and len(files) > 1:
+                workers = min(self.workers, len(files))
+                with ProcessPoolExecutor(workers) as pool:
+                    futures = [pool.submit(_load_file, data.copy_empty(), i, input_encoding, self.parser,
+                                           Validation.trusted, self._part_budget(workers)) for i in files]
+                    for future in futures:
+                        part, part_records, part_surnames, part_times = future.result()
+                        data.merge(part)
+                        self._check_memory(data)
+                        records += part_records
+                        surnames += part_surnames
+                        self.times.update(part_times)
+            else:
+                for i in files:
+                    part_records, part_surnames = self._load_file(data, i, input_encoding)
+                    records += part_records
+                    surnames += part_surnames
+            data.load_add_inf(records, surnames)
+
+    def _load_file(self, data, path, input_encoding):
+        """
+        :param data: instance of the class Information or ColumnInformation
+        :param path: relative path to .csv file (it can be compressed)
+        :param input_encoding: type of encoding of file
+        loads one file into data, compressed file is decompressed while it is read (by blocks for fast parser)
+        :return: number of records and sum of lengths of surnames in file
+        """
+        opener = compressed(path)
+        if opener is None and (self.parser == 'csv' or not self._bytes_splittable(input_encoding)):
+            with open(path, 'r', encoding=input_encoding) as f:
+                return self._load_lines(data, f)
+        if opener is None:
+            with open(path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if not size:
+                    return 0, 0
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    return self._load_buffer(data, buffer, 0, size, input_encoding)
+        with opener(path, 'rt', encoding=input_encoding) as f:
+            if self.parser == 'csv':
+                return self._load_lines(data, f)
+            return self._load_blocks(data, self._stream_blocks(f))
+
+    def _load_pipeline(self, data, files, input_encoding):
+        """
+        :param data: instance of the class Information, ColumnInformation or SpillInformation
+        :param files: list of relative paths to .csv files (they can be compressed)
+        :param input_encoding: type of encoding of files
+        loads files by pipeline of stages: thread 'read' reads (and decompresses) blocks of lines, thread 'parse'
+        splits them into rows and converts fields, this thread checks and aggregates batches of rows; stages are
+        connected by bounded queues, so reading and parsing of next blocks overlaps with aggregation, and their
+        depth shows the slowest stage (module Pipeline, statistics of queues are kept in self.queues), memory of data
+        is checked after every batch
+        """
+        with data, Pipeline.Pipeline(self.pipeline) as pipeline:
+            blocks = pipeline.stage('read', self._read_blocks(files, input_encoding))
+            batches = pipeline.stage('parse', self._parse_batches(blocks))
+            records = 0
+            surnames = 0
+            for batch in batches:
+                part_records, part_surnames = data.load_many(batch, self.times)
+                records += part_records
+                surnames += part_surnames
+                self._check_memory(data)
+            data.load_add_inf(records, surnames)
+        self.queues = pipeline.info()
+
+    def _read_blocks(self, files, input_encoding):
+        """
+        :param files: list of relative paths to .csv files (they can be compressed)
+        :param input_encoding: type of encoding of files
+        reads files one by one in text mode (compressed files are decompressed)
+        :return: generator of blocks of lines without the last new line symbol
+        """
+        for path in files:
+            with (compressed(path) or open)(path, 'rt', encoding=input_encoding) as f:
+                yield from self._stream_blocks(f)
+
+    def _parse_batches(self, blocks):
+        """
+        :param blocks: iterator of decoded blocks of lines without the last new line symbol
+        splits lines into fields (by hand or with module csv, like chosen parser, new line symbols are given back to
+        lines for module csv, because quoted field can contain them) and converts them, if line with wrong format is
+        found, batch of rows before it is given before error is raised
+        :return: generator of batches of BATCH_ROWS converted rows
+        """
+        if self.parser == 'csv':
+            rows = self._csv_rows(line + '\n' for text in blocks for line in text.split('\n'))
+        else:
+            rows = self._block_rows(blocks)
+        while True:
+            batch = []
+            start = time.perf_counter()
+            try:
+                batch.extend(itertools.islice(rows, BATCH_ROWS))
+            except BaseException:
+                yield batch
+                raise
+            self.times['parse'] += time.perf_counter() - start
+            if not batch:
+                return
+            yield batch
+
+    def _load_quarantine(self, data, files, input_encoding):
+        """
+        :param data: instance of the class Information (other backends find repeated attempts only after loading)
+        :param files: list of relative paths to .csv files (they can be compressed)
+        :param input_encoding: type of encoding of files (utf-8 or one-byte encoding)
+        loads files one by one like _load_files(), but row with wrong format, improper field or repeated attempt
+        does not stop loading: it is written to quarantine file and counted in self.rejected by reasons, rejected
+        rows are counted in number of records and sum of lengths of surnames too (like in .json file)
+        """
+        if not isinstance(data, Information.Information):
+            raise ValueError('Quarantine works only with backend "objects"')
+        if not self._bytes_splittable(input_encoding):
+            raise ValueError('Quarantine works only with utf-8 and one-byte encodings')
+        self.rejected.clear()
+        with data, open(self.quarantine, 'w', encoding='utf-8') as rejects:
+            records = 0
+            surnames = 0
+            for path in files:
+                with (compressed(path) or open)(path, 'rb') as f:
+                    part_records, part_surnames = self._load_checked(data, path, f, input_encoding, rejects)
+                records += part_records
+                surnames += part_surnames
+            data.load_add_inf(records, surnames)
+
+    def _load_checked(self, data, path, f, input_encoding, rejects):
+        """
+        :param data: instance of the class Information
+        :param path: relative path to .csv file (for quarantine file)
+        :param f: file object opened in binary mode (for example, decompressing file)
+        :param input_encoding: type of encoding of file
+        :param rejects: quarantine file opened for writing
+        reads lines of file one by one (line with odd quantity of quotes is continued by the next lines), every
+        row is checked before it is loaded, so rejected row does not change data, for rejected row line of json
+        with path, number of its first line, offset of its first byte (in decompressed file), reason and text is
+        written to rejects, memory of data is checked after every BATCH_ROWS records and at the end of file, times
+        of parsing, checking and loading of rows are added to self.times
+        :return: number of records and sum of lengths of surnames in file
+        """
+        sig = codecs.lookup(input_encoding).name == 'utf-8-sig'
+        records = 0
+        surnames = 0
+        number = 0
+        offset = 0
+        begin = time.perf_counter()
+        validate = 0.0
+        aggregate = 0.0
+        lines = iter(f)
+        for raw in lines:
+            number += 1
+            first, start = number, offset
+            offset += len(raw)
+            while raw.count(b'"') % 2:
+                line = next(lines, None)
+                if line is None:
+                    break
+                number += 1
+                offset += len(line)
+                raw += line
+            try:
+                text = raw.decode('utf-8' if sig and start else input_encoding)
+            except ValueError as e:
+                text = raw.decode(input_encoding, 'backslashreplace').rstrip('\r\n')
+                self._reject(rejects, path, first, start, str(e), text)
+                records += 1
+                continue
+            text = text.rstrip('\r\n')
+            if not text:
+                continue
+            records += 1
+            try:
+                if '"' in text:
+                    line = next(csv.reader(io.StringIO(text, newline=None), delimiter=';', skipinitialspace=True))
+                else:
+                    line = [i.lstrip(' ') for i in text.split(';')]
+                surnames += len(line[1]) if len(line) > 1 else 0
+                if len(line) != 8:
+                    raise ValueError('Some troubles with csv_file')
+                row = self._convert_fields(line)
+                checked = time.perf_counter()
+                Validation.check_row(row)
+                loaded = time.perf_counter()
+                validate += loaded - checked
+                data.load(*row)
+                aggregate += time.perf_counter() - loaded
+            except (ValueError, csv.Error) as e:
+                self._reject(rejects, path, first, start, str(e), text)
+            if records % BATCH_ROWS == 0:
+                self._check_memory(data)
+        self._check_memory(data)
+        self.times['parse'] += time.perf_counter() - begin - validate - aggregate
+        self.times['validate'] += validate
+        self.times['aggregate'] += aggregate
+        return records, surnames
+
+    def _reject(self, rejects, path, line, offset, reason, text):
+        """
+        :param rejects: quarantine file opened for writing
+        :param path: relative path to .csv file
+        :param line: number of the first line of rejected row
+        :param offset: offset of the first byte of rejected row
+        :param reason: text of error
+        :param text: text of rejected row
+        writes rejected row to quarantine file and counts its reason
+        """
+        self.rejected[reason] += 1
+        record = {'file': path, 'line': line, 'offset': offset, 'reason': reason, 'row': text}
+        rejects.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    def _load_lines(self, data, f):
+        """
+        :param data: instance of the class Information or ColumnInformation
+        :param f: opened file object or other iterable of lines of .csv file
+        process lines and pass their data to data
+        :return: number of records and sum of lengths of surnames in these lines
+        """
+        return self._load_rows(data, self._csv_rows(f))
+
+    def _csv_rows(self, f):
+        """
+        :param f: opened file object or other iterable of lines of .csv file
+        reads lines with module csv
+        :return: generator of converted rows
+        """
+        r = csv.reader(f, delimiter=';', skipinitialspace=True)
+        for line in r:
+            if not line:
+                continue
+            if len(line) != 8:
+                raise BaseException('Some troubles with csv_file')
+            yield self._convert_fields(line)
+
+    def _load_rows(self, data, rows):
+        """
+        :param data: instance of the class Information or ColumnInformation
+        :param rows: iterator of converted rows
+        passes rows to method load_many() of data by batches of BATCH_ROWS rows, if line with wrong format is
+        found, rows before it are loaded before error is raised (like when rows are loaded one by one),
+        memory of data is checked after every batch, times of parsing, checking and loading of batches are added
+        to self.times
+        :return: number of records and sum of lengths of surnames in these rows
+        """
+        records = 0
+        surnames = 0
+        while True:
+            batch = []
+            start = time.perf_counter()
+            try:
+                for row in rows:
+                    batch.append(row)
+                    if len(batch) == BATCH_ROWS:
+                        break
+            except BaseException:
+                data.load_many(batch)
+                raise
+            self.times['parse'] += time.perf_counter() - start
+            if not batch:
+                return records, surnames
+            part_records, part_surnames = data.load_many(batch, self.times)
+            records += part_records
+            surnames += part_surnames
+            self._check_memory(data)
+
+    def _check_memory(self, data):
+        """
+        :param data: instance of the class Information or ColumnInformation
+        if there is budget, checks that data does not need more memory, otherwise raises error
+        """
+        if self.budget is not None:
+            Memory.check(data, self.budget)
+
+    def _part_budget(self, workers):
+        """
+        :param workers: quantity of processes, which load parts of data
+        :return: budget of one process, None if memory is not limited
+        """
+        return None if self.budget is None else self.budget // workers
+
+    def _load_buffer(self, data, buffer, start, end, input_encoding):
+        """
+        :param data: instance of the class Information or ColumnInformation
+        :param buffer: bytes of .csv file (memory-mapped file)
+        :param start: first byte of processed part of buffer
+        :param end: byte after the last byte of processed part of buffer
+        :param input_encoding: type of encoding of main_file
+        splits lines of every block into fields by hand, after the first block with quotes lines with quotes
+        are processed with module csv (quoted field can contain new line)
+        :return: number of records and sum of lengths of surnames in these lines
+        """
+        return self._load_blocks(data, self._blocks(buffer, start, end, input_encoding))
+
+    def _load_blocks(self, data, blocks):
+        """
+        :param data: instance of the class Information or ColumnInformation
+        :param blocks: iterator of decoded blocks of lines without the last new line symbol
+        splits lines of every block into fields by hand, after the first block with quotes lines with quotes
+        are processed with module csv (quoted field can contain new line)
+        :return: number of records and sum of lengths of surnames in these lines
+        """
+        return self._load_rows(data, self._block_rows(blocks))
+
+    def _block_rows(self, blocks):
+        """
+        :param blocks: iterator of decoded blocks of lines without the last new line symbol
+        splits lines of every block into fields by hand, after the first block with quotes lines with quotes
+        are processed with module csv (quoted field can contain new line)
+        :return: generator of converted rows
+        """
+        for text in blocks:
+            if '"' in text:
+                lines = itertools.chain(text.split('\n'), itertools.chain.from_iterable(i.split('\n') for i in blocks))
+                yield from self._split_rows(lines, True, True)
+            else:
+                spaced = '; ' in text or '\n ' in text or text.startswith(' ')
+                yield from self._split_rows(text.split('\n'), False, spaced)
+
+    def _split_rows(self, lines, quoted, spaced):
+        """
+        :param lines: iterable of lines of .csv file without new line symbols
+        :param quoted: True if lines can contain quotes
+        :param spaced: True if fields can start with spaces
+        splits lines into fields by hand, lines with quotes are processed with module csv
+        :return: generator of converted rows
+        """
+        for text in lines:
+            if quoted and '"' in text:
+                rest = itertools.chain([text], lines)
+                line = next(csv.reader((i + '\n' for i in rest), delimiter=';', skipinitialspace=True))
+            elif not text:
+                continue
+            else:
+                line = text.split(';')
+                if spaced:
+                    line = [i.lstrip(' ') for i in line]
+            if len(line) != 8:
+                raise BaseException('Some troubles with csv_file')
+            yield self._convert_fields(line)
+
+    @staticmethod
+    def _blocks(buffer, start, end, input_encoding):
+        """
+        :param buffer: bytes of .csv file (memory-mapped file)
+        :param start: first byte of processed part of buffer
+        :param end: byte after the last byte of processed part of buffer
+        :param input_encoding: type of encoding of main_file
+        decodes buffer by blocks, which end at the end of line, new lines are translated like in text mode
+        (byte order mark is expected only at the start of file)
+        :return: generator of decoded blocks
+        """
+        sig = codecs.lookup(input_encoding).name == 'utf-8-sig'
+        while start < end:
+            stop = buffer.find(b'\n', min(start + BLOCK_SIZE, end) - 1, end)
+            stop = end if stop == -1 else stop + 1
+            text = buffer[start:stop].decode('utf-8' if sig and start else input_encoding)
+            if '\r' in text:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            if text.endswith('\n'):
+                text = text[:-1]
+            yield text
+            start = stop
+
+    def _load_parallel(self, data, main_file, input_encoding):
+        """
+        :param data: instance of the class Information or ColumnInformation
+        :param main_file: relative path to .csv file
+        :param input_encoding: type of encoding of main_file
+        divides main_file into parts by lines, processes every part in separate process into empty copy of data,
+        merges these parts into data in order of parts
+        """
+        with data, ProcessPoolExecutor(self.workers) as pool:
+            futures = [pool.submit(_load_part, data.copy_empty(), main_file, input_encoding, start, end, self.parser,
+                                   Validation.trusted, self._part_budget(self.workers))
+                       for start, end in self._parts(main_file, self.workers)]
+            records = 0
+            surnames = 0
+            for future in futures:
+                part, part_records, part_surnames, part_times = future.result()
+                data.merge(part)
+                self._check_memory(data)
+                records += part_records
+                surnames += part_surnames
+                self.times.update(part_times)
+            data.load_add_inf(records, surnames)
+
+    @staticmethod
+    def _stream_blocks(f):
+        """
+        :param f: file object opened in text mode (for example, decompressing file)
+        reads f by blocks of BLOCK_SIZE symbols, which are cut at the end of line
+        :return: generator of blocks without the last new line symbol
+        """
+        rest = ''
+        while True:
+            text = f.read(BLOCK_SIZE)
+            if not text:
+                break
+            text = rest + text
+            stop = text.rfind('\n') + 1
+            rest = text[stop:]
+            if stop:
+                yield text[:stop - 1]
+        if rest:
+            yield rest
+
+    @staticmethod
+    def _parts(main_file, quantity):
+        """
+        :param main_file: relative path to .csv file
+        :param quantity: quantity of parts
+        divides main_file into parts of nearly equal size, every part ends at the end of line
+        :return: list of pairs of first byte of part and byte after its last byte
+        """
+        size = os.path.getsize(main_file)
+        bounds = [0]
+        with open(main_file, 'rb') as f:
+            for i in range(1, quantity):
+                f.seek(max(size * i // quantity, bounds[-1]))
+                f.readline()
+                bounds.append(min(f.tell(), size))
+        bounds.append(size)
+        return [(bounds[i], bounds[i + 1]) for i in range(quantity) if bounds[i] < bounds[i + 1]]
+
+    @staticmethod
+    def _bytes_splittable(input_encoding):
+        """
+        :param input_encoding: type of encoding of main_file
+        :return: True if in this encoding symbols ';', '"' and new line are separate bytes, which are never parts
+        of other symbols (utf-8 and one-byte encodings), so file can be divided by bytes
+        """
+        name = codecs.lookup(input_encoding).name
+        return name in ('utf-8', 'utf-8-sig') or len(bytes(range(256)).decode(name, 'replace')) == 256
+
+    @staticmethod
+    def _convert_fields(line):
+        """
+        :param line: fields of current line, which was read from main_file
+        converts some values to integer (usual values are taken from dictionary INTEGERS, which is faster than int())
+        and orders fields like parameters of method Information.load()
+        :return: tuple of name, surname, points, middle_name, condition, year, month and day
+        """
+        name, surname, points, mid_name, cond, year, month, day = line
+        return (name, surname, INTEGERS.get(points) or int(points), mid_name, cond,
+                INTEGERS.get(year) or int(year), INTEGERS.get(month) or int(month), INTEGERS.get(day) or int(day))
+
+
+def _load_file(data, path, input_encoding, parser, trusted, budget=None):
+    """
+    :param data: empty instance of the class Information or ColumnInformation
+    :param path: relative path to .csv file (it can be compressed)
+    :param input_encoding: type of encoding of file
+    :param parser: 'fast' or 'csv', like in class Builder
+    :param trusted: True if fields are not checked
+    :param budget: the biggest quantity of bytes, which data of this process can use, None if it is not limited
+    decompresses and processes one of files in separate process
+    :return: data with loaded file, number of records, sum of lengths of surnames in this file and times of stages
+    of loading
+    """
+    Validation.trust(trusted)
+    builder = Builder(1, parser, budget)
+    records, surnames = builder._load_file(data, path, input_encoding)
+    return data, records, surnames, builder.times
+
+
+def _load_part(data, main_file, input_encoding, start, end, parser, trusted, budget=None):
+    """
+    :param data: empty instance of the class Information or ColumnInformation
+    :param main_file: relative path to .csv file
+    :param input_encoding: type of encoding of main_file
+    :param start: first byte of part of main_file
+    :param end: byte after the last byte of part of main_file
+    :param parser: 'fast' or 'csv', like in class Builder
+    :param trusted: True if fields are not checked
+    :param budget: the biggest quantity of bytes, which data of this process can use, None if it is not limited
+    processes part of main_file in separate process, byte order mark is expected only at the start of file
+    :return: data with loaded part, number of records, sum of lengths of surnames in this part and times of stages
+    of loading
+    """
+    Validation.trust(trusted)
+    builder = Builder(budget=budget)
+    with open(main_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        if parser == 'fast':
+            records, surnames = builder._load_buffer(data, buffer, start, end, input_encoding)
+        else:
+            if start and codecs.lookup(input_encoding).name == 'utf-8-sig':
+                input_encoding = 'utf-8'
+            text = buffer[start:end].decode(input_encoding)
+            records, surnames = builder._load_lines(data, io.StringIO(text, newline=None))
+    return data, records, surnames, builder.times
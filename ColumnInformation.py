@@ -0,0 +1,455 @@
+"""
+Module of Shtonda Yelizaveta, contains class ColumnInformation for storing data from .csv file in columns
+"""
+import sys
+import time
+from itertools import compress
+from collections import Counter
+from array import array
+import Information
+import NumpyEngine
+import Validation
+import Writers
+import Scores
+import Periods
+import Memory
+
+
+class ColumnInformation:
+    """
+    stores information from .csv file in parallel typed columns instead of tree of objects,
+    has the same interface as class Information
+    """
+    _Student = Information.Information._Problem._Student
+
+    def __init__(self, engine='python'):
+        """
+        :param engine: 'python' or 'numpy' -- way of calculating statistics in report() method
+        creates empty columns of attempts, empty dictionaries of problems and students codes,
+        creates fields according to .json file
+        """
+        if engine == 'numpy' and not NumpyEngine.available():
+            raise ValueError('numpy is needed for engine "numpy"')
+        self.engine = engine
+        self.clear()
+
+    def clear(self):
+        """
+        clears ColumnInformation object -- columns of attempts, problems, students, quantities of loaded records
+        and lengths of surnames and cached histograms and counters of months
+        """
+        self.records_sum = 0
+        self.surnames_length = 0
+        self.problems = []
+        self.problems_names = {}
+        self.students = []
+        self.students_names = {}
+        self.attemptes_num = array('I')
+        self.good_attemptes_num = array('I')
+        self.problem_codes = array('I')
+        self.student_codes = array('I')
+        self.percents = array('H')
+        self.years = array('H')
+        self.months = array('B')
+        self.days = array('B')
+        self._scores = None
+        self._periods = None
+
+    def copy_empty(self):
+        """
+        :return: empty ColumnInformation object with the same engine
+        """
+        return ColumnInformation(self.engine)
+
+    def merge(self, other):
+        """
+        :param other: ColumnInformation object, loaded from next part of .csv file
+        appends columns of other to columns of this object, changing codes of problems and students to codes of
+        this object, repeated attempts are found later in load_add_inf() method
+        """
+        problems = [self._find_problem(cond, False) for cond in other.problems]
+        students = [self._find_student(name, surname, middle_name, False)
+                    for name, surname, middle_name in other.students]
+        self.problem_codes.extend(array('I', [problems[i] for i in other.problem_codes]))
+        self.student_codes.extend(array('I', [students[i] for i in other.student_codes]))
+        self.percents.extend(other.percents)
+        self.years.extend(other.years)
+        self.months.extend(other.months)
+        self.days.extend(other.days)
+        for i, code in enumerate(problems):
+            self.attemptes_num[code] += other.attemptes_num[i]
+            self.good_attemptes_num[code] += other.good_attemptes_num[i]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        :param exc_type: error class
+        :param exc_val: error instance
+        :param exc_tb: trace object
+        in case of some error during processing .csv file clears ColumnInformation object
+        """
+        if exc_type is not None:
+            self.clear()
+
+    def load_add_inf(self, record_sum, surnames_sum):
+        """
+        :param record_sum: quantity of records in .csv file
+        :param surnames_sum: sum of lengths of surnames in .csv file
+        checks that there are no repeated attempts (it is done once after loading, so columns do not need
+        index of all dates), update data in ColumnInformation object
+        """
+        for i in self._problems_attempts():
+            dates = set()
+            for j in i:
+                key = (self.student_codes[j], self.years[j], self.months[j], self.days[j])
+                if key in dates:
+                    raise ValueError('Attempt has already been added')
+                dates.add(key)
+        self.records_sum = record_sum
+        self.surnames_length = surnames_sum
+
+    def counters(self):
+        """
+        :return: dictionary of quantities of records, problems and students
+        """
+        return {'rows': self.records_sum, 'problems': len(self.problems), 'students': len(self.students)}
+
+    def memory(self):
+        """
+        counts sizes of columns and approximate sizes of other structures (strings of names are not counted)
+        :return: dictionary of sizes (in bytes) of problems (conditions and counters), students, attempts (columns)
+        and indexes (dictionaries of codes of problems and students)
+        """
+        columns = (self.problem_codes, self.student_codes, self.percents, self.years, self.months, self.days)
+        return {'problems': sys.getsizeof(self.problems) + sum(map(sys.getsizeof, self.problems)) +
+                sys.getsizeof(self.attemptes_num) + sys.getsizeof(self.good_attemptes_num),
+                'students': sys.getsizeof(self.students) + len(self.students) * Memory.NAMES,
+                'attempts': sum(map(sys.getsizeof, columns)),
+                'indexes': sys.getsizeof(self.problems_names) + sys.getsizeof(self.students_names)}
+
+    def problem_counts(self, cond):
+        """
+        :param cond: condition of problem
+        :return: None if there is no problem, otherwise quantity of attempts, quantity of good attempts and
+        percentage of good attempts of problem
+        """
+        found = self.problems_names.get(cond)
+        if found is None:
+            return None
+        attemptes_num = self.attemptes_num[found]
+        good_attemptes_num = self.good_attemptes_num[found]
+        return attemptes_num, good_attemptes_num, round((good_attemptes_num / attemptes_num) * 100)
+
+    def student_attempts(self, name, surname, middle_name):
+        """
+        :param name: name of student
+        :param surname: surname of student
+        :param middle_name: middle_name of student
+        :return: list of attempts of student -- tuples of condition, year, month, day and points, in order of
+        problems, attempts of problem are sorted like in output
+        """
+        code = self.students_names.get((name, surname, middle_name))
+        if code is None:
+            return []
+        attempts = list(compress(range(len(self.student_codes)), map(code.__eq__, self.student_codes)))
+        attempts.sort(key=lambda j: (self.problem_codes[j], -self.percents[j], self.years[j]))
+        return [(self.problems[self.problem_codes[j]], self.years[j], self.months[j], self.days[j], self.percents[j])
+                for j in attempts]
+
+    def problem_scores(self, cond):
+        """
+        :param cond: condition of problem
+        :return: None if there is no problem, otherwise histogram of points of all attempts of problem
+        """
+        found = self.problems_names.get(cond)
+        return None if found is None else self._histograms()[0][found]
+
+    def student_scores(self, name, surname, middle_name):
+        """
+        :param name: name of student
+        :param surname: surname of student
+        :param middle_name: middle_name of student
+        :return: None if there is no student, otherwise histogram of points of all attempts of student in all problems
+        """
+        found = self.students_names.get((name, surname, middle_name))
+        return None if found is None else self._histograms()[1][found]
+
+    def passing_problems(self, threshold=Scores.PASS, part=Scores.MAX_PERCENT):
+        """
+        :param threshold: points, which attempt has to reach to pass
+        :param part: percent of attempts, which have to pass
+        :return: list of conditions of problems, where at least part percent of attempts have threshold points or
+        more (with default values these are problems of output)
+        """
+        Scores.check_threshold(threshold)
+        Scores.check_threshold(part)
+        return [cond for cond, scores in zip(self.problems, self._histograms()[0]) if scores.passes(threshold, part)]
+
+    def problem_periods(self, cond):
+        """
+        :param cond: condition of problem
+        :return: None if there is no problem, otherwise counters of attempts of problem by months
+        """
+        found = self.problems_names.get(cond)
+        return None if found is None else self._months()[found]
+
+    def period_report(self, start=None, end=None):
+        """
+        :param start: the first month of range -- pair of year and month, None if range has no beginning
+        :param end: the last month of range -- pair of year and month, None if range has no end
+        sums counters of months of every problem, attempts are not scanned after the first query
+        :return: list of tuples of condition, quantity of attempts, quantity of good attempts and percentage of
+        good attempts in range for problems with attempts in range, in order of problems
+        """
+        Periods.bounds(start, end)
+        report = []
+        for cond, periods in zip(self.problems, self._months()):
+            counts = periods.counts(start, end)
+            if counts[0]:
+                report.append((cond,) + counts)
+        return report
+
+    def _months(self):
+        """
+        counters of months are counted in one pass over columns at the first query and kept until new attempts
+        are loaded, like histograms
+        :return: list of counters of attempts of problems by months
+        """
+        cached = self._periods
+        if cached is not None and cached[0] == len(self.percents):
+            return cached[1]
+        problems = [Periods.Periods() for _ in self.problems]
+        for problem, year, month, percent in zip(self.problem_codes, self.years, self.months, self.percents):
+            problems[problem].add(year, month, percent)
+        self._periods = (len(self.percents), problems)
+        return problems
+
+    def _histograms(self):
+        """
+        columns do not keep histograms during loading, they are counted in one pass over columns at the first query
+        and kept until new attempts are loaded
+        :return: lists of histograms of points of problems and of students
+        """
+        cached = self._scores
+        if cached is not None and cached[0] == len(self.percents):
+            return cached[1], cached[2]
+        problems = [Scores.Histogram() for _ in self.problems]
+        students = [Scores.Histogram() for _ in self.students]
+        for problem, student, percent in zip(self.problem_codes, self.student_codes, self.percents):
+            problems[problem].add(percent)
+            students[student].add(percent)
+        self._scores = (len(self.percents), problems, students)
+        return problems, students
+
+    def output(self, output_file, output_encoding, output_format='tsv', pipeline=None):
+        """
+        :param output_file: relative path to file where information is outputed
+        :param output_encoding: type of encoding of file where information is outputed
+        :param output_format: 'tsv', 'jsonl' or 'binary' -- format of output_file
+        :param pipeline: size of queue of thread, which writes output_file, None to write it by the same thread
+        opens writer of chosen format, calls report() method, and prints 'OK' if there are no errors
+        :return: statistics of queue of thread, which wrote output_file (empty dictionary without pipeline)
+        """
+        print(f'output {output_file}: ', end='')
+        with Writers.open_writer(output_file, output_encoding, output_format, pipeline) as writer:
+            self.report(writer)
+        print('OK')
+        return writer.queues()
+
+    def report(self, writer):
+        """
+        :param writer: writer of some format from module Writers
+        iterates on problems and passes sorted information about all attempts of every needed problem to writer
+        """
+        if self.engine == 'numpy':
+            return NumpyEngine.report(self, writer)
+        ranks = self._students_ranks()
+        for i, attempts in enumerate(self._problems_attempts()):
+            attemptes_num = self.attemptes_num[i]
+            good_attemptes_num = self.good_attemptes_num[i]
+            if attemptes_num != good_attemptes_num:
+                continue
+            percentage = round((good_attemptes_num / attemptes_num) * 100)
+            attempts.sort(key=lambda j: (ranks[self.student_codes[j]], -self.percents[j], self.years[j]))
+            students = []
+            codes = []
+            previous = None
+            for j in attempts:
+                if self.student_codes[j] != previous:
+                    previous = self.student_codes[j]
+                    students.append(self.students[previous])
+                codes.append(len(students) - 1)
+            writer.problem(self.problems[i], attemptes_num, good_attemptes_num, percentage, students, codes,
+                           [self.years[j] for j in attempts], [self.percents[j] for j in attempts])
+
+    def _problems_attempts(self):
+        """
+        groups numbers of attempts by problems keeping order of their loading
+        :return: list of lists of attempts numbers for every problem
+        """
+        attempts = [[] for _ in self.problems]
+        for j, i in enumerate(self.problem_codes):
+            attempts[i].append(j)
+        return attempts
+
+    def _students_ranks(self):
+        """
+        :return: list of places of every student in list of students, sorted by surname, name and middle_name
+        """
+        order = sorted(range(len(self.students)),
+                       key=lambda j: (self.students[j][1], self.students[j][0], self.students[j][2]))
+        ranks = [0] * len(order)
+        for place, j in enumerate(order):
+            ranks[j] = place
+        return ranks
+
+    def load(self, name: str, surname: str, percent: int, middle_name: str, cond: str, year: int, month: int, day: int):
+        """
+        :param name: name of student
+        :param surname: surname of student
+        :param percent: point for attempt
+        :param middle_name: middle_name of student
+        :param cond: condition of problem
+        :param year: year of attempt
+        :param month: month of attempt
+        :param day: day of attempt
+        checks all fields of row before data is changed (so improper row does not leave problem or student
+        without attempts), finds or creates codes of problem and student and appends attempt to columns
+        """
+        Validation.check_row((name, surname, percent, middle_name, cond, year, month, day))
+        problem = self._find_problem(cond, False)
+        student = self._find_student(name, surname, middle_name, False)
+        self.problem_codes.append(problem)
+        self.student_codes.append(student)
+        self.percents.append(percent)
+        self.years.append(year)
+        self.months.append(month)
+        self.days.append(day)
+        self.attemptes_num[problem] += 1
+        if self._Student.good_attempt(percent):
+            self.good_attemptes_num[problem] += 1
+
+    def load_many(self, rows, times=None):
+        """
+        :param rows: iterable of rows -- tuples of fields in order of parameters of load() method (column batches
+        can be passed as zip(*columns))
+        checks columns of all rows at once (and rows one by one only if some field is improper), finds codes of
+        problems and students of proper rows without checks and appends columns at once, the first improper row is
+        loaded by load() method, which raises the same error as loading row by row, adds quantity of rows and sum
+        of lengths of surnames to fields records_sum and surnames_length
+        :param times: dictionary of times of stages, time of checks of rows is added to key 'validate' and time
+        of their loading to key 'aggregate' (None if time is not measured)
+        :return: quantity of rows and sum of lengths of their surnames
+        """
+        if not isinstance(rows, list):
+            rows = list(rows)
+        if not rows:
+            return 0, 0
+        columns = list(zip(*rows))
+        surnames = sum(map(len, columns[1]))
+        checked = time.perf_counter()
+        wrong = len(rows) if Validation.good_columns(*columns) else Validation.first_wrong_row(rows)
+        loaded = time.perf_counter()
+        start = 0
+        while True:
+            if start == 0 and wrong == len(rows):
+                self._append(*columns)
+            elif start < wrong:
+                self._append(*zip(*rows[start:wrong]))
+            if wrong == len(rows):
+                break
+            self.load(*rows[wrong])
+            start = wrong + 1
+            wrong = Validation.first_wrong_row(rows, start)
+        self.records_sum += len(rows)
+        self.surnames_length += surnames
+        if times is not None:
+            times['validate'] += loaded - checked
+            times['aggregate'] += time.perf_counter() - loaded
+        return len(rows), surnames
+
+    def _append(self, names, surnames, percents, middle_names, conds, years, months, days):
+        """
+        :param names: column of names of checked rows
+        :param surnames: column of surnames
+        :param percents: column of points
+        :param middle_names: column of middle_names
+        :param conds: column of conditions
+        :param years: column of years
+        :param months: column of months
+        :param days: column of days
+        finds codes of problems and students (new ones are added without checks) and appends all columns,
+        counts attempts and good attempts of problems
+        """
+        problems_names = self.problems_names
+        students_names = self.students_names
+        find_problem = self._find_problem
+        find_student = self._find_student
+        problem_codes = [problems_names[i] if i in problems_names else find_problem(i, False) for i in conds]
+        student_codes = [students_names[i] if i in students_names else find_student(*i, False)
+                         for i in zip(names, surnames, middle_names)]
+        self.problem_codes.extend(array('I', problem_codes))
+        self.student_codes.extend(array('I', student_codes))
+        self.percents.extend(array('H', percents))
+        self.years.extend(array('H', years))
+        self.months.extend(array('B', months))
+        self.days.extend(array('B', days))
+        good_attempt = self._Student.good_attempt
+        for code, quantity in Counter(problem_codes).items():
+            self.attemptes_num[code] += quantity
+        for code, quantity in Counter(compress(problem_codes, [good_attempt(i) for i in percents])).items():
+            self.good_attemptes_num[code] += quantity
+
+    @classmethod
+    def from_records(cls, rows, engine='python'):
+        """
+        :param rows: iterable of rows like in load_many() method
+        :param engine: way of calculating statistics like in constructor
+        :return: new ColumnInformation object with loaded rows
+        """
+        data = cls(engine)
+        data.load_many(rows)
+        return data
+
+    def _find_problem(self, cond, check=True):
+        """
+        :param cond: condition of problem
+        :param check: False if condition has already been checked
+        finds code of problem, if there is not such a problem, checks condition and adds it
+        :return: code of problem
+        """
+        found = self.problems_names.get(cond)
+        if found is None:
+            if check:
+                Validation.check_cond(cond)
+            found = len(self.problems)
+            cond = sys.intern(cond)
+            self.problems_names[cond] = found
+            self.problems.append(cond)
+            self.attemptes_num.append(0)
+            self.good_attemptes_num.append(0)
+        return found
+
+    def _find_student(self, name, surname, middle_name, check=True):
+        """
+        :param name: name of student
+        :param surname: surname of student
+        :param middle_name: middle_name of student
+        :param check: False if names have already been checked
+        finds code of student, if there is not such a student, checks his names and adds him
+        :return: code of student
+        """
+        names = (name, surname, middle_name)
+        found = self.students_names.get(names)
+        if found is None:
+            if check:
+                Validation.check_name(name, 26)
+                Validation.check_name(surname, 25)
+                Validation.check_name(middle_name, 30)
+            found = len(self.students)
+            names = (sys.intern(name), sys.intern(surname), sys.intern(middle_name))
+            self.students_names[names] = found
+            self.students.append(names)
+        return found
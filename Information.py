@@ -1,460 +1,853 @@
-"""
-Module of Shtonda Yelizaveta, contains class Information for storing data from .csv file
-"""
-import re
-from datetime import date
-
-
-class Information:
-    """
-    stores information from .csv file, contains nested class _Problem,
-    stores list of _Problem objects and list of problems names
-    """
-
-    def __init__(self):
-        """
-        creates empty lists of _Problem objects, problems names, creates fields according to .json file
-        """
-        self.problems = []
-        self.problems_names = []
-        self.records_sum = 0
-        self.surnames_length = 0
-
-    def clear(self):
-        """
-        clears Information object -- lists of _Problem objects and problems names
-        """
-        self.problems = []
-        self.problems_names = []
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """
-        :param exc_type: error class
-        :param exc_val: error instance
-        :param exc_tb: trace object
-        in case of some error during processing .csv file clears Information object
-        """
-        if exc_type is not None:
-            self.clear()
-
-    def load_add_inf(self, record_sum, surnames_sum):
-        """
-        :param record_sum: quantity of records in .csv file
-        :param surnames_sum: sum of lengths of surnames in .csv file
-        update data in Information object
-        """
-        self.records_sum = record_sum
-        self.surnames_length = surnames_sum
-
-    def output(self, output_file, output_encoding):
-        """
-        :param output_file: relative path to file where information is outputed
-        :param output_encoding: type of encoding of file where information is outputed
-        opens file for outputing, calls _output() method, and prints 'OK' if there are no errors
-        """
-        print(f'output {output_file}: ', end='')
-        with open(output_file, 'w', encoding=output_encoding) as f:
-            self._output(f)
-        print('OK')
-
-    def _output(self, f):
-        """
-        :param f: opened file object
-        iterates on _Problem objects and prints sorted information about all attempts of every needed problem
-        """
-        for i in self.problems:
-            if i.good_problem():
-                f.write(f'{i.cond}\t{i.attemptes_num}\t{i.good_attemptes_num}\t{i.good_attempt_percentage}\n')
-                unsorted = []
-                for j in i.students:
-                    unsorted.append([j, j.surname, j.name, j.middle_name])
-                unsorted.sort(key=lambda sur: (sur[1], sur[2], sur[3]))
-                students = []
-                for n in unsorted:
-                    students.append(n[0])
-                for j in students:
-                    unsorted1 = []
-                    for k in j.attempts:
-                        unsorted1.append([k, k.percent, k.year])
-                    unsorted1.sort(key=lambda sur: (-sur[1], sur[2]))
-                    attempts = []
-                    for b in unsorted1:
-                        attempts.append(b[0])
-                    for k in attempts:
-                        f.write(f'\t{k.year}\t{j.surname}\t{j.name}\t{j.middle_name}\t{k.percent}\n')
-
-    def load(self, name: str, surname: str, percent: int, middle_name: str, cond: str, year: int, month: int, day: int):
-        """
-        :param name: name of student
-        :param surname: surname of student
-        :param percent: point for attempt
-        :param middle_name: middle_name of student
-        :param cond: condition of problem
-        :param year: year of attempt
-        :param month: month of attempt
-        :param day: day of attempt
-        loads information about problem attempt of student, if there is not such a problem,
-        creates _Problem object, otherwise in existing problem loads attempt data
-        """
-        found = self._find(cond)
-        if found is None:
-            return self._add(name, surname, percent, middle_name, cond, year, month, day)
-        else:
-            self.problems[found].load(name, surname, percent, middle_name, year, month, day)
-
-    def _find(self, cond: str):
-        """
-        :param cond: condition of problem
-        checks whether this problem exists
-        :return: None if there is no problem, otherwise index of problem in problems list
-        """
-        if cond not in self.problems_names:
-            return None
-        else:
-            index_ = self.problems_names.index(cond)
-            return index_
-
-    def _add(self, name, surname, percent, middle_name, cond, year, month, day):
-        """
-        :param name: name of student
-        :param surname: surname of student
-        :param percent: point for attempt
-        :param middle_name: middle_name of student
-        :param cond: condition of problem
-        :param year: year of attempt
-        :param month: month of attempt
-        :param day: day of attempt
-        creates _Problem object and add its to list of problems objects and to list of problems names
-        :return: index of problem in list
-        """
-        obj = self._Problem(name, surname, percent, middle_name, cond, year, month, day)
-        self.problems.append(obj)
-        self.problems_names.append(cond)
-        index_ = self.problems.index(obj)
-        return self.problems[index_]
-
-    class _Problem:
-        """
-        stores information about problem, contains nested class _Student,
-        stores list of _Student objects and list of problems names
-        """
-        def __init__(self, name: str, surname: str, percent: int, middle_name: str, cond: str, year: int,
-                     month: int, day: int):
-            """
-            :param name: name of student
-            :param surname: surname of student
-            :param percent: point for attempt
-            :param middle_name: middle_name of student
-            :param cond: condition of problem
-            :param year: year of attempt
-            :param month: month of attempt
-            :param day: day of attempt
-            creates empty lists of _Student objects and problems names, stores student data, calls load() method
-            """
-            self.students = []
-            self.students_names = []
-            self.name = name
-            self.surname = surname
-            self.percent = percent
-            self.middle_name = middle_name
-            self._check_cond(cond)
-            self.cond = cond
-            self.year = year
-            self.month = month
-            self.day = day
-            self.load(name, surname, percent, middle_name, year, month, day)
-
-        @staticmethod
-        def _check_cond(cond):
-            """
-            :param cond: condition of problem
-            checks accordance of condition format, in case of improper format raises error
-            :return: True
-            """
-            pattern = re.compile(r'[-\w".,{}$+*\\)(%\]\[ ]{4,54}')
-            if not re.fullmatch(pattern, cond):
-                raise ValueError('something wrong with problem`s condition')
-            return True
-
-        def load(self, name: str, surname: str, percent: int, middle_name: str, year: int, month: int, day: int):
-            """
-            :param name: name of student
-            :param surname: surname of student
-            :param percent: point for attempt
-            :param middle_name: middle_name of student
-            :param year: year of attempt
-            :param month: month of attempt
-            :param day: day of attempt
-            loads information about attempt of student of problem, if there is not such a student,
-            calls add() method, otherwise in existing student loads attempt data by calling method _Student.load()
-            :return:
-            """
-            found = self._find(name, surname, middle_name)
-            if found is None:
-                self._add(name, surname, percent, middle_name, year, month, day)
-            else:
-                self.students[found].load(percent, year, month, day)
-
-        def _find(self, name: str, surname: str, middle_name: str):
-            """
-            :param name: name of student
-            :param surname: surname of student
-            :param middle_name: middle_name  of student
-            finds student in list of students
-            :return: None if there is not such a student, index of student in list otherwise
-            """
-            if [name, surname, middle_name] not in self.students_names:
-                return None
-            else:
-                index_ = self.students_names.index([name, surname, middle_name])
-                return index_
-
-        def _add(self, name, surname, percent, middle_name, year, month, day):
-            """
-            :param name: name of student
-            :param surname: surname of student
-            :param percent: point for attempt
-            :param middle_name: middle_name of student
-            :param year: year of attempt
-            :param month: month of attempt
-            :param day: day of attempt
-            creates _Student object, appends its to lists, finds index of this student in list
-            :return: object of student
-            """
-            obj = self._Student(name, surname, percent, middle_name, year, month, day)
-            self.students.append(obj)
-            self.students_names.append([name, surname, middle_name])
-            index_ = self.students.index(obj)
-            return self.students[index_]
-
-        def _attempt_num(self):
-            """
-            counts quantity of attempts, done by this student in one this problem
-            :return: quantity of these attempts
-            """
-            an = 0
-            for i in self.students:
-                an += i.attempts_num
-            self.attemptes_num = an
-            return an
-
-        def _good_attempt_num(self):
-            """
-            counts quantity of good attempts, done by this student in one this problem (attempt is successful, if
-            gained points are 60 or more)
-            :return: quantity of these good attempts
-            """
-            gan = 0
-            for i in self.students:
-                gan += i.good_attempts_num
-            self.good_attemptes_num = gan
-            return gan
-
-        def _good_attempt_percentage(self):
-            """
-            :return: percent of good attempts to all attempts
-            """
-            return round((self._good_attempt_num() / self._attempt_num()) * 100)
-
-        def good_problem(self):
-            """
-            creates object field of good attempts percentage
-            :return: True if all attempts are good, False otherwise
-            """
-            self.good_attempt_percentage = self._good_attempt_percentage()
-            return self.attemptes_num == self.good_attemptes_num
-
-        class _Student:
-            """
-            stores information about student, contains nested class _Attempt,
-            stores list of _Attempt objects and list of attempts date
-            """
-            def __init__(self, name: str, surname: str, percent: int, middle_name: str,
-                         year: int, month: int, day: int):
-                """
-                :param name: name of student
-                :param surname: surname of student
-                :param percent: point for attempt
-                :param middle_name: middle_name of student
-                :param year: year of attempt
-                :param month: month of attempt
-                :param day: day of attempt
-                creates empty lists of _Attempt objects and attempts dates,
-                stores student and attempt data, calls load() method
-                """
-                self.attempts = []
-                self.attempts_names = []
-                self._check_name(name)
-                self.name = name
-                self._check_surname(surname)
-                self.surname = surname
-                self.percent = percent
-                self._check_middle_name(middle_name)
-                self.middle_name = middle_name
-                self.year = year
-                self.month = month
-                self.day = day
-                self.attempts_num = 0
-                self.good_attempts_num = 0
-                self.good_attempts_percentage = 0
-                self.load(percent, year, month, day)
-
-            @staticmethod
-            def _check_name(name):
-                """
-                :param name: name of student
-                checks accordance of name format, in case of improper format raises error
-                :return: True
-                """
-                pattern_digit = re.compile(r'\d')
-                pattern = re.compile(r'\b[-\w` ]{0,26}\b')
-                digit = re.search(pattern_digit, name)
-                if digit is None:
-                    if not re.fullmatch(pattern, name):
-                        raise ValueError('something wrong with student`s name')
-                    return True
-                else:
-                    raise ValueError('something wrong with student`s name')
-
-            @staticmethod
-            def _check_surname(surname):
-                """
-                :param surname: surname of student
-                checks accordance of surname format, in case of improper format raises error
-                :return: True
-                """
-                pattern_digit = re.compile(r'\d')
-                pattern = re.compile(r'\b[-\w` ]{0,25}\b')
-                digit = re.search(pattern_digit, surname)
-                if digit is None:
-                    if not re.fullmatch(pattern, surname):
-                        raise ValueError('something wrong with student`s name')
-                    return True
-                else:
-                    raise ValueError('something wrong with student`s name')
-
-            @staticmethod
-            def _check_middle_name(middle_name):
-                """
-                :param middle_name: middle_name of student
-                checks accordance of middle_name format, in case of improper format raises error
-                :return: True
-                """
-                pattern_digit = re.compile(r'\d')
-                pattern = re.compile(r'\b[-\w` ]{0,30}\b')
-                digit = re.search(pattern_digit, middle_name)
-                if digit is None:
-                    if not re.fullmatch(pattern, middle_name):
-                        raise ValueError('something wrong with student`s name')
-                    return True
-                else:
-                    raise ValueError('something wrong with student`s name')
-
-            def load(self, percent: int, year: int, month: int, day: int):
-                """
-                :param percent: points of attempt
-                :param year: year of attempt
-                :param month: month of attempt
-                :param day: day of attempt
-                calls find() method
-                :return: calls add() method
-                """
-                self._find(year, month, day)
-                return self._add(percent, year, month, day)
-
-            def _find(self, year, month, day):
-                """
-                :param year: year of attempt
-                :param month: month of attempt
-                :param day: day of attempt
-                finds attempt in list of attempt dates
-                :return: None if there is not such an attempt, raises error otherwise
-                """
-                if [year, month, day] in self.attempts_names:
-                    raise ValueError('Attempt has already been added')
-                return None
-
-            def _add(self, percent, year, month, day):
-                """
-                :param percent: points of attempt
-                :param year: year of attempt
-                :param month: month of attempt
-                :param day: day of attempt
-                creates _Attempt object, appends its to lists, finds index of attempt in list,
-                update quantity of attempts and good attempts
-                :return: object of attempt
-                """
-                obj = self._Attempt(percent, year, month, day)
-                self.attempts.append(obj)
-                self.attempts_names.append([year, month, day])
-                index_ = self.attempts.index(obj)
-                self.attempts_num += 1
-                if self.good_attempt(percent):
-                    self.good_attempts_num += 1
-                return self.attempts[index_]
-
-            @staticmethod
-            def good_attempt(percent):
-                """
-                :param percent: points of attempt
-                :return: True if attempt is good (60 points or more), False otherwise
-                """
-                return percent >= 60
-
-            class _Attempt:
-                """
-                stores information about attempt
-                """
-                def __init__(self, percent: int, year: int, month: int, day: int):
-                    self._check_percent(percent)
-                    self.percent = percent
-                    self._check_year(year)
-                    self.year = year
-                    self._check_month(month)
-                    self.month = month
-                    self._check_day(day)
-                    self.day = day
-
-                @staticmethod
-                def _check_percent(percent):
-                    """
-                    :param percent: points of attempt
-                    checks accordance of percent format, in case of improper format raises error
-                    :return: True
-                    """
-                    if not 0 <= percent <= 100:
-                        raise ValueError('something wrong with points')
-                    return True
-
-                @staticmethod
-                def _check_year(year):
-                    """
-                    :param year: year of attempt
-                    checks accordance of year format, in case of improper format raises error
-                    :return: True
-                    """
-                    if not 2001 <= year or not len(str(year)) == 4:
-                        raise ValueError('something wrong with year')
-                    return True
-
-                @staticmethod
-                def _check_month(month):
-                    """
-                    :param month: month of attempt
-                    checks accordance of month format, in case of improper format raises error
-                    :return: True
-                    """
-                    if not 0 < month < 13:
-                        raise ValueError('something wrong with month')
-                    return True
-
-                def _check_day(self, day):
-                    """
-                    :param day: day of attempt
-                    checks accordance of day format, in case of improper format raises error
-                    :return: date if it is proper, raises error otherwise
-                    """
-                    return date(self.year, self.month, day)
+"""
+Module of Shtonda Yelizaveta, contains class Information for storing data from .csv file
+"""
+import gc
+import sys
+import time
+from operator import attrgetter
+import Validation
+import Writers
+import Scores
+import Periods
+import Memory
+
+
+class Information:
+    """
+    stores information from .csv file, contains nested class _Problem,
+    stores list of _Problem objects and dictionary of problems names with their indexes in this list,
+    and registry of students -- list of names of students and dictionary of their codes (names are checked once,
+    problems keep students by codes), histograms of points of students and lists of indexes of their problems
+    """
+
+    def __init__(self, streaming=False):
+        """
+        :param streaming: if True, data of problem is freed as soon as it gets not good attempt, because such
+        problem is not printed, only quantities of its attempts are kept
+        creates empty list of _Problem objects, empty dictionary of problems names, empty registry of students
+        (histograms of points of students are kept in streaming mode too), creates fields according to .json file
+        """
+        self.streaming = streaming
+        self.problems = []
+        self.problems_names = {}
+        self.students = []
+        self.students_names = {}
+        self.students_scores = []
+        self.students_problems = []
+        self.records_sum = 0
+        self.surnames_length = 0
+
+    def clear(self):
+        """
+        clears Information object -- list of _Problem objects, dictionary of problems names, registry of
+        students and quantities of loaded records and lengths of surnames
+        """
+        self.problems = []
+        self.problems_names = {}
+        self.students = []
+        self.students_names = {}
+        self.students_scores = []
+        self.students_problems = []
+        self.records_sum = 0
+        self.surnames_length = 0
+
+    def copy_empty(self):
+        """
+        :return: empty Information object with the same mode
+        """
+        return Information(self.streaming)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        :param exc_type: error class
+        :param exc_val: error instance
+        :param exc_tb: trace object
+        in case of some error during processing .csv file clears Information object
+        """
+        if exc_type is not None:
+            self.clear()
+
+    def load_add_inf(self, record_sum, surnames_sum):
+        """
+        :param record_sum: quantity of records in .csv file
+        :param surnames_sum: sum of lengths of surnames in .csv file
+        update data in Information object, sorts students and attempts of changed problems (so loaded object is
+        only read by threads, which write reports)
+        """
+        self.records_sum = record_sum
+        self.surnames_length = surnames_sum
+        self.sort()
+
+    def sort(self):
+        """
+        sorts students and attempts of problems, which were changed after the last sorting
+        """
+        for problem in self.problems:
+            problem.sort()
+
+    def counters(self):
+        """
+        counts loaded objects by loaded data, so loading is not slowed by counting
+        :return: dictionary of quantities of records, problems, students of problems (students of dropped problems
+        are unknown) and dropped problems
+        """
+        students = sum(len(i.students) for i in self.problems if i.students is not None)
+        dropped = sum(i.students is None for i in self.problems)
+        return {'rows': self.records_sum, 'problems': len(self.problems), 'students': students,
+                'dropped_problems': dropped}
+
+    def memory(self):
+        """
+        counts approximate sizes of structures by quantities of their objects (strings of names are not counted,
+        attempts are counted by histograms of problems, which are not dropped), so it is cheap enough to be called
+        during loading
+        :return: dictionary of sizes (in bytes) of problems (with histograms and counters of months), students
+        (students of problems and registry with histograms), attempts (with sets of dates) and indexes (lists and
+        dictionaries of problems and students)
+        """
+        problems = 0
+        students = 0
+        attempts = 0
+        for i in self.problems:
+            problems += sys.getsizeof(i.cond) + sys.getsizeof(i.scores) + sys.getsizeof(i.periods)
+            if i.students is not None:
+                students += len(i.students)
+                attempts += i.scores.total()
+        problems += len(self.problems) * (Memory.instance(self._Problem) + Memory.DICT + Memory.LIST)
+        student = self._Problem._Student
+        return {'problems': problems,
+                'students': students * (Memory.instance(student) + Memory.LIST + Memory.SET + Memory.DICT_ENTRY +
+                                        2 * Memory.POINTER) +
+                len(self.students) * (Memory.NAMES + Memory.HISTOGRAM + Memory.LIST + Memory.INT),
+                'attempts': attempts * (Memory.instance(student._Attempt) + Memory.POINTER + Memory.INT +
+                                        Memory.SET_ENTRY),
+                'indexes': sys.getsizeof(self.problems) + sys.getsizeof(self.problems_names) +
+                sys.getsizeof(self.students) + sys.getsizeof(self.students_names) +
+                sys.getsizeof(self.students_scores) + sys.getsizeof(self.students_problems)}
+
+    def problem_counts(self, cond):
+        """
+        :param cond: condition of problem
+        :return: None if there is no problem, otherwise quantity of attempts, quantity of good attempts and
+        percentage of good attempts of problem
+        """
+        found = self._find(cond)
+        if found is None:
+            return None
+        problem = self.problems[found]
+        return problem._attempt_num(), problem._good_attempt_num(), problem._good_attempt_percentage()
+
+    def student_attempts(self, name, surname, middle_name):
+        """
+        :param name: name of student
+        :param surname: surname of student
+        :param middle_name: middle_name of student
+        :return: list of attempts of student -- tuples of condition, year, month, day and points, in order of
+        problems, attempts of problem are sorted like in output (attempts of dropped problems are unknown),
+        only problems of student are visited
+        """
+        code = self.students_names.get((name, surname, middle_name))
+        if code is None:
+            return []
+        attempts = []
+        for found in sorted(self.students_problems[code]):
+            problem = self.problems[found]
+            if problem.students is not None:
+                problem.sort()
+                attempts.extend([(problem.cond, i.year, i.month, i.day, i.percent)
+                                 for i in problem._find(code).attempts])
+        return attempts
+
+    def problem_scores(self, cond):
+        """
+        :param cond: condition of problem
+        :return: None if there is no problem, otherwise histogram of points of all attempts of problem (it is kept
+        for dropped problems too)
+        """
+        found = self._find(cond)
+        return None if found is None else self.problems[found].scores
+
+    def student_scores(self, name, surname, middle_name):
+        """
+        :param name: name of student
+        :param surname: surname of student
+        :param middle_name: middle_name of student
+        :return: None if there is no student, otherwise histogram of points of all attempts of student in all problems
+        """
+        code = self.students_names.get((name, surname, middle_name))
+        return None if code is None else self.students_scores[code]
+
+    def passing_problems(self, threshold=Scores.PASS, part=Scores.MAX_PERCENT):
+        """
+        :param threshold: points, which attempt has to reach to pass
+        :param part: percent of attempts, which have to pass
+        :return: list of conditions of problems, where at least part percent of attempts have threshold points or
+        more (with default values these are problems of output)
+        """
+        Scores.check_threshold(threshold)
+        Scores.check_threshold(part)
+        return [i.cond for i in self.problems if i.scores.passes(threshold, part)]
+
+    def problem_periods(self, cond):
+        """
+        :param cond: condition of problem
+        :return: None if there is no problem, otherwise counters of attempts of problem by months (they are kept
+        for dropped problems too)
+        """
+        found = self._find(cond)
+        return None if found is None else self.problems[found].periods
+
+    def period_report(self, start=None, end=None):
+        """
+        :param start: the first month of range -- pair of year and month, None if range has no beginning
+        :param end: the last month of range -- pair of year and month, None if range has no end
+        sums counters of months of every problem, attempts are not scanned
+        :return: list of tuples of condition, quantity of attempts, quantity of good attempts and percentage of
+        good attempts in range for problems with attempts in range, in order of problems
+        """
+        Periods.bounds(start, end)
+        report = []
+        for i in self.problems:
+            counts = i.periods.counts(start, end)
+            if counts[0]:
+                report.append((i.cond,) + counts)
+        return report
+
+    def output(self, output_file, output_encoding, output_format='tsv', pipeline=None):
+        """
+        :param output_file: relative path to file where information is outputed
+        :param output_encoding: type of encoding of file where information is outputed
+        :param output_format: 'tsv', 'jsonl' or 'binary' -- format of output_file
+        :param pipeline: size of queue of thread, which writes output_file, None to write it by the same thread
+        opens writer of chosen format, calls report() method, and prints 'OK' if there are no errors
+        :return: statistics of queue of thread, which wrote output_file (empty dictionary without pipeline)
+        """
+        print(f'output {output_file}: ', end='')
+        with Writers.open_writer(output_file, output_encoding, output_format, pipeline) as writer:
+            self.report(writer)
+        print('OK')
+        return writer.queues()
+
+    def report(self, writer):
+        """
+        :param writer: writer of some format from module Writers
+        iterates on _Problem objects and passes sorted information about all attempts of every needed problem
+        to writer
+        """
+        for i in self.problems:
+            self.problem_report(i, writer)
+
+    @staticmethod
+    def problem_report(i, writer):
+        """
+        :param i: _Problem object
+        :param writer: writer of some format from module Writers
+        passes information about problem and its sorted students to writer, if problem is needed
+        """
+        if not i.good_problem():
+            return
+        i.sort()
+        students = [(j.name, j.surname, j.middle_name) for j in i.order]
+        codes = [code for code, j in enumerate(i.order) for _ in j.attempts]
+        years = [k.year for j in i.order for k in j.attempts]
+        percents = [k.percent for j in i.order for k in j.attempts]
+        writer.problem(i.cond, i.attemptes_num, i.good_attemptes_num, i.good_attempt_percentage, students, codes,
+                       years, percents)
+
+    @staticmethod
+    def problem_output(i):
+        """
+        :param i: _Problem object
+        :return: text with sorted information about all attempts of problem in format 'tsv', empty if problem
+        is not needed
+        """
+        writer = Writers.TsvWriter(None)
+        Information.problem_report(i, writer)
+        return ''.join(writer.lines)
+
+    def load(self, name: str, surname: str, percent: int, middle_name: str, cond: str, year: int, month: int, day: int):
+        """
+        :param name: name of student
+        :param surname: surname of student
+        :param percent: point for attempt
+        :param middle_name: middle_name of student
+        :param cond: condition of problem
+        :param year: year of attempt
+        :param month: month of attempt
+        :param day: day of attempt
+        loads information about problem attempt of student, finds code of student in registry (names of new
+        student are checked), if there is not such a problem, creates _Problem object, otherwise in existing problem
+        loads attempt data, in streaming mode drops data of problem after not good attempt
+        :return: object of problem
+        """
+        found = self._find(cond)
+        if found is None:
+            self._Problem._check_cond(cond)
+        code = self._student(name, surname, middle_name)
+        if found is None:
+            problem = self._add(code, percent, cond, year, month, day)
+        else:
+            problem = self.problems[found]
+            if problem.load(code, self.students[code], percent, year, month, day):
+                self.students_problems[code].append(found)
+        problem.scores.add(percent)
+        problem.periods.add(year, month, percent)
+        self.students_scores[code].add(percent)
+        if self.streaming and not self._Problem._Student.good_attempt(percent):
+            problem.drop()
+        return problem
+
+    def load_many(self, rows, times=None):
+        """
+        :param rows: iterable of rows -- tuples of fields in order of parameters of load() method (column batches
+        can be passed as zip(*columns))
+        checks columns of all rows at once (and rows one by one only if some field is improper), loads proper rows
+        without nested checks and calls of load() (garbage collector is stopped, because new objects do not make
+        cycles), the first improper row is loaded by load() method, which raises the same error as loading row by
+        row, adds quantity of rows and sum of lengths of surnames to fields records_sum and surnames_length
+        :param times: dictionary of times of stages, time of checks of rows is added to key 'validate' and time
+        of their loading to key 'aggregate' (None if time is not measured)
+        :return: quantity of rows and sum of lengths of their surnames
+        """
+        if not isinstance(rows, list):
+            rows = list(rows)
+        if not rows:
+            return 0, 0
+        columns = list(zip(*rows))
+        surnames = sum(map(len, columns[1]))
+        checked = time.perf_counter()
+        wrong = len(rows) if Validation.good_columns(*columns) else Validation.first_wrong_row(rows)
+        loaded = time.perf_counter()
+        problems = self.problems
+        problems_names = self.problems_names
+        students = self.students
+        students_names = self.students_names
+        students_scores = self.students_scores
+        students_problems = self.students_problems
+        good_attempt = self._Problem._Student.good_attempt
+        months = Periods.MONTHS
+        good = Periods.GOOD + 1
+        collect = gc.isenabled()
+        gc.disable()
+        try:
+            start = 0
+            while True:
+                for i in range(start, wrong):
+                    name, surname, percent, middle_name, cond, year, month, day = rows[i]
+                    code = students_names.get((name, surname, middle_name))
+                    if code is None:
+                        code = self._student(name, surname, middle_name, False)
+                    found = problems_names.get(cond)
+                    if found is None:
+                        problem = self._add(code, percent, cond, year, month, day, False)
+                    else:
+                        problem = problems[found]
+                        if problem.students is None:
+                            problem.count(percent)
+                        else:
+                            student = problem.students.get(code)
+                            if student is None:
+                                problem._add(code, students[code], percent, year, month, day, False)
+                                students_problems[code].append(found)
+                            else:
+                                student.load(percent, year, month, day, False)
+                                problem.ordered = False
+                    scores = problem.scores
+                    scores[percent] = scores.get(percent, 0) + 1
+                    periods = problem.periods
+                    period = year * months + month - 1
+                    periods[period] = periods.get(period, 0) + (good if percent >= Scores.PASS else 1)
+                    scores = students_scores[code]
+                    scores[percent] = scores.get(percent, 0) + 1
+                    if self.streaming and not good_attempt(percent):
+                        problem.drop()
+                if wrong == len(rows):
+                    break
+                self.load(*rows[wrong])
+                start = wrong + 1
+                wrong = Validation.first_wrong_row(rows, start)
+        finally:
+            if collect:
+                gc.enable()
+        self.records_sum += len(rows)
+        self.surnames_length += surnames
+        if times is not None:
+            times['validate'] += loaded - checked
+            times['aggregate'] += time.perf_counter() - loaded
+        return len(rows), surnames
+
+    @classmethod
+    def from_records(cls, rows, streaming=False):
+        """
+        :param rows: iterable of rows like in load_many() method
+        :param streaming: mode of created object like in constructor
+        :return: new Information object with loaded rows
+        """
+        data = cls(streaming)
+        data.load_many(rows)
+        return data
+
+    def _find(self, cond: str):
+        """
+        :param cond: condition of problem
+        checks whether this problem exists
+        :return: None if there is no problem, otherwise index of problem in problems list
+        """
+        return self.problems_names.get(cond)
+
+    def _add(self, code, percent, cond, year, month, day, check=True):
+        """
+        :param code: code of student in registry
+        :param percent: point for attempt
+        :param cond: checked condition of problem
+        :param year: year of attempt
+        :param month: month of attempt
+        :param day: day of attempt
+        :param check: False if attempt has already been checked
+        creates _Problem object and add its to list of problems objects, to dictionary of problems names and
+        to problems of student, condition of problem is interned to be stored once
+        :return: object of problem
+        """
+        cond = sys.intern(cond)
+        obj = self._Problem(code, self.students[code], percent, cond, year, month, day, check)
+        self.students_problems[code].append(len(self.problems))
+        self.problems_names[cond] = len(self.problems)
+        self.problems.append(obj)
+        return obj
+
+    def _student(self, name, surname, middle_name, check=True):
+        """
+        :param name: name of student
+        :param surname: surname of student
+        :param middle_name: middle_name of student
+        :param check: False if names have already been checked
+        finds code of student in registry, if there is not such a student, checks his names and adds him with
+        interned names, empty histogram and empty list of problems
+        :return: code of student
+        """
+        names = (name, surname, middle_name)
+        code = self.students_names.get(names)
+        if code is None:
+            if check:
+                self._Problem._Student._check_name(name)
+                self._Problem._Student._check_surname(surname)
+                self._Problem._Student._check_middle_name(middle_name)
+            code = len(self.students)
+            names = (sys.intern(name), sys.intern(surname), sys.intern(middle_name))
+            self.students_names[names] = code
+            self.students.append(names)
+            self.students_scores.append(Scores.Histogram())
+            self.students_problems.append([])
+        return code
+
+    def merge(self, other):
+        """
+        :param other: Information object, loaded from next part of .csv file
+        adds problems, students and attempts of other to this object as if they were loaded after data of this
+        object, repeated attempts raise error like during loading, adds quantity of records and lengths of surnames
+        of other, students of other get codes of registry of this object
+        """
+        self.records_sum += other.records_sum
+        self.surnames_length += other.surnames_length
+        codes = [self._student(*names, check=False) for names in other.students]
+        for code, scores in zip(codes, other.students_scores):
+            self.students_scores[code].merge(scores)
+        for problem in other.problems:
+            problem.recode(codes, self.students)
+            found = self._find(problem.cond)
+            if found is None:
+                found = len(self.problems)
+                self.problems_names[problem.cond] = found
+                self.problems.append(problem)
+                added = [] if problem.students is None else list(problem.students)
+            else:
+                added = self.problems[found].merge(problem)
+                problem = self.problems[found]
+            for code in added:
+                self.students_problems[code].append(found)
+            if self.streaming and problem._attempt_num() != problem._good_attempt_num():
+                problem.drop()
+
+    class _Problem:
+        """
+        stores information about problem, contains nested class _Student,
+        stores dictionary of _Student objects by codes of students in registry and list of the same objects (new
+        students and attempts are appended, list is sorted by surname, name and middle_name only when it is needed
+        after changes), histogram of points of attempts and counters of attempts by months
+        """
+        __slots__ = ('students', 'order', 'ordered', 'cond', 'attemptes_num', 'good_attemptes_num',
+                     'good_attempt_percentage', 'scores', 'periods')
+
+        def __init__(self, code: int, names: tuple, percent: int, cond: str, year: int, month: int, day: int,
+                     check=True):
+            """
+            :param code: code of student in registry
+            :param names: interned name, surname and middle_name of student from registry
+            :param percent: point for attempt
+            :param cond: checked condition of problem
+            :param year: year of attempt
+            :param month: month of attempt
+            :param day: day of attempt
+            :param check: False if attempt has already been checked
+            creates empty dictionary and list of _Student objects, empty histogram and counters of months (they
+            are filled by Information object), stores condition, calls _add() method for the first student
+            """
+            self.students = {}
+            self.order = []
+            self.ordered = True
+            self.scores = Scores.Histogram()
+            self.periods = Periods.Periods()
+            self.cond = cond
+            self._add(code, names, percent, year, month, day, check)
+
+        @staticmethod
+        def _check_cond(cond):
+            """
+            :param cond: condition of problem
+            checks accordance of condition format, in case of improper format raises error
+            :return: True
+            """
+            return Validation.check_cond(cond)
+
+        def load(self, code: int, names: tuple, percent: int, year: int, month: int, day: int):
+            """
+            :param code: code of student in registry
+            :param names: interned name, surname and middle_name of student from registry
+            :param percent: point for attempt
+            :param year: year of attempt
+            :param month: month of attempt
+            :param day: day of attempt
+            loads information about attempt of student of problem, if there is not such a student,
+            calls add() method, otherwise in existing student loads attempt data by calling method _Student.load(),
+            if data of problem was dropped, calls _skip() method
+            :return: True if student is new in this problem, False otherwise
+            """
+            if self.students is None:
+                self._skip(percent, year, month, day)
+                return False
+            found = self._find(code)
+            if found is None:
+                self._add(code, names, percent, year, month, day)
+                return True
+            found.load(percent, year, month, day)
+            self.ordered = False
+            return False
+
+        def _find(self, code: int):
+            """
+            :param code: code of student in registry
+            finds student in dictionary of students
+            :return: None if there is not such a student, object of student otherwise
+            """
+            return self.students.get(code)
+
+        def _add(self, code, names, percent, year, month, day, check=True):
+            """
+            :param code: code of student in registry
+            :param names: interned name, surname and middle_name of student from registry
+            :param percent: point for attempt
+            :param year: year of attempt
+            :param month: month of attempt
+            :param day: day of attempt
+            :param check: False if attempt has already been checked
+            creates _Student object, stores it in dictionary of students by code and appends it to list of
+            students
+            :return: object of student
+            """
+            obj = self._Student(names, percent, year, month, day, check)
+            self.students[code] = obj
+            self.order.append(obj)
+            self.ordered = False
+            return obj
+
+        def sort(self):
+            """
+            sorts list of students and attempts of every student, if they were changed after the last sorting
+            (sorting is stable, so students and attempts with equal keys stay in order of their loading)
+            """
+            if self.ordered or self.students is None:
+                return
+            self.order.sort(key=self._Student.order_key)
+            attempt_key = self._Student._Attempt.order_key
+            for student in self.order:
+                student.attempts.sort(key=attempt_key)
+            self.ordered = True
+
+        def _skip(self, percent, year, month, day):
+            """
+            :param percent: point for attempt
+            :param year: year of attempt
+            :param month: month of attempt
+            :param day: day of attempt
+            checks attempt data of problem, which data was dropped (names are checked by registry), and only counts
+            this attempt (repeated attempts can not be found in such a problem)
+            """
+            Validation.check_attempt(percent, year, month, day)
+            self.count(percent)
+
+        def count(self, percent):
+            """
+            :param percent: point for checked attempt of problem, which data was dropped
+            only counts this attempt
+            """
+            self.attemptes_num += 1
+            if self._Student.good_attempt(percent):
+                self.good_attemptes_num += 1
+
+        def merge(self, other):
+            """
+            :param other: _Problem object with the same condition, loaded from next part of .csv file
+            adds students and attempts of other (its students have to have codes of the same registry) to this
+            problem, if data of one of them was dropped, only quantities of attempts are added
+            :return: list of codes of students, who are new in this problem
+            """
+            self.scores.merge(other.scores)
+            self.periods.merge(other.periods)
+            if self.students is None or other.students is None:
+                self.drop()
+                self.attemptes_num += other._attempt_num()
+                self.good_attemptes_num += other._good_attempt_num()
+                return []
+            added = []
+            for code, student in other.students.items():
+                found = self._find(code)
+                if found is None:
+                    self.students[code] = student
+                    self.order.append(student)
+                    added.append(code)
+                else:
+                    found.merge(student)
+            self.ordered = False
+            return added
+
+        def recode(self, codes, names):
+            """
+            :param codes: list of codes of students in registry of other Information object by their codes in
+            registry, where problem was created
+            :param names: list of interned names of students of other registry by their codes
+            changes codes of students of problem, which was created in other process, interns condition and names
+            """
+            self.cond = sys.intern(self.cond)
+            if self.students is not None:
+                self.students = {codes[code]: student for code, student in self.students.items()}
+                for code, student in self.students.items():
+                    student.name, student.surname, student.middle_name = names[code]
+
+        def drop(self):
+            """
+            counts attempts and good attempts of problem and frees its students and attempts,
+            only tombstone with quantities of attempts stays
+            """
+            if self.students is not None:
+                self._attempt_num()
+                self._good_attempt_num()
+                self.students = None
+                self.order = None
+
+        def _attempt_num(self):
+            """
+            counts quantity of attempts, done by this student in one this problem
+            :return: quantity of these attempts
+            """
+            if self.students is None:
+                return self.attemptes_num
+            an = 0
+            for i in self.students.values():
+                an += i.attempts_num
+            self.attemptes_num = an
+            return an
+
+        def _good_attempt_num(self):
+            """
+            counts quantity of good attempts, done by this student in one this problem (attempt is successful, if
+            gained points are 60 or more)
+            :return: quantity of these good attempts
+            """
+            if self.students is None:
+                return self.good_attemptes_num
+            gan = 0
+            for i in self.students.values():
+                gan += i.good_attempts_num
+            self.good_attemptes_num = gan
+            return gan
+
+        def _good_attempt_percentage(self):
+            """
+            :return: percent of good attempts to all attempts
+            """
+            return round((self._good_attempt_num() / self._attempt_num()) * 100)
+
+        def good_problem(self):
+            """
+            creates object field of good attempts percentage
+            :return: True if all attempts are good, False otherwise
+            """
+            self.good_attempt_percentage = self._good_attempt_percentage()
+            return self.attemptes_num == self.good_attemptes_num
+
+        class _Student:
+            """
+            stores information about student, contains nested class _Attempt,
+            stores list of _Attempt objects (it is sorted by problem by points in descending order and year,
+            attempts with equal points and year stay in order of their loading) and set of attempts dates
+            """
+            __slots__ = ('attempts', 'dates', 'name', 'surname', 'middle_name', 'attempts_num', 'good_attempts_num')
+
+            def __init__(self, names: tuple, percent: int, year: int, month: int, day: int, check=True):
+                """
+                :param names: interned name, surname and middle_name of student from registry (they are checked
+                once, when student is added to registry)
+                :param percent: point for attempt
+                :param year: year of attempt
+                :param month: month of attempt
+                :param day: day of attempt
+                :param check: False if attempt has already been checked
+                creates empty list of _Attempt objects and empty set of dates, stores names of student,
+                calls _add() method for the first attempt
+                """
+                self.attempts = []
+                self.dates = set()
+                self.name, self.surname, self.middle_name = names
+                self.attempts_num = 0
+                self.good_attempts_num = 0
+                self._add(percent, year, month, day, check)
+
+            @staticmethod
+            def _check_name(name):
+                """
+                :param name: name of student
+                checks accordance of name format, in case of improper format raises error
+                :return: True
+                """
+                return Validation.check_name(name, 26)
+
+            @staticmethod
+            def _check_surname(surname):
+                """
+                :param surname: surname of student
+                checks accordance of surname format, in case of improper format raises error
+                :return: True
+                """
+                return Validation.check_name(surname, 25)
+
+            @staticmethod
+            def _check_middle_name(middle_name):
+                """
+                :param middle_name: middle_name of student
+                checks accordance of middle_name format, in case of improper format raises error
+                :return: True
+                """
+                return Validation.check_name(middle_name, 30)
+
+            def load(self, percent: int, year: int, month: int, day: int, check=True):
+                """
+                :param percent: points of attempt
+                :param year: year of attempt
+                :param month: month of attempt
+                :param day: day of attempt
+                :param check: False if fields have already been checked
+                calls find() method
+                :return: calls add() method
+                """
+                self._find(year, month, day)
+                return self._add(percent, year, month, day, check)
+
+            def _find(self, year, month, day):
+                """
+                :param year: year of attempt
+                :param month: month of attempt
+                :param day: day of attempt
+                finds attempt in set of attempts dates
+                :return: None if there is not such an attempt, raises error otherwise
+                """
+                if self._date_key(year, month, day) in self.dates:
+                    raise ValueError('Attempt has already been added')
+                return None
+
+            def _add(self, percent, year, month, day, check=True):
+                """
+                :param percent: points of attempt
+                :param year: year of attempt
+                :param month: month of attempt
+                :param day: day of attempt
+                :param check: False if fields have already been checked
+                creates _Attempt object, appends it to list of attempts and its date to set of dates,
+                update quantity of attempts and good attempts
+                :return: object of attempt
+                """
+                obj = self._Attempt(percent, year, month, day, check)
+                self.dates.add(self._date_key(year, month, day))
+                self.attempts.append(obj)
+                self.attempts_num += 1
+                if self.good_attempt(percent):
+                    self.good_attempts_num += 1
+                return obj
+
+            def merge(self, other):
+                """
+                :param other: _Student object with the same names, loaded from next part of .csv file
+                adds attempts of other to this student, raises error if some attempt has already been added
+                """
+                for attempt in other.attempts:
+                    key = self._date_key(attempt.year, attempt.month, attempt.day)
+                    if key in self.dates:
+                        raise ValueError('Attempt has already been added')
+                    self.dates.add(key)
+                    self.attempts.append(attempt)
+                self.attempts_num += other.attempts_num
+                self.good_attempts_num += other.good_attempts_num
+
+            @staticmethod
+            def _date_key(year, month, day):
+                """
+                :param year: year of attempt
+                :param month: month of attempt
+                :param day: day of attempt
+                :return: date of attempt packed in one integer, which is stored in set of dates
+                """
+                return year * 10000 + month * 100 + day
+
+            # key for sorting students in output
+            order_key = attrgetter('surname', 'name', 'middle_name')
+
+            @staticmethod
+            def good_attempt(percent):
+                """
+                :param percent: points of attempt
+                :return: True if attempt is good (60 points or more), False otherwise
+                """
+                return percent >= Scores.PASS
+
+            class _Attempt:
+                """
+                stores information about attempt, years are shared between attempts
+                """
+                __slots__ = ('percent', 'year', 'month', 'day')
+                _years = {}
+
+                @staticmethod
+                def order_key(attempt):
+                    """
+                    :param attempt: _Attempt object
+                    :return: key for sorting attempts of student in output
+                    """
+                    return -attempt.percent, attempt.year
+
+                def __init__(self, percent: int, year: int, month: int, day: int, check=True):
+                    """
+                    :param percent: points of attempt
+                    :param year: year of attempt
+                    :param month: month of attempt
+                    :param day: day of attempt
+                    :param check: False if fields have already been checked
+                    checks fields of attempt and stores them
+                    """
+                    if check:
+                        Validation.check_attempt(percent, year, month, day)
+                    self.percent = percent
+                    self.year = self._years.setdefault(year, year)
+                    self.month = month
+                    self.day = day
@@ -1,113 +1,360 @@
-"""
-Module of Shtonda Yelizaveta, contains functions for data loading
-"""
-import Information
-import Builder
-import json
-
-
-def load_ini(path):
-    """
-    :param path: relative path to .ini file
-    opens .ini file, processes  and prints 'OK' if there are no errors
-    :return: list of keys from .ini file
-    """
-    with open(path, 'r', encoding='utf8') as f:
-        r = json.load(f)
-        check_ini_file(r)
-        main_file = r['input']['csv']
-        additional_file = r['input']['json']
-        input_encoding = r['input']['encoding']
-        output_file = r['output']['fname']
-        output_encoding = r['output']['encoding']
-        print('OK')
-        return [main_file, additional_file, input_encoding, output_file, output_encoding]
-
-
-def check_ini_file(r):
-    """
-    :param r: dictionary, loaded from .ini file
-    checks existence of needed keys and raises error if some key is absent
-    :return: True if there are no errors
-    """
-    input_keys = ['csv', 'json', 'encoding']
-    output_keys = ['fname', 'encoding']
-    input_list = []
-    output_list = []
-    for i in r['input']:
-        input_list.append(i)
-    for i in r['output']:
-        output_list.append(i)
-    if not input_list >= input_keys:
-        raise ValueError('Something wrong with input keys in .ini file')
-    if not output_list >= output_keys:
-        raise ValueError('Something wrong with output keys in .ini file')
-    return True
-
-
-def load(main_file, addition_file, input_encoding):
-    """
-    :param main_file: relative path to .csv file
-    :param addition_file: relative path to .json file
-    :param input_encoding: type of encoding of main_file and addition_file
-    creates instance of the class Information, calls functions for loading main_file and addition_file, checks
-    their accordance and prints appropriate text
-    :return: instance of the class Information
-    """
-    data = Information.Information()
-    load_data(data, main_file, input_encoding)
-    if fit(data, load_stat(addition_file, input_encoding)):
-        print('OK')
-    else:
-        print('UPS')
-    return data
-
-
-def load_data(data, main_file, input_encoding):
-    """
-    :param data: object of class Information
-    :param main_file: relative path to .csv file
-    :param input_encoding: type of encoding of main_file
-    clears data, creates instance of the class Builder, pass parameters to Builder method and prints 'OK'
-    if there are no errors
-    """
-    print(f'input-csv {main_file}: ', end='')
-    data.clear()
-    obj = Builder.Builder()
-    obj.load(data, main_file, input_encoding)
-    print('OK')
-
-
-def load_stat(additional_file, input_encoding):
-    """
-    :param additional_file: relative path to .json file
-    :param input_encoding: type of encoding of additional_file
-    opens additional file, checks existence of needed keys and raises error if some key is absent
-    :return: dictionary loaded from additional_file
-    """
-    print(f'input-json {additional_file}: ', end='')
-    keys = ["сума довжин всіх прізвищ", "кількість записів"]
-    with open(additional_file, 'r', encoding=input_encoding) as f:
-        add_data = json.load(f)
-        for key in keys:
-            if key not in add_data:
-                raise ValueError('There are no needed keys in additional file')
-        add_data["surnames_sum"] = add_data.pop("сума довжин всіх прізвищ")
-        add_data["records_sum"] = add_data.pop("кількість записів")
-    print('OK')
-    return add_data
-
-
-def fit(data, add_data):
-    """
-    :param data: object of class Information
-    :param add_data: dictionary loaded from additional_file, returned in load_stat() function
-    checks accordance of data from additional_file to corresponding data in lst
-    :return: True if data is according, False otherwise
-    """
-    print('json?=csv: ', end='')
-    record_sum = data.records_sum
-    surname_sum = data.surnames_length
-    return surname_sum == add_data["surnames_sum"] and record_sum == add_data["records_sum"]
-
-
+"""
+Module of Shtonda Yelizaveta, contains functions for data loading
+"""
+import Information
+import ColumnInformation
+import SpillInformation
+import Builder
+import Validation
+import Snapshot
+import Writers
+import Profiling
+import Memory
+import Pipeline
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+BACKENDS = {'objects': Information.Information, 'columns': ColumnInformation.ColumnInformation,
+            'spill': SpillInformation.SpillInformation}
+ENGINES = ['python', 'numpy']
+
+
+def load_ini(path):
+    """
+    :param path: relative path to .ini file
+    opens .ini file, processes  and prints 'OK' if there are no errors
+    :return: list of keys from .ini file, the last element is dictionary of optional keys
+    """
+    with open(path, 'r', encoding='utf8') as f:
+        r = json.load(f)
+        keys = ini_keys(r)
+        print('OK')
+        return keys
+
+
+def ini_keys(r):
+    """
+    :param r: dictionary, loaded from .ini file (or job of manifest of module Batch)
+    checks keys and takes them from dictionary
+    :return: list of keys like in load_ini() function
+    """
+    check_ini_file(r)
+    main_file = r['input']['csv']
+    additional_file = r['input']['json']
+    input_encoding = r['input']['encoding']
+    output_file = r['output']['fname']
+    output_encoding = r['output']['encoding']
+    options = load_options(r)
+    return [main_file, additional_file, input_encoding, output_file, output_encoding, options]
+
+
+def load_options(r):
+    """
+    :param r: dictionary, loaded from .ini file
+    takes optional keys from .ini file, absent keys get default values
+    :return: dictionary of optional keys
+    """
+    return {'backend': r['input'].get('backend', 'objects'),
+            'streaming': r['input'].get('streaming', False),
+            'workers': r['input'].get('workers', 1),
+            'parser': r['input'].get('parser', 'fast'),
+            'trusted': r['input'].get('trusted', False),
+            'snapshot': r['input'].get('snapshot'),
+            'spill': r['input'].get('spill'),
+            'spill_rows': r['input'].get('spill_rows', SpillInformation.SPILL_ROWS),
+            'memory_budget': r['input'].get('memory_budget'),
+            'memory_action': r['input'].get('memory_action', 'degrade'),
+            'quarantine': r['input'].get('quarantine'),
+            'pipeline': Pipeline.queue_size(r['input'].get('pipeline')),
+            'engine': r['output'].get('engine', 'python'),
+            'format': r['output'].get('format', 'tsv'),
+            'profile': r.get('profile')}
+
+
+def check_ini_file(r):
+    """
+    :param r: dictionary, loaded from .ini file
+    checks existence of needed keys and raises error if some key is absent
+    :return: True if there are no errors
+    """
+    input_keys = {'csv', 'json', 'encoding'}
+    output_keys = {'fname', 'encoding'}
+    if not set(r['input']) >= input_keys:
+        raise ValueError('Something wrong with input keys in .ini file')
+    if not set(r['output']) >= output_keys:
+        raise ValueError('Something wrong with output keys in .ini file')
+    main_file = r['input']['csv']
+    if not isinstance(main_file, str) and (not isinstance(main_file, list) or not main_file or
+                                           not all(isinstance(i, str) for i in main_file)):
+        raise ValueError('Something wrong with input keys in .ini file')
+    if r['input'].get('backend', 'objects') not in BACKENDS:
+        raise ValueError('Something wrong with input keys in .ini file')
+    if r['output'].get('engine', 'python') not in ENGINES:
+        raise ValueError('Something wrong with output keys in .ini file')
+    if r['output'].get('format', 'tsv') not in Writers.FORMATS:
+        raise ValueError('Something wrong with output keys in .ini file')
+    if r['output'].get('engine', 'python') != 'python' and r['input'].get('backend', 'objects') != 'columns':
+        raise ValueError('Engine "numpy" works only with backend "columns" in .ini file')
+    workers = r['input'].get('workers', 1)
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError('Something wrong with input keys in .ini file')
+    if r['input'].get('parser', 'fast') not in ('fast', 'csv'):
+        raise ValueError('Something wrong with input keys in .ini file')
+    if r['input'].get('streaming', False) and r['input'].get('backend', 'objects') != 'objects':
+        raise ValueError('Streaming works only with backend "objects" in .ini file')
+    spill_rows = r['input'].get('spill_rows', SpillInformation.SPILL_ROWS)
+    if not isinstance(spill_rows, int) or spill_rows < 1 or not isinstance(r['input'].get('spill') or '', str):
+        raise ValueError('Something wrong with input keys in .ini file')
+    if r['input'].get('backend', 'objects') == 'spill' and (workers > 1 or r['input'].get('snapshot') is not None):
+        raise ValueError('Backend "spill" works only with one worker and without snapshot in .ini file')
+    budget = r['input'].get('memory_budget')
+    if budget is not None and (not isinstance(budget, int) or budget < 1):
+        raise ValueError('Something wrong with input keys in .ini file')
+    if r['input'].get('memory_action', 'degrade') not in Memory.ACTIONS:
+        raise ValueError('Something wrong with input keys in .ini file')
+    quarantine = r['input'].get('quarantine')
+    if quarantine is not None and not isinstance(quarantine, str):
+        raise ValueError('Something wrong with input keys in .ini file')
+    if quarantine is not None and (workers > 1 or r['input'].get('backend', 'objects') != 'objects'
+                                   or r['input'].get('snapshot') is not None):
+        raise ValueError('Quarantine works only with backend "objects", one worker and without snapshot in .ini file')
+    pipeline = r['input'].get('pipeline')
+    if pipeline is not None and not isinstance(pipeline, bool) and (not isinstance(pipeline, int) or pipeline < 1):
+        raise ValueError('Something wrong with input keys in .ini file')
+    if pipeline and (workers > 1 or quarantine is not None):
+        raise ValueError('Pipeline works only with one worker and without quarantine in .ini file')
+    if 'profile' in r:
+        Profiling.check_settings(r['profile'])
+    return True
+
+
+def load(main_file, addition_file, input_encoding, options=None, profiler=None):
+    """
+    :param main_file: relative path to .csv file, glob pattern or list of them
+    :param addition_file: relative path to .json file
+    :param input_encoding: type of encoding of main_file and addition_file
+    :param options: dictionary of optional keys from .ini file
+    :param profiler: object of class Profiling.Profiler, which measures stages 'load', 'snapshot' and 'fit'
+    calls functions for loading main_file and addition_file, checks their accordance and prints appropriate text,
+    with key 'pipeline' addition_file is read by separate thread during loading of main_file
+    :return: instance of the class Information
+    """
+    if options is None:
+        options = {}
+    if profiler is None:
+        profiler = Profiling.Profiler()
+    with ThreadPoolExecutor(1) as pool:
+        stat = None
+        if options.get('pipeline') is not None:
+            stat = pool.submit(read_stat, addition_file, input_encoding)
+        data = load_main(main_file, input_encoding, options, profiler)
+        with profiler.stage('fit'):
+            fitted = fit(data, load_stat(addition_file, input_encoding, stat))
+    if fitted:
+        print('OK')
+    else:
+        print('UPS')
+    return data
+
+
+def load_main(main_file, input_encoding, options=None, profiler=None):
+    """
+    :param main_file: relative path to .csv file, glob pattern or list of them
+    :param input_encoding: type of encoding of main_file
+    :param options: dictionary of optional keys from .ini file
+    :param profiler: object of class Profiling.Profiler, which measures stages 'load' and 'snapshot'
+    creates instance of the class Information (or of other class, chosen by key 'backend'), loads main_file
+    (or its snapshot) and writes snapshot, .json file is not read (so jobs of module Batch check their own
+    .json files)
+    :return: instance of the class Information
+    """
+    if options is None:
+        options = {}
+    if profiler is None:
+        profiler = Profiling.Profiler()
+    data = new_data(options)
+    Validation.trust(options.get('trusted', False))
+    snapshot = options.get('snapshot')
+    with profiler.stage('load'):
+        loaded = snapshot is not None and load_snapshot(data, main_file, snapshot)
+        if not loaded:
+            data, builder = load_budget(data, main_file, input_encoding, options)
+            profiler.queues.update(builder.queues)
+            profiler.loading.update(builder.times)
+    if options.get('memory_budget') is not None:
+        print(f'memory: {Memory.describe(data.memory())}')
+    if snapshot is not None and not loaded and not isinstance(data, SpillInformation.SpillInformation):
+        with profiler.stage('snapshot'):
+            Snapshot.save(data, main_file, snapshot)
+    return data
+
+
+def new_data(options):
+    """
+    :param options: dictionary of optional keys from .ini file
+    :return: empty instance of the class, chosen by keys 'backend' and 'engine'
+    """
+    if options.get('backend', 'objects') == 'columns':
+        return ColumnInformation.ColumnInformation(options.get('engine', 'python'))
+    if options.get('backend', 'objects') == 'spill':
+        return SpillInformation.SpillInformation(options.get('spill'),
+                                                 options.get('spill_rows', SpillInformation.SPILL_ROWS))
+    return Information.Information(options.get('streaming', False))
+
+
+def load_budget(data, main_file, input_encoding, options):
+    """
+    :param data: empty object of class, chosen by options
+    :param main_file: relative path to .csv file, glob pattern or list of them
+    :param input_encoding: type of encoding of main_file
+    :param options: dictionary of optional keys from .ini file
+    loads main_file like load_data(), if there is key 'memory_budget' (in MiB), memory of data is checked during
+    loading, if data needs more memory, it is freed and (with 'memory_action' 'degrade') main_file is loaded again
+    into more compact backend ("objects" -> "columns" -> "spill" with buffer of half of budget), otherwise
+    (or if backend is already "spill", or in quarantine mode, which needs backend "objects") error with sizes of
+    structures of data is raised, line about loading of main_file is printed only for the last backend
+    :return: loaded data (object of class of the last backend) and object of class Builder, which loaded it
+    """
+    backend = options.get('backend', 'objects')
+    workers = options.get('workers', 1)
+    parser = options.get('parser', 'fast')
+    budget = options.get('memory_budget')
+    quarantine = options.get('quarantine')
+    pipeline = options.get('pipeline')
+    if budget is None:
+        return data, load_data(data, main_file, input_encoding, workers, parser, quarantine=quarantine,
+                               pipeline=pipeline)
+    budget *= Memory.MIB
+    while True:
+        try:
+            data.clear()
+            obj = Builder.Builder(workers, parser, budget, quarantine, pipeline)
+            obj.load(data, main_file, input_encoding)
+        except Memory.BudgetExceeded as e:
+            backend = Memory.COMPACT.get(backend)
+            if options.get('memory_action', 'degrade') != 'degrade' or backend is None or quarantine is not None:
+                print(_input_csv(main_file), end='')
+                raise
+            print(f'{e}, backend "{backend}" is used')
+            if backend == 'spill':
+                workers = 1
+            data = new_data({**options, 'backend': backend, 'spill_rows': Memory.spill_rows(budget)})
+            continue
+        except BaseException:
+            print(_input_csv(main_file), end='')
+            raise
+        print(_input_csv(main_file), end='')
+        _print_loaded(obj, quarantine, pipeline)
+        return data, obj
+
+
+def load_data(data, main_file, input_encoding, workers=1, parser='fast', budget=None, quarantine=None,
+              pipeline=None):
+    """
+    :param data: object of class Information or ColumnInformation
+    :param main_file: relative path to .csv file, glob pattern or list of them
+    :param input_encoding: type of encoding of main_file
+    :param workers: quantity of processes, which process main_file
+    :param parser: 'fast' or 'csv' -- way of splitting lines of main_file
+    :param budget: the biggest quantity of bytes, which data can use, None if memory is not limited
+    :param quarantine: relative path to file for rejected rows, None if bad row stops loading
+    :param pipeline: size of queues between stages of pipelined loading, None to load by one thread
+    clears data, creates instance of the class Builder, pass parameters to Builder method and prints 'OK'
+    if there are no errors (with quantities of rejected rows by reasons in quarantine mode, with depth of queues
+    of stages in pipelined mode)
+    :return: object of class Builder with statistics of loading (times of stages of loading and queues of
+    pipelined stages)
+    """
+    print(_input_csv(main_file), end='')
+    data.clear()
+    obj = Builder.Builder(workers, parser, budget, quarantine, pipeline)
+    obj.load(data, main_file, input_encoding)
+    _print_loaded(obj, quarantine, pipeline)
+    return obj
+
+
+def _input_csv(main_file):
+    """
+    :param main_file: relative path to .csv file, glob pattern or list of them
+    :return: beginning of line about loading of main_file
+    """
+    return f'input-csv {main_file if isinstance(main_file, str) else ", ".join(main_file)}: '
+
+
+def _print_loaded(obj, quarantine=None, pipeline=None):
+    """
+    :param obj: object of class Builder, which has loaded .csv file
+    :param quarantine: relative path to file for rejected rows, None if bad row stops loading
+    :param pipeline: size of queues between stages of pipelined loading, None to load by one thread
+    prints 'OK' (with quantities of rejected rows by reasons in quarantine mode, with depth of queues of stages
+    in pipelined mode)
+    """
+    if pipeline is not None:
+        print(f'OK, queues: {Pipeline.describe(obj.queues)}')
+    elif quarantine is None:
+        print('OK')
+    else:
+        reasons = ', '.join(f'{reason}: {quantity}' for reason, quantity in obj.rejected.most_common())
+        print(f'OK, rejected {sum(obj.rejected.values())} rows to {quarantine}' + (f' ({reasons})' if reasons else ''))
+
+
+def load_snapshot(data, main_file, snapshot):
+    """
+    :param data: object of class Information or ColumnInformation
+    :param main_file: relative path to .csv file
+    :param snapshot: relative path to snapshot of data, loaded from main_file
+    clears data and loads snapshot instead of main_file, prints 'OK' if snapshot is proper
+    :return: True if snapshot is loaded, False if it is absent, stale or corrupted (then main_file has to be loaded)
+    """
+    data.clear()
+    if not Snapshot.load(data, main_file, snapshot):
+        return False
+    print(f'input-snapshot {snapshot}: OK')
+    return True
+
+
+def load_stat(additional_file, input_encoding, stat=None):
+    """
+    :param additional_file: relative path to .json file
+    :param input_encoding: type of encoding of additional_file
+    :param stat: future of read_stat(), which was called by other thread, None to call it now
+    prints result of reading additional_file
+    :return: dictionary loaded from additional_file
+    """
+    print(f'input-json {additional_file}: ', end='')
+    add_data = read_stat(additional_file, input_encoding) if stat is None else stat.result()
+    print('OK')
+    return add_data
+
+
+def read_stat(additional_file, input_encoding):
+    """
+    :param additional_file: relative path to .json file
+    :param input_encoding: type of encoding of additional_file
+    opens additional file, checks existence of needed keys and raises error if some key is absent
+    :return: dictionary loaded from additional_file
+    """
+    keys = ["сума довжин всіх прізвищ", "кількість записів"]
+    with open(additional_file, 'r', encoding=input_encoding) as f:
+        add_data = json.load(f)
+        for key in keys:
+            if key not in add_data:
+                raise ValueError('There are no needed keys in additional file')
+        add_data["surnames_sum"] = add_data.pop("сума довжин всіх прізвищ")
+        add_data["records_sum"] = add_data.pop("кількість записів")
+    return add_data
+
+
+def fit(data, add_data):
+    """
+    :param data: object of class Information
+    :param add_data: dictionary loaded from additional_file, returned in load_stat() function
+    checks accordance of data from additional_file to corresponding data in lst
+    :return: True if data is according, False otherwise
+    """
+    print('json?=csv: ', end='')
+    record_sum = data.records_sum
+    surname_sum = data.surnames_length
+    return surname_sum == add_data["surnames_sum"] and record_sum == add_data["records_sum"]
+
+
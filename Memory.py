@@ -0,0 +1,81 @@
+"""
+Module of Shtonda Yelizaveta, contains approximate sizes of structures of loaded data and functions for checking
+memory budget
+"""
+import sys
+import struct
+import Scores
+import Periods
+
+MIB = 1 << 20
+POINTER = struct.calcsize('P')
+GC_HEADER = 2 * POINTER
+INT = sys.getsizeof(1 << 20)
+NAMES = sys.getsizeof(('', '', ''))
+LIST = sys.getsizeof([])
+DICT = sys.getsizeof({})
+SET = sys.getsizeof(set())
+# entries of hash tables with their part of free space of table (dict is filled at most by 2/3 and has
+# index of entries, set is filled at most by 3/5)
+DICT_ENTRY = 3 * POINTER * 3 // 2 + 4
+SET_ENTRY = 2 * POINTER * 2
+# histogram of student usually contains few points
+HISTOGRAM = sys.getsizeof(Scores.Histogram({i: 1 for i in range(4)}))
+PERIODS = sys.getsizeof(Periods.Periods({i: 1 for i in range(4)}))
+# row of buffer of backend "spill": tuple of 9 fields, new strings of names and integers of year and number of row
+SPILL_ROW = sys.getsizeof((0,) * 9) + 3 * sys.getsizeof('Іваненко') + 2 * INT + POINTER
+ACTIONS = ('degrade', 'fail')
+COMPACT = {'objects': 'columns', 'columns': 'spill'}
+
+
+class BudgetExceeded(ValueError):
+    """
+    error, which is raised when loaded data needs more memory than budget
+    """
+
+
+def instance(cls):
+    """
+    :param cls: class with __slots__
+    :return: size of object of cls in bytes (with header of garbage collector)
+    """
+    return cls.__basicsize__ + GC_HEADER
+
+
+def total(usage):
+    """
+    :param usage: dictionary of sizes of structures like in method memory() of data
+    :return: size of all structures in bytes
+    """
+    return sum(usage.values())
+
+
+def describe(usage):
+    """
+    :param usage: dictionary of sizes of structures like in method memory() of data
+    :return: text with sizes of structures and their sum in MiB
+    """
+    parts = [f'{name} {size / MIB:.1f} MiB' for name, size in usage.items()]
+    return ', '.join(parts + [f'total {total(usage) / MIB:.1f} MiB'])
+
+
+def check(data, budget):
+    """
+    :param data: object of class Information, ColumnInformation or SpillInformation
+    :param budget: the biggest quantity of bytes, which data can use
+    counts approximate sizes of structures of data, if their sum is bigger than budget, raises error with them
+    :return: True
+    """
+    usage = data.memory()
+    if total(usage) > budget:
+        raise BudgetExceeded(f'Memory budget of {budget / MIB:.0f} MiB is exceeded: {describe(usage)}')
+    return True
+
+
+def spill_rows(budget):
+    """
+    :param budget: the biggest quantity of bytes, which data can use
+    :return: quantity of rows of buffer of backend "spill", which use half of budget (other half is left for
+    counters of problems and merging)
+    """
+    return max(budget // 2 // SPILL_ROW, 1024)
@@ -0,0 +1,81 @@
+"""
+Module of Shtonda Yelizaveta, contains functions which calculate statistics of ColumnInformation object with numpy
+"""
+import Scores
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def available():
+    """
+    :return: True if numpy is installed, False otherwise
+    """
+    return numpy is not None
+
+
+def counts(data):
+    """
+    :param data: object of class ColumnInformation
+    counts attempts and good attempts (60 points or more) of every problem in one pass over problem codes
+    :return: arrays of quantities of attempts and good attempts, array of True for problems with only good attempts
+    """
+    problems = numpy.frombuffer(data.problem_codes, dtype=numpy.uint32)
+    percents = numpy.frombuffer(data.percents, dtype=numpy.uint16)
+    attempts = numpy.bincount(problems, minlength=len(data.problems))
+    good = numpy.bincount(problems[percents >= Scores.PASS], minlength=len(data.problems))
+    return attempts, good, attempts == good
+
+
+def order(data, good_problems):
+    """
+    :param data: object of class ColumnInformation
+    :param good_problems: array of True for problems, which are printed
+    sorts attempts of printed problems by problem, surname, name, middle_name, percent in descending order
+    and year, attempts with equal keys keep order of their loading
+    :return: array of numbers of sorted attempts
+    """
+    problems = numpy.frombuffer(data.problem_codes, dtype=numpy.uint32)
+    students = numpy.frombuffer(data.student_codes, dtype=numpy.uint32)
+    percents = numpy.frombuffer(data.percents, dtype=numpy.uint16)
+    years = numpy.frombuffer(data.years, dtype=numpy.uint16)
+    ranks = numpy.array(data._students_ranks(), dtype=numpy.int64)
+    chosen = numpy.flatnonzero(good_problems[problems])
+    keys = (years[chosen], -percents[chosen].astype(numpy.int32), ranks[students[chosen]], problems[chosen])
+    return chosen[numpy.lexsort(keys)]
+
+
+def report(data, writer):
+    """
+    :param data: object of class ColumnInformation
+    :param writer: writer of some format from module Writers
+    passes the same information as ColumnInformation.report(), but calculates it with numpy,
+    sorted attempts are divided into problems and students with numpy
+    """
+    if not data.problems:
+        return
+    attempts, good, good_problems = counts(data)
+    chosen = order(data, good_problems)
+    problems = numpy.frombuffer(data.problem_codes, dtype=numpy.uint32)[chosen]
+    students = numpy.frombuffer(data.student_codes, dtype=numpy.uint32)[chosen]
+    percents = numpy.frombuffer(data.percents, dtype=numpy.uint16)[chosen].tolist()
+    years = numpy.frombuffer(data.years, dtype=numpy.uint16)[chosen].tolist()
+    new_problems = numpy.ones(len(chosen), dtype=bool)
+    new_problems[1:] = problems[1:] != problems[:-1]
+    new_students = new_problems.copy()
+    new_students[1:] |= students[1:] != students[:-1]
+    runs = numpy.cumsum(new_students) - 1
+    first_runs = runs[new_problems]
+    codes = (runs - first_runs[numpy.cumsum(new_problems) - 1]).tolist()
+    runs_students = students[new_students].tolist()
+    starts = numpy.flatnonzero(new_problems).tolist() + [len(chosen)]
+    first_runs = first_runs.tolist() + [len(runs_students)]
+    problems = problems[new_problems].tolist()
+    attempts = attempts.tolist()
+    good = good.tolist()
+    for k, i in enumerate(problems):
+        start, end = starts[k], starts[k + 1]
+        names = [data.students[j] for j in runs_students[first_runs[k]:first_runs[k + 1]]]
+        writer.problem(data.problems[i], attempts[i], good[i], round((good[i] / attempts[i]) * 100), names,
+                       codes[start:end], years[start:end], percents[start:end])
@@ -0,0 +1,94 @@
+"""
+Module of Shtonda Yelizaveta, contains class Periods, which counts attempts of problem by months, and functions
+for ranges of months
+"""
+import Scores
+
+MONTHS = 12
+GOOD = 1 << 32
+
+
+def parse(text, last=False):
+    """
+    :param text: period like '2020-01' or '2020' (the whole year)
+    :param last: True if period is the end of range (then year means its December)
+    checks format of period, in case of improper format raises error
+    :return: pair of year and month
+    """
+    parts = text.split('-')
+    if 1 <= len(parts) <= 2 and all(i.isdigit() for i in parts):
+        year = int(parts[0])
+        month = int(parts[1]) if len(parts) == 2 else MONTHS if last else 1
+        if 1 <= month <= MONTHS:
+            return year, month
+    raise ValueError('Period has to be year or year and month like 2020-01')
+
+
+def bounds(start=None, end=None):
+    """
+    :param start: the first month of range -- pair of year and month, None if range has no beginning
+    :param end: the last month of range -- pair of year and month, None if range has no end
+    checks months of range, in case of improper month raises error
+    :return: numbers of the first and the last months of range (like keys of Periods)
+    """
+    keys = []
+    for period, default in ((start, -1), (end, float('inf'))):
+        if period is None:
+            keys.append(default)
+            continue
+        if (not isinstance(period, tuple) or len(period) != 2 or not all(isinstance(i, int) for i in period)
+                or not 1 <= period[1] <= MONTHS):
+            raise ValueError('Period has to be pair of year and month')
+        keys.append(period[0] * MONTHS + period[1] - 1)
+    return keys[0], keys[1]
+
+
+class Periods(dict):
+    """
+    quantities of attempts and good attempts by months: key is year * MONTHS + month - 1, value keeps both
+    quantities in one integer (attempts + good attempts * GOOD), so statistics of any range of months are summed
+    from few counters without scanning attempts
+    """
+    __slots__ = ()
+
+    def add(self, year, month, percent, quantity=1):
+        """
+        :param year: year of attempt
+        :param month: month of attempt
+        :param percent: points of attempt
+        :param quantity: quantity of such attempts
+        adds attempts to counter of their month
+        """
+        period = year * MONTHS + month - 1
+        self[period] = self.get(period, 0) + (GOOD + 1 if percent >= Scores.PASS else 1) * quantity
+
+    def merge(self, other):
+        """
+        :param other: Periods object
+        adds counters of other to this object
+        """
+        for period, counts in other.items():
+            self[period] = self.get(period, 0) + counts
+
+    def counts(self, start=None, end=None):
+        """
+        :param start: the first month of range like in function bounds()
+        :param end: the last month of range like in function bounds()
+        :return: quantity of attempts, quantity of good attempts and percentage of good attempts (None if there
+        are no attempts) in range of months
+        """
+        low, high = bounds(start, end)
+        total = sum(counts for period, counts in self.items() if low <= period <= high)
+        attempts, good = total % GOOD, total // GOOD
+        return attempts, good, round((good / attempts) * 100) if attempts else None
+
+    def months(self, start=None, end=None):
+        """
+        :param start: the first month of range like in function bounds()
+        :param end: the last month of range like in function bounds()
+        :return: list of tuples of year, month, quantity of attempts and quantity of good attempts for every month
+        of range with attempts, in order of months
+        """
+        low, high = bounds(start, end)
+        return [(period // MONTHS, period % MONTHS + 1, counts % GOOD, counts // GOOD)
+                for period, counts in sorted(self.items()) if low <= period <= high]
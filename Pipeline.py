@@ -0,0 +1,252 @@
+"""
+Module of Shtonda Yelizaveta, contains classes for pipelined processing: bounded queues between stages, which
+count their depth, stages in separate threads and file, which is written by separate thread
+"""
+import time
+import queue
+import threading
+
+QUEUE_SIZE = 8
+WAIT = 0.1
+END = None
+
+
+def queue_size(value):
+    """
+    :param value: value of key "pipeline" of .ini file -- True, False, None or quantity of items in every queue
+    :return: quantity of items in every queue, None if pipeline is not used
+    """
+    if value is True:
+        return QUEUE_SIZE
+    return value or None
+
+
+def describe(info):
+    """
+    :param info: dictionary of statistics of queues like in method Pipeline.info()
+    :return: text with mean and the biggest depth of every queue and time of waiting of its stages
+    """
+    return ', '.join(f'{name} {i["mean_depth"]:.1f}/{i["size"]} (max {i["max_depth"]}, producer waited '
+                     f'{i["producer_wait"]:.2f} s, consumer waited {i["consumer_wait"]:.2f} s)'
+                     for name, i in info.items())
+
+
+class Stopped(Exception):
+    """
+    error, which stops stage, when other stage has failed
+    """
+
+
+class Channel:
+    """
+    bounded queue between two stages: producer waits when queue is full (so fast stage does not fill memory),
+    consumer waits when it is empty; depth of queue before every put and time of waiting of both stages are counted,
+    so the slowest stage can be found (queue before it is usually full, queue after it is usually empty)
+    """
+
+    def __init__(self, size, stop):
+        """
+        :param size: the biggest quantity of items in queue
+        :param stop: threading.Event, which is set when pipeline is stopped
+        """
+        self.queue = queue.Queue(size)
+        self.size = size
+        self.stop = stop
+        self.items = 0
+        self.depth = 0
+        self.max_depth = 0
+        self.full = 0
+        self.empty = 0
+        self.producer_wait = 0.0
+        self.consumer_wait = 0.0
+
+    def put(self, item):
+        """
+        :param item: item for the next stage, END after the last item or error of stage
+        puts item into queue, waits while queue is full, in case of stopped pipeline raises Stopped
+        """
+        depth = self.queue.qsize()
+        self.items += 1
+        self.depth += depth
+        self.max_depth = max(self.max_depth, depth)
+        if depth >= self.size:
+            self.full += 1
+        start = time.perf_counter()
+        while True:
+            try:
+                self.queue.put(item, timeout=WAIT)
+                break
+            except queue.Full:
+                if self.stop.is_set():
+                    raise Stopped()
+        self.producer_wait += time.perf_counter() - start
+
+    def get(self):
+        """
+        takes item from queue, waits while queue is empty, in case of stopped pipeline raises Stopped
+        :return: item
+        """
+        if self.queue.empty():
+            self.empty += 1
+        start = time.perf_counter()
+        while True:
+            try:
+                item = self.queue.get(timeout=WAIT)
+                break
+            except queue.Empty:
+                if self.stop.is_set():
+                    raise Stopped()
+        self.consumer_wait += time.perf_counter() - start
+        return item
+
+    def __iter__(self):
+        """
+        takes items until END, error of previous stage is raised again
+        :return: generator of items
+        """
+        while True:
+            item = self.get()
+            if item is END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    def info(self):
+        """
+        :return: dictionary with size of queue, quantity of items, mean and the biggest depth of queue before put,
+        quantities of puts into full queue and gets from empty queue, time of waiting of producer and consumer
+        """
+        return {'size': self.size, 'items': self.items, 'mean_depth': self.depth / self.items if self.items else 0.0,
+                'max_depth': self.max_depth, 'full': self.full, 'empty': self.empty,
+                'producer_wait': self.producer_wait, 'consumer_wait': self.consumer_wait}
+
+
+class Pipeline:
+    """
+    chain of stages, every stage runs in separate thread and passes its items to the next stage through Channel,
+    items of the last stage are taken by caller; error of stage is passed through queues and raised by caller,
+    when caller leaves pipeline (after error too), all stages are stopped
+    """
+
+    def __init__(self, size=QUEUE_SIZE):
+        """
+        :param size: the biggest quantity of items in every queue
+        """
+        self.size = size
+        self.stop = threading.Event()
+        self.threads = []
+        self.channels = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        :param exc_type: error class
+        :param exc_val: error instance
+        :param exc_tb: trace object
+        stops all stages and waits for their threads
+        """
+        self.stop.set()
+        for thread in self.threads:
+            thread.join()
+
+    def stage(self, name, items):
+        """
+        :param name: name of stage
+        :param items: generator of items of stage (it can take items of previous stage), it is run in new thread
+        :return: iterator of items of stage for the next stage or caller
+        """
+        channel = Channel(self.size, self.stop)
+        self.channels[name] = channel
+        thread = threading.Thread(target=self._run, args=(items, channel), name=name, daemon=True)
+        self.threads.append(thread)
+        thread.start()
+        return iter(channel)
+
+    def info(self):
+        """
+        :return: dictionary of statistics of queues of this pipeline by names of stages, which put items into them
+        """
+        return {name: channel.info() for name, channel in self.channels.items()}
+
+    @staticmethod
+    def _run(items, channel):
+        """
+        :param items: generator of items of stage
+        :param channel: Channel to the next stage
+        puts all items and END into channel, in case of error puts error instead of END
+        """
+        try:
+            for item in items:
+                channel.put(item)
+            channel.put(END)
+        except Stopped:
+            pass
+        except BaseException as b:
+            try:
+                channel.put(b)
+            except Stopped:
+                pass
+        finally:
+            items.close()
+
+
+class QueuedFile:
+    """
+    file object, which passes written pieces to separate thread (stage 'write') through Channel, so next pieces
+    are prepared while previous ones are written to disk
+    """
+
+    def __init__(self, f, size=QUEUE_SIZE):
+        """
+        :param f: opened file object
+        :param size: the biggest quantity of pieces in queue
+        """
+        self.f = f
+        self.stop = threading.Event()
+        self.channel = Channel(size, self.stop)
+        self.error = None
+        self.thread = threading.Thread(target=self._write, name='write', daemon=True)
+        self.thread.start()
+
+    def _write(self):
+        """
+        writes pieces from queue until END, in case of error keeps it and stops writing
+        """
+        try:
+            for piece in self.channel:
+                self.f.write(piece)
+        except BaseException as b:
+            self.error = b
+            self.stop.set()
+
+    def info(self):
+        """
+        :return: dictionary of statistics of queue of stage 'write' like in method Pipeline.info()
+        """
+        return {'write': self.channel.info()}
+
+    def write(self, piece):
+        """
+        :param piece: text or bytes for file
+        passes piece to thread of writing, error of writing is raised again
+        """
+        try:
+            self.channel.put(piece)
+        except Stopped:
+            raise self.error
+
+    def close(self):
+        """
+        waits until all pieces are written and closes file, error of writing is raised again
+        """
+        try:
+            if not self.stop.is_set():
+                self.channel.put(END)
+            self.thread.join()
+        finally:
+            self.f.close()
+        if self.error is not None:
+            raise self.error
@@ -0,0 +1,202 @@
+"""
+Module of Shtonda Yelizaveta, contains class Profiler, which measures stages of program and writes report in .json
+"""
+import io
+import os
+import sys
+import json
+import time
+import pstats
+import cProfile
+import tracemalloc
+import Validation
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+STAGES = ('load_ini', 'load', 'snapshot', 'fit', 'output')
+CAPTURES = ('cprofile', 'tracemalloc')
+TOP = 20
+
+
+def peak_memory():
+    """
+    :return: the biggest quantity of memory (in bytes), used by current process, None if it is unknown
+    (module resource is absent on Windows)
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def cpu_time():
+    """
+    :return: CPU time of current process and its finished child processes (workers), in seconds
+    """
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+def check_settings(settings):
+    """
+    :param settings: dictionary of section "profile" of .ini file
+    checks values of keys "capture" and "stage", in case of improper value raises error
+    :return: True
+    """
+    if not isinstance(settings, dict):
+        raise ValueError('Something wrong with profile keys in .ini file')
+    if settings.get('capture') not in (None,) + CAPTURES or settings.get('stage', 'load') not in STAGES:
+        raise ValueError('Something wrong with profile keys in .ini file')
+    return True
+
+
+class Profiler:
+    """
+    measures wall and CPU time of every stage (it is cheap, so it is done always), if profiling is enabled,
+    makes report with times, times of parsing, checking and aggregating of rows, speed of loading, counters of
+    loaded data, hit rates of validation caches and peak memory, can run cProfile or tracemalloc during one stage
+    """
+
+    def __init__(self, settings=None):
+        """
+        :param settings: None to disable profiling, otherwise dictionary with optional keys "report" (path to
+        .json file, report is printed if it is absent), "capture" ('cprofile' or 'tracemalloc'), "stage" (stage for
+        capture, 'load' by default), "top" (quantity of lines of capture) and "dump" (path to file for
+        statistics of cProfile)
+        """
+        self.enabled = False
+        self.settings = {}
+        self.stages = {}
+        self.capture = None
+        self.running = None
+        self.queues = {}
+        self.loading = {}
+        self.configure(settings)
+
+    def configure(self, settings):
+        """
+        :param settings: dictionary of settings like in constructor, None changes nothing
+        enables profiling, settings which have already been given (from command line) are kept
+        """
+        if settings is not None:
+            self.enabled = True
+            self.settings = {**settings, **self.settings}
+
+    def stage(self, name):
+        """
+        :param name: name of stage from STAGES
+        :return: context manager, which measures time of stage
+        """
+        return _Stage(self, name)
+
+    def _start_capture(self, name):
+        """
+        :param name: name of stage, which is started
+        starts cProfile or tracemalloc, if they are asked for this stage
+        """
+        if not self.enabled or self.settings.get('capture') is None or self.settings.get('stage', 'load') != name:
+            return
+        if self.settings['capture'] == 'cprofile':
+            self.running = cProfile.Profile()
+            self.running.enable()
+        else:
+            tracemalloc.start()
+            self.running = tracemalloc
+
+    def _stop_capture(self, name):
+        """
+        :param name: name of stage, which is finished
+        stops capture of this stage and keeps its top lines for report
+        """
+        if self.running is None:
+            return
+        running, self.running = self.running, None
+        top = self.settings.get('top', TOP)
+        if running is tracemalloc:
+            statistics = tracemalloc.take_snapshot().statistics('lineno')[:top]
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.capture = {'tool': 'tracemalloc', 'stage': name, 'peak': peak,
+                            'top': [{'line': str(i.traceback), 'size': i.size, 'count': i.count} for i in statistics]}
+            return
+        running.disable()
+        if self.settings.get('dump'):
+            running.dump_stats(self.settings['dump'])
+        text = io.StringIO()
+        pstats.Stats(running, stream=text).sort_stats('cumulative').print_stats(top)
+        self.capture = {'tool': 'cprofile', 'stage': name, 'top': text.getvalue().splitlines()}
+
+    def report(self, data=None):
+        """
+        :param data: loaded object of class Information or ColumnInformation, None if loading failed
+        :return: dictionary with times of stages, times of parsing, checking and aggregating of rows during stage
+        'load' (summed for workers), speed of loading, counters of records and objects of data, hit rates of
+        validation caches, peak memory, approximate sizes of structures of data, depth of queues of pipelined stages
+        and capture
+        """
+        counters = data.counters() if data is not None else {}
+        load = self.stages.get('load', {}).get('wall')
+        rows = counters.get('rows')
+        caches = {}
+        for name, info in Validation.cache_info().items():
+            calls = info['hits'] + info['misses']
+            caches[name] = {'hits': info['hits'], 'misses': info['misses'],
+                            'hit_rate': info['hits'] / calls if calls else None}
+        return {'stages': self.stages, 'loading': self.loading,
+                'rows_per_second': rows / load if rows and load else None, 'counters': counters,
+                'validation': caches, 'trusted': Validation.trusted,
+                'peak_memory': peak_memory(), 'memory': data.memory() if data is not None else None,
+                'queues': self.queues, 'capture': self.capture}
+
+    def finish(self, data=None):
+        """
+        :param data: loaded object of class Information or ColumnInformation, None if loading failed
+        if profiling is enabled, writes report into .json file or prints it
+        """
+        if not self.enabled:
+            return
+        text = json.dumps(self.report(data), indent=4, ensure_ascii=False)
+        if self.settings.get('report'):
+            with open(self.settings['report'], 'w', encoding='utf8') as f:
+                f.write(text)
+            print(f'profile {self.settings["report"]}: OK')
+        else:
+            print(text)
+
+
+class _Stage:
+    """
+    context manager of one stage of Profiler
+    """
+    __slots__ = ('profiler', 'name', 'wall', 'cpu')
+
+    def __init__(self, profiler, name):
+        """
+        :param profiler: object of class Profiler
+        :param name: name of stage
+        """
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler._start_capture(self.name)
+        self.wall = time.perf_counter()
+        self.cpu = cpu_time()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        :param exc_type: error class
+        :param exc_val: error instance
+        :param exc_tb: trace object
+        adds time of stage to times of the same stage and stops capture
+        """
+        wall = time.perf_counter() - self.wall
+        cpu = cpu_time() - self.cpu
+        self.profiler._stop_capture(self.name)
+        times = self.profiler.stages.setdefault(self.name, {'wall': 0.0, 'cpu': 0.0})
+        times['wall'] += wall
+        times['cpu'] += cpu
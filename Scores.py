@@ -0,0 +1,95 @@
+"""
+Module of Shtonda Yelizaveta, contains class Histogram, which counts attempts by points, and constants of points
+"""
+
+PASS = 60
+MAX_PERCENT = 100
+
+
+def check_threshold(threshold):
+    """
+    :param threshold: points, which attempt has to reach to pass, or percentage of attempts
+    checks that threshold is integer from 0 to MAX_PERCENT, in case of improper value raises error
+    :return: True
+    """
+    if not isinstance(threshold, int) or not 0 <= threshold <= MAX_PERCENT:
+        raise ValueError('Threshold has to be integer from 0 to 100')
+    return True
+
+
+class Histogram(dict):
+    """
+    quantities of attempts by their points (only points, which were got, are stored, so histogram of student is
+    small), sums of attempts with points not less than every value are calculated at the first query after changes,
+    so queries do not scan attempts
+    """
+    __slots__ = ('suffix',)
+
+    def __init__(self, *args):
+        """
+        :param args: optional dictionary of points and quantities
+        """
+        super().__init__(*args)
+        self.suffix = None
+
+    def __reduce__(self):
+        return Histogram, (dict(self),)
+
+    def add(self, percent, quantity=1):
+        """
+        :param percent: points of attempt
+        :param quantity: quantity of such attempts
+        adds attempts to histogram
+        """
+        self[percent] = self.get(percent, 0) + quantity
+
+    def merge(self, other):
+        """
+        :param other: Histogram object
+        adds quantities of other to this histogram
+        """
+        for percent, quantity in other.items():
+            self.add(percent, quantity)
+
+    def total(self):
+        """
+        :return: quantity of all attempts
+        """
+        return sum(self.values())
+
+    def at_least(self, threshold=PASS):
+        """
+        :param threshold: points from 0 to MAX_PERCENT
+        :return: quantity of attempts with threshold points or more
+        """
+        check_threshold(threshold)
+        total = self.total()
+        if self.suffix is None or self.suffix[0] != total:
+            suffix = [0] * (MAX_PERCENT + 2)
+            for percent in range(MAX_PERCENT, -1, -1):
+                suffix[percent] = suffix[percent + 1] + self.get(percent, 0)
+            self.suffix = suffix
+        return self.suffix[threshold]
+
+    def percentage(self, threshold=PASS):
+        """
+        :param threshold: points from 0 to MAX_PERCENT
+        :return: percent of attempts with threshold points or more to all attempts, None if there are no attempts
+        """
+        total = self.total()
+        return round((self.at_least(threshold) / total) * 100) if total else None
+
+    def passes(self, threshold=PASS, part=MAX_PERCENT):
+        """
+        :param threshold: points from 0 to MAX_PERCENT
+        :param part: percent of attempts from 0 to MAX_PERCENT
+        :return: True if at least part percent of attempts have threshold points or more
+        """
+        total = self.total()
+        return total > 0 and self.at_least(threshold) * MAX_PERCENT >= part * total
+
+    def dense(self):
+        """
+        :return: list of quantities of attempts for every points from 0 to MAX_PERCENT
+        """
+        return [self.get(percent, 0) for percent in range(MAX_PERCENT + 1)]
@@ -0,0 +1,364 @@
+"""
+Module of Shtonda Yelizaveta, contains class Service -- local HTTP server, which keeps loaded data in memory
+and answers requests about it
+"""
+import io
+import os
+import json
+import asyncio
+from urllib.parse import urlsplit, parse_qs, unquote
+from concurrent.futures import ThreadPoolExecutor
+import Loading
+import Builder
+import Writers
+import Scores
+import Periods
+
+HOST = '127.0.0.1'
+TYPES = {'tsv': 'text/tab-separated-values', 'jsonl': 'application/jsonl', 'binary': 'application/octet-stream'}
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 500: 'Internal Server Error',
+           503: 'Service Unavailable'}
+
+
+class Service:
+    """
+    loads data of every .ini file once, answers GET requests from many clients at once:
+    /datasets -- list of datasets, /report/<dataset>?format=tsv -- output of dataset (like output file),
+    /problem/<dataset>?cond= -- quantities of attempts of problem, /student/<dataset>?name=&surname=&middle_name= --
+    attempts of student, /problems/<dataset>?threshold=60&part=100 -- conditions of problems, where at least part
+    percent of attempts have threshold points or more (/problem and /student also take threshold and answer
+    quantity of such attempts and histogram of points), /periods/<dataset>?from=2020-01&to=2021&cond= --
+    quantities of attempts of problems (or of one problem by months) in range of months; rendering of reports and
+    loading are done in threads, so event loop is never blocked, dataset is loaded again in background when its
+    .ini, .csv or .json file is changed (old data is answered until new data is loaded)
+    """
+
+    def __init__(self, paths, interval=1.0, workers=None):
+        """
+        :param paths: list of relative paths to .ini files, name of dataset is name of .ini file without extension
+        :param interval: quantity of seconds between checks of files of datasets
+        :param workers: quantity of threads for rendering and loading, by default quantity of CPU
+        """
+        self.datasets = {}
+        for path in paths:
+            name = os.path.splitext(os.path.basename(path))[0]
+            if name in self.datasets:
+                raise ValueError('Names of .ini files have to be different')
+            self.datasets[name] = _Dataset(path)
+        self.interval = interval
+        self.pool = ThreadPoolExecutor(workers or os.cpu_count() or 1)
+        self.lock = None
+
+    async def start(self, address):
+        """
+        :param address: port of HTTP server on HOST or path to Unix socket
+        loads all datasets and starts server
+        :return: asyncio server
+        """
+        self.lock = asyncio.Lock()
+        for dataset in self.datasets.values():
+            await self.reload(dataset)
+        if isinstance(address, int):
+            return await asyncio.start_server(self._handle, HOST, address)
+        return await asyncio.start_unix_server(self._handle, address)
+
+    async def serve(self, address):
+        """
+        :param address: port of HTTP server on HOST or path to Unix socket
+        starts server and checks files of datasets every interval seconds until program is stopped
+        """
+        server = await self.start(address)
+        print(f'serve {address}: OK')
+        async with server:
+            while True:
+                await asyncio.sleep(self.interval)
+                for dataset in self.datasets.values():
+                    if dataset.changed():
+                        await self.reload(dataset)
+
+    async def reload(self, dataset):
+        """
+        :param dataset: object of class _Dataset
+        loads dataset in thread (datasets are loaded one by one, because module Validation is shared), in case
+        of error keeps previous data and prints proper information
+        """
+        async with self.lock:
+            stamp = dataset.stamp()
+            try:
+                keys, data, stamp = await asyncio.get_running_loop().run_in_executor(self.pool, dataset.load)
+            except asyncio.CancelledError:
+                raise
+            except BaseException as b:
+                dataset.error = str(b)
+                dataset.files = stamp
+                print('\n***** program aborted *****')
+                print(b)
+                return
+            dataset.keys, dataset.data, dataset.files = keys, data, stamp
+            dataset.error = None
+            dataset.version += 1
+            dataset.reports = {}
+
+    async def _handle(self, reader, writer):
+        """
+        :param reader: asyncio stream of request
+        :param writer: asyncio stream of answer
+        reads HTTP request, answers it and closes connection
+        """
+        try:
+            line = (await reader.readline()).decode('latin-1')
+            while (await reader.readline()).strip():
+                pass
+            method, target = (line.split() + ['', ''])[:2]
+            if method != 'GET':
+                status, content_type, body = _error(405, 'Only GET is supported')
+            else:
+                try:
+                    status, content_type, body = await self._answer(target)
+                except Exception as e:
+                    status, content_type, body = _error(500, str(e))
+            writer.write(f'HTTP/1.1 {status} {REASONS[status]}\r\nContent-Type: {content_type}\r\n'
+                         f'Content-Length: {len(body)}\r\nConnection: close\r\n\r\n'.encode('latin-1'))
+            writer.write(body)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _answer(self, target):
+        """
+        :param target: path and query of request
+        :return: HTTP status, type of content and body of answer
+        """
+        url = urlsplit(target)
+        parts = [unquote(i) for i in url.path.strip('/').split('/')]
+        query = {i: j[0] for i, j in parse_qs(url.query).items()}
+        if parts == ['datasets']:
+            return _json({i: j.information() for i, j in self.datasets.items()})
+        if len(parts) != 2 or parts[0] not in ('report', 'problem', 'student', 'problems', 'periods'):
+            return _error(404, 'Unknown request')
+        dataset = self.datasets.get(parts[1])
+        if dataset is None:
+            return _error(404, 'Unknown dataset')
+        if dataset.data is None:
+            return _error(503, dataset.error)
+        if parts[0] == 'report':
+            output_format = query.get('format', dataset.keys[5]['format'])
+            if output_format not in Writers.FORMATS:
+                return _error(400, 'Unknown format')
+            return 200, _content_type(output_format, dataset.keys[4]), await self._report(dataset, output_format)
+        data = dataset.data
+        loop = asyncio.get_running_loop()
+        if parts[0] == 'periods':
+            return await self._periods(data, query)
+        try:
+            threshold = int(query.get('threshold', Scores.PASS))
+            part = int(query.get('part', Scores.MAX_PERCENT))
+            Scores.check_threshold(threshold)
+            Scores.check_threshold(part)
+        except ValueError:
+            return _error(400, 'Parameters threshold and part have to be integers from 0 to 100')
+        if parts[0] == 'problems':
+            return _json({'problems': await loop.run_in_executor(self.pool, data.passing_problems, threshold, part)})
+        if parts[0] == 'problem':
+            if 'cond' not in query:
+                return _error(400, 'Parameter cond is needed')
+            counts = await loop.run_in_executor(self.pool, data.problem_counts, query['cond'])
+            if counts is None:
+                return _error(404, 'Unknown problem')
+            answer = dict(zip(('cond', 'attempts_num', 'good_attempts_num', 'percentage'), (query['cond'],) + counts))
+            scores = await loop.run_in_executor(self.pool, data.problem_scores, query['cond'])
+            return _json({**answer, **_scores(scores, threshold)})
+        if not {'name', 'surname', 'middle_name'} <= set(query):
+            return _error(400, 'Parameters name, surname and middle_name are needed')
+        names = query['name'], query['surname'], query['middle_name']
+        try:
+            scores = await loop.run_in_executor(self.pool, data.student_scores, *names)
+            attempts = await loop.run_in_executor(self.pool, data.student_attempts, *names)
+        except ValueError as e:
+            return _error(400, str(e))
+        if scores is None:
+            return _error(404, 'Unknown student')
+        answer = {'attempts': [dict(zip(('cond', 'year', 'month', 'day', 'percent'), i)) for i in attempts]}
+        return _json({**answer, **_scores(scores, threshold)})
+
+    async def _periods(self, data, query):
+        """
+        :param data: loaded object of class Information or ColumnInformation
+        :param query: parameters of request /periods -- optional from, to (like '2020-01' or '2020') and cond
+        :return: HTTP status, type of content and body of answer
+        """
+        try:
+            start = Periods.parse(query['from']) if 'from' in query else None
+            end = Periods.parse(query['to'], True) if 'to' in query else None
+        except ValueError as e:
+            return _error(400, str(e))
+        loop = asyncio.get_running_loop()
+        fields = ('cond', 'attempts_num', 'good_attempts_num', 'percentage')
+        if 'cond' not in query:
+            report = await loop.run_in_executor(self.pool, data.period_report, start, end)
+            return _json({'problems': [dict(zip(fields, i)) for i in report]})
+        periods = await loop.run_in_executor(self.pool, data.problem_periods, query['cond'])
+        if periods is None:
+            return _error(404, 'Unknown problem')
+        months = [dict(zip(('year', 'month', 'attempts_num', 'good_attempts_num'), i))
+                  for i in periods.months(start, end)]
+        return _json({**dict(zip(fields, (query['cond'],) + periods.counts(start, end))), 'months': months})
+
+    async def _report(self, dataset, output_format):
+        """
+        :param dataset: loaded object of class _Dataset
+        :param output_format: 'tsv', 'jsonl' or 'binary'
+        renders report in thread once for every version of dataset, clients asking for the same report
+        wait for the same rendering
+        :return: body of report
+        """
+        task = dataset.reports.get(output_format)
+        if task is None:
+            task = asyncio.get_running_loop().run_in_executor(
+                self.pool, render, dataset.data, output_format, dataset.keys[4])
+            dataset.reports[output_format] = task
+        return await asyncio.shield(task)
+
+
+class _Dataset:
+    """
+    stores keys of .ini file, loaded data, rendered reports and times of modification of files of one dataset
+    """
+
+    def __init__(self, path):
+        """
+        :param path: relative path to .ini file
+        """
+        self.path = path
+        self.keys = None
+        self.data = None
+        self.error = None
+        self.files = None
+        self.version = 0
+        self.reports = {}
+
+    def stamp(self):
+        """
+        :return: sizes and times of modification of .ini file and files from it like in function _stamp()
+        """
+        return _stamp([self.path] if self.keys is None else _files(self.path, self.keys))
+
+    def changed(self):
+        """
+        :return: True if some file of dataset was changed since the last loading
+        """
+        return self.stamp() != self.files
+
+    def load(self):
+        """
+        opens .ini file and loads data from its files like function main.process()
+        :return: keys of .ini file, loaded object of class Information or ColumnInformation and sizes and
+        times of modification of files before loading
+        """
+        print(f'ini {self.path}: ', end='')
+        keys = Loading.load_ini(self.path)
+        stamp = _stamp(_files(self.path, keys))
+        return keys, Loading.load(*keys[:3], keys[5]), stamp
+
+    def information(self):
+        """
+        :return: dictionary with information about dataset for request /datasets
+        """
+        return {'ini': self.path, 'version': self.version, 'error': self.error,
+                'records': None if self.data is None else self.data.records_sum}
+
+
+def _files(path, keys):
+    """
+    :param path: relative path to .ini file
+    :param keys: keys of .ini file like in function Loading.load_ini()
+    :return: list of relative paths to .ini file, .csv files (all files of glob pattern, so new file is noticed)
+    and .json file
+    """
+    try:
+        files = Builder.input_files(keys[0])
+    except OSError:
+        files = []
+    return [path] + files + [keys[1]]
+
+
+def _stamp(paths):
+    """
+    :param paths: list of relative paths to files
+    :return: list of sizes and times of modification of files (None for absent file)
+    """
+    stamps = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            stamps.append((stat.st_size, stat.st_mtime_ns))
+        except OSError:
+            stamps.append(None)
+    return stamps
+
+
+def render(data, output_format, output_encoding):
+    """
+    :param data: loaded object of class Information or ColumnInformation
+    :param output_format: 'tsv', 'jsonl' or 'binary'
+    :param output_encoding: type of encoding of text formats
+    :return: report of data in bytes
+    """
+    f = io.BytesIO() if output_format == 'binary' else io.StringIO()
+    writer = Writers.FORMATS[output_format](f)
+    data.report(writer)
+    writer.flush()
+    if output_format == 'binary':
+        return f.getvalue()
+    return f.getvalue().encode(output_encoding)
+
+
+def _scores(scores, threshold):
+    """
+    :param scores: histogram of points of problem or student
+    :param threshold: points, which attempt has to reach to pass
+    :return: dictionary with threshold, quantity and percentage of attempts with threshold points or more and
+    histogram of points
+    """
+    return {'threshold': threshold, 'passed': scores.at_least(threshold),
+            'passed_percentage': scores.percentage(threshold), 'scores': scores.dense()}
+
+
+def _content_type(output_format, output_encoding):
+    """
+    :param output_format: 'tsv', 'jsonl' or 'binary'
+    :param output_encoding: type of encoding of text formats
+    :return: HTTP type of content of report
+    """
+    if output_format == 'binary':
+        return TYPES[output_format]
+    return f'{TYPES[output_format]}; charset={output_encoding}'
+
+
+def _json(value):
+    """
+    :param value: answer of request
+    :return: HTTP status, type of content and body in JSON format
+    """
+    return 200, 'application/json; charset=utf-8', json.dumps(value, ensure_ascii=False).encode('utf-8')
+
+
+def _error(status, text):
+    """
+    :param status: HTTP status of error
+    :param text: information about error
+    :return: HTTP status, type of content and body in JSON format
+    """
+    return status, 'application/json; charset=utf-8', json.dumps({'error': text}, ensure_ascii=False).encode('utf-8')
+
+
+def serve(paths, address, interval=1.0):
+    """
+    :param paths: list of relative paths to .ini files
+    :param address: port of HTTP server on HOST or path to Unix socket
+    :param interval: quantity of seconds between checks of files of datasets
+    runs Service until program is stopped
+    """
+    asyncio.run(Service(paths, interval).serve(address))
@@ -0,0 +1,407 @@
+"""
+Module of Shtonda Yelizaveta, contains functions for saving loaded data into binary snapshot and loading it back
+"""
+import os
+import gc
+import sys
+import struct
+import hashlib
+from array import array
+from itertools import accumulate, repeat
+import Builder
+import Validation
+import Information
+import ColumnInformation
+import Scores
+import Periods
+
+MAGIC = b'INFSNAP\0'
+VERSION = 8
+HEADER = struct.Struct('<8sHQ32s32s')
+BLOCK = struct.Struct('<cQ')
+SETTINGS = ('streaming', 'engine')
+COLUMNS = ('attemptes_num', 'good_attemptes_num', 'problem_codes', 'student_codes', 'percents', 'years', 'months',
+           'days')
+DROPPED = 1
+ORDERED = 2
+
+
+def file_stat(main_file):
+    """
+    :param main_file: relative path to .csv file, glob pattern or list of them
+    :return: list of files of main_file and sum of their sizes
+    """
+    files = Builder.input_files(main_file)
+    return files, sum(os.path.getsize(i) for i in files)
+
+
+def file_key(main_file):
+    """
+    :param main_file: relative path to .csv file, glob pattern or list of them
+    :return: size and sha256 hash of files of main_file (like in function file_stat(), hash of all files in order
+    of loading)
+    """
+    files, size = file_stat(main_file)
+    digest = hashlib.sha256()
+    for path in files:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return size, digest.digest()
+
+
+def _mode(data):
+    """
+    :param data: object of class Information or ColumnInformation
+    :return: list of strings with name of class, its settings, state of checks of fields and order of bytes,
+    snapshot can be loaded only into object with the same mode (snapshot of trusted data is not loaded, when
+    fields have to be checked, columns are written in order of bytes of machine)
+    """
+    return [type(data).__name__, *(f'{i}={getattr(data, i)}' for i in SETTINGS if i in vars(data)),
+            f'trusted={Validation.trusted}', sys.byteorder]
+
+
+def save(data, main_file, path):
+    """
+    :param data: loaded object of class Information or ColumnInformation
+    :param main_file: relative path to .csv file, from which data was loaded
+    :param path: relative path to snapshot file
+    writes header (version, key of main_file and sha256 hash of blocks) and blocks of mode and fields of data
+    (without settings and caches) to temporary file and replaces snapshot with it, if snapshot can not be written
+    (or trusted fields do not fit into columns), nothing happens
+    """
+    size, digest = file_key(main_file)
+    temporary = f'{path}.{os.getpid()}.tmp'
+    try:
+        with open(temporary, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, size, digest, bytes(32)))
+            payload = _Writer(f)
+            payload.strings(_mode(data))
+            if isinstance(data, ColumnInformation.ColumnInformation):
+                _save_columns(data, payload)
+            else:
+                _save_objects(data, payload)
+            f.seek(HEADER.size - 32)
+            f.write(payload.digest.digest())
+        os.replace(temporary, path)
+    except (OSError, OverflowError):
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def load(data, main_file, path):
+    """
+    :param data: empty object of class Information or ColumnInformation
+    :param main_file: relative path to .csv file
+    :param path: relative path to snapshot file
+    checks that snapshot has proper version, was made from main_file of the same size and from the same content
+    (hash of main_file is always compared), blocks are not damaged (their hash is the same as in header) and
+    data has the same mode, and loads fields into data (blocks keep only numbers and strings, so damaged snapshot
+    can not run code, improper sizes and codes of blocks are found), garbage collector is stopped while
+    objects of problems, students and attempts are created
+    :return: True if snapshot is loaded, False if it is absent, stale or corrupted
+    """
+    collect = gc.isenabled()
+    gc.disable()
+    try:
+        with open(path, 'rb') as f:
+            magic, version, size, digest, payload_digest = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION or size != file_stat(main_file)[1]:
+                return False
+            if digest != file_key(main_file)[1]:
+                return False
+            payload = f.read()
+        if hashlib.sha256(payload).digest() != payload_digest:
+            return False
+        reader = _Reader(payload)
+        if reader.strings() != _mode(data):
+            return False
+        if isinstance(data, ColumnInformation.ColumnInformation):
+            state = _load_columns(reader)
+        else:
+            state = _load_objects(reader)
+        if reader.offset != len(payload):
+            return False
+    except Exception:
+        return False
+    finally:
+        if collect:
+            gc.enable()
+    vars(data).update(state)
+    return True
+
+
+def _save_columns(data, payload):
+    """
+    :param data: loaded object of class ColumnInformation
+    :param payload: _Writer object
+    writes quantities of records and lengths of surnames, conditions of problems, names of students and columns
+    """
+    payload.array(array('Q', [data.records_sum, data.surnames_length]))
+    payload.strings(data.problems)
+    payload.strings([j for i in data.students for j in i])
+    for name in COLUMNS:
+        payload.array(getattr(data, name))
+
+
+def _load_columns(reader):
+    """
+    :param reader: _Reader object after block of mode
+    reads blocks written by function _save_columns() and checks that columns have proper lengths and codes
+    :return: dictionary of fields of ColumnInformation object
+    """
+    records_sum, surnames_length = reader.array('Q', 2)
+    problems = reader.strings()
+    students = _names(reader.strings())
+    state = {name: reader.array(typecode) for name, typecode in zip(COLUMNS, 'IIIIHHBB')}
+    if len(state['attemptes_num']) != len(problems) or len(state['good_attemptes_num']) != len(problems):
+        raise ValueError('Improper quantity of counters of problems')
+    if len({len(state[i]) for i in COLUMNS[2:]}) != 1:
+        raise ValueError('Columns have different lengths')
+    if max(state['problem_codes'], default=-1) >= len(problems) or \
+            max(state['student_codes'], default=-1) >= len(students):
+        raise ValueError('Improper code in columns')
+    return {'records_sum': records_sum, 'surnames_length': surnames_length,
+            'problems': problems, 'problems_names': dict(zip(problems, range(len(problems)))),
+            'students': students, 'students_names': dict(zip(students, range(len(students)))),
+            **state, '_scores': None, '_periods': None}
+
+
+def _save_objects(data, payload):
+    """
+    :param data: loaded object of class Information
+    :param payload: _Writer object
+    writes quantities of records and lengths of surnames, registry of students (names, histograms and problems),
+    problems (conditions, flags, counters, histograms and counters of months), students of problems in order of
+    their lists (codes and counters of attempts) and attempts of these students in columns
+    """
+    payload.array(array('Q', [data.records_sum, data.surnames_length]))
+    payload.strings([j for i in data.students for j in i])
+    _save_histograms(payload, data.students_scores)
+    payload.array(array('I', map(len, data.students_problems)))
+    payload.array(array('I', [j for i in data.students_problems for j in i]))
+    problems = data.problems
+    payload.strings([i.cond for i in problems])
+    payload.array(array('B', [(DROPPED if i.students is None else 0) | (ORDERED if i.ordered else 0)
+                              for i in problems]))
+    payload.array(array('I', [i._attempt_num() for i in problems]))
+    payload.array(array('I', [i._good_attempt_num() for i in problems]))
+    _save_histograms(payload, [i.scores for i in problems])
+    payload.array(array('I', map(len, [i.periods for i in problems])))
+    payload.array(array('I', [j for i in problems for j in i.periods]))
+    payload.array(array('Q', [j for i in problems for j in i.periods.values()]))
+    orders = [() if i.order is None else i.order for i in problems]
+    codes = []
+    for problem, order in zip(problems, orders):
+        if order:
+            index = {id(student): code for code, student in problem.students.items()}
+            codes.extend(index[id(i)] for i in order)
+    students = [j for i in orders for j in i]
+    attempts = [j for i in students for j in i.attempts]
+    payload.array(array('I', map(len, orders)))
+    payload.array(array('I', codes))
+    payload.array(array('I', [i.attempts_num for i in students]))
+    payload.array(array('I', [i.good_attempts_num for i in students]))
+    payload.array(array('I', [len(i.attempts) for i in students]))
+    payload.array(array('H', [i.percent for i in attempts]))
+    payload.array(array('H', [i.year for i in attempts]))
+    payload.array(array('B', [i.month for i in attempts]))
+    payload.array(array('B', [i.day for i in attempts]))
+
+
+def _load_objects(reader):
+    """
+    :param reader: _Reader object after block of mode
+    reads blocks written by function _save_objects(), creates problems, students and attempts (without checks
+    of fields, they were checked before saving) and checks that blocks have proper lengths and codes
+    :return: dictionary of fields of Information object
+    """
+    problem_class = Information.Information._Problem
+    student_class = problem_class._Student
+    attempt_class = student_class._Attempt
+    records_sum, surnames_length = reader.array('Q', 2)
+    students = _names(reader.strings())
+    students_scores = _load_histograms(reader, len(students))
+    students_problems = _split(reader.array('I', len(students)), reader.array('I'))
+    conds = reader.strings()
+    flags = reader.array('B', len(conds))
+    attemptes_num = reader.array('I', len(conds))
+    good_attemptes_num = reader.array('I', len(conds))
+    scores = _load_histograms(reader, len(conds))
+    periods_sizes = reader.array('I', len(conds))
+    periods = [Periods.Periods(zip(keys, values)) for keys, values in
+               zip(_split(periods_sizes, reader.array('I')), _split(periods_sizes, reader.array('Q')))]
+    orders_sizes = reader.array('I', len(conds))
+    codes = reader.array('I', sum(orders_sizes))
+    attempts_nums = reader.array('I', len(codes))
+    good_attempts_nums = reader.array('I', len(codes))
+    attempts_sizes = reader.array('I', len(codes))
+    total = sum(attempts_sizes)
+    columns = [reader.array(typecode, total) for typecode in 'HHBB']
+    if max(codes, default=-1) >= len(students) or \
+            max((j for i in students_problems for j in i), default=-1) >= len(conds):
+        raise ValueError('Improper code of student or problem')
+    attempts = list(map(attempt_class, *columns, repeat(False, total)))
+    dates = [i * 10000 + j * 100 + k for i, j, k in zip(*columns[1:])]
+    offsets = list(accumulate(attempts_sizes, initial=0))
+    order = []
+    for i, attempts_num, good_attempts_num, start, end in zip(map(students.__getitem__, codes), attempts_nums,
+                                                               good_attempts_nums, offsets, offsets[1:]):
+        student = student_class.__new__(student_class)
+        student.name, student.surname, student.middle_name = i
+        student.attempts = attempts[start:end]
+        student.dates = set(dates[start:end])
+        student.attempts_num = attempts_num
+        student.good_attempts_num = good_attempts_num
+        order.append(student)
+    problems = []
+    start = 0
+    for cond, flag, an, gan, histogram, months, size in zip(conds, flags, attemptes_num, good_attemptes_num,
+                                                             scores, periods, orders_sizes):
+        problem = problem_class.__new__(problem_class)
+        problem.cond = cond
+        problem.ordered = bool(flag & ORDERED)
+        problem.attemptes_num = an
+        problem.good_attemptes_num = gan
+        problem.scores = histogram
+        problem.periods = months
+        if flag & DROPPED:
+            if size:
+                raise ValueError('Dropped problem has students')
+            problem.students = None
+            problem.order = None
+        else:
+            problem.order = order[start:start + size]
+            problem.students = dict(zip(codes[start:start + size], problem.order))
+            if len(problem.students) != size:
+                raise ValueError('Repeated student of problem')
+        start += size
+        problems.append(problem)
+    return {'records_sum': records_sum, 'surnames_length': surnames_length,
+            'problems': problems, 'problems_names': dict(zip(conds, range(len(conds)))),
+            'students': students, 'students_names': dict(zip(students, range(len(students)))),
+            'students_scores': students_scores, 'students_problems': students_problems}
+
+
+def _names(strings):
+    """
+    :param strings: list of names, surnames and middle names of students one by one
+    :return: list of tuples of name, surname and middle_name
+    """
+    if len(strings) % 3:
+        raise ValueError('Improper quantity of names')
+    names = iter(strings)
+    return list(zip(names, names, names))
+
+
+def _split(sizes, values):
+    """
+    :param sizes: array of quantities of values of every part
+    :param values: array of values of all parts one by one
+    divides values into parts, in case of improper sizes raises error
+    :return: list of lists of values
+    """
+    if sum(sizes) != len(values):
+        raise ValueError('Improper sizes of parts')
+    offsets = list(accumulate(sizes, initial=0))
+    return [values[i:j].tolist() for i, j in zip(offsets, offsets[1:])]
+
+
+def _save_histograms(payload, histograms):
+    """
+    :param payload: _Writer object
+    :param histograms: list of Histogram objects
+    writes quantities of their points, points and quantities of attempts
+    """
+    payload.array(array('I', map(len, histograms)))
+    payload.array(array('H', [j for i in histograms for j in i]))
+    payload.array(array('I', [j for i in histograms for j in i.values()]))
+
+
+def _load_histograms(reader, quantity):
+    """
+    :param reader: _Reader object
+    :param quantity: quantity of histograms
+    :return: list of Histogram objects written by function _save_histograms()
+    """
+    sizes = reader.array('I', quantity)
+    return [Scores.Histogram(zip(points, quantities)) for points, quantities in
+            zip(_split(sizes, reader.array('H')), _split(sizes, reader.array('I')))]
+
+
+class _Writer:
+    """
+    writes blocks of snapshot to file and calculates their sha256 hash, every block is type code and length of
+    array and its bytes
+    """
+    __slots__ = ('f', 'digest')
+
+    def __init__(self, f):
+        """
+        :param f: file opened for writing in binary mode
+        """
+        self.f = f
+        self.digest = hashlib.sha256()
+
+    def write(self, piece):
+        """
+        :param piece: bytes of block
+        """
+        self.digest.update(piece)
+        self.f.write(piece)
+
+    def array(self, values):
+        """
+        :param values: array of numbers
+        writes block of array
+        """
+        self.write(BLOCK.pack(values.typecode.encode(), len(values)))
+        self.write(values.tobytes())
+
+    def strings(self, values):
+        """
+        :param values: list of strings
+        writes lengths of strings and their text in utf-8 as two blocks
+        """
+        self.array(array('I', map(len, values)))
+        self.array(array('B', ''.join(values).encode('utf-8', 'surrogatepass')))
+
+
+class _Reader:
+    """
+    reads blocks of snapshot from bytes, in case of improper type code or length of block raises error
+    """
+    __slots__ = ('payload', 'offset')
+
+    def __init__(self, payload):
+        """
+        :param payload: bytes of snapshot after header
+        """
+        self.payload = payload
+        self.offset = 0
+
+    def array(self, typecode, length=None):
+        """
+        :param typecode: type code of array, which has to be in block
+        :param length: quantity of numbers, which has to be in block, None if it is not known
+        :return: array of numbers of the next block
+        """
+        code, size = BLOCK.unpack_from(self.payload, self.offset)
+        values = array(typecode)
+        end = self.offset + BLOCK.size + size * values.itemsize
+        if code != typecode.encode() or length is not None and size != length or end > len(self.payload):
+            raise ValueError('Improper block of snapshot')
+        values.frombytes(self.payload[self.offset + BLOCK.size:end])
+        self.offset = end
+        return values
+
+    def strings(self):
+        """
+        :return: list of interned strings of the next two blocks written by method _Writer.strings()
+        """
+        lengths = self.array('I')
+        text = self.array('B').tobytes().decode('utf-8', 'surrogatepass')
+        offsets = list(accumulate(lengths, initial=0))
+        if offsets[-1] != len(text):
+            raise ValueError('Improper lengths of strings')
+        return list(map(sys.intern, [text[i:j] for i, j in zip(offsets, offsets[1:])]))
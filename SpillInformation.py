@@ -0,0 +1,437 @@
+"""
+Module of Shtonda Yelizaveta, contains class SpillInformation for loading .csv files, which do not fit in memory
+"""
+import os
+import sys
+import time
+import heapq
+import pickle
+import tempfile
+from array import array
+import Information
+import Validation
+import Writers
+import Scores
+import Periods
+import Memory
+
+SPILL_ROWS = 1 << 18
+PARTITIONS = 16
+MERGE_WAYS = 64
+
+
+class SpillInformation:
+    """
+    keeps in memory only counters, histograms and counters of months of problems and buffer of at most spill_rows
+    attempts, attempts are divided into partitions by problems, full buffer is sorted and written to temporary files
+    (runs) of partitions; after loading runs of every partition are merged (external merge sort) into sorted file
+    with attempts of only printed problems, repeated attempts are found during merging,
+    has the same interface as class Information (without queries about students)
+    """
+    _Student = Information.Information._Problem._Student
+
+    def __init__(self, directory=None, spill_rows=SPILL_ROWS):
+        """
+        :param directory: directory for temporary files, None for default temporary directory
+        :param spill_rows: quantity of attempts, which are kept in memory before they are written to disk
+        creates empty counters of problems and empty buffer, creates fields according to .json file,
+        files are written and read by chunks, so merging of MERGE_WAYS files keeps about spill_rows attempts
+        in memory too
+        """
+        self.directory = directory
+        self.spill_rows = spill_rows
+        self.chunk_rows = max(spill_rows // MERGE_WAYS, 1)
+        self.temporary = None
+        self.clear()
+
+    def clear(self):
+        """
+        clears SpillInformation object -- counters of problems, buffer, quantities of loaded records and lengths of
+        surnames, removes temporary files
+        """
+        if self.temporary is not None:
+            self.temporary.cleanup()
+        self.temporary = None
+        self.records_sum = 0
+        self.surnames_length = 0
+        self.problems = []
+        self.problems_names = {}
+        self.attemptes_num = array('I')
+        self.good_attemptes_num = array('I')
+        self.scores = []
+        self.periods = []
+        self.rows = 0
+        self.buffered = 0
+        self.buffers = [[] for _ in range(PARTITIONS)]
+        self.runs = [[] for _ in range(PARTITIONS)]
+        self.sorted = None
+        self.spilled = 0
+        self.written = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        :param exc_type: error class
+        :param exc_val: error instance
+        :param exc_tb: trace object
+        in case of some error during processing .csv file clears SpillInformation object
+        """
+        if exc_type is not None:
+            self.clear()
+
+    def load_add_inf(self, record_sum, surnames_sum):
+        """
+        :param record_sum: quantity of records in .csv file
+        :param surnames_sum: sum of lengths of surnames in .csv file
+        merges runs of every partition (it checks that there are no repeated attempts), update data in
+        SpillInformation object
+        """
+        self._sort()
+        self.records_sum = record_sum
+        self.surnames_length = surnames_sum
+
+    def counters(self):
+        """
+        :return: dictionary of quantities of records, problems, attempts written to disk and runs (sorted temporary
+        files of partitions)
+        """
+        return {'rows': self.records_sum, 'problems': len(self.problems), 'spilled_rows': self.spilled,
+                'runs': self.written}
+
+    def memory(self):
+        """
+        counts approximate sizes of structures, which are kept in memory (students are not kept)
+        :return: dictionary of sizes (in bytes) of problems (conditions, counters, histograms and counters of
+        months), students, attempts (buffer) and indexes (dictionary of problems)
+        """
+        return {'problems': sys.getsizeof(self.problems) + sum(map(sys.getsizeof, self.problems)) +
+                sys.getsizeof(self.attemptes_num) + sys.getsizeof(self.good_attemptes_num) +
+                sum(map(sys.getsizeof, self.scores)) + sum(map(sys.getsizeof, self.periods)),
+                'students': 0,
+                'attempts': self.buffered * Memory.SPILL_ROW + sum(map(sys.getsizeof, self.buffers)),
+                'indexes': sys.getsizeof(self.problems_names)}
+
+    def problem_counts(self, cond):
+        """
+        :param cond: condition of problem
+        :return: None if there is no problem, otherwise quantity of attempts, quantity of good attempts and
+        percentage of good attempts of problem
+        """
+        found = self.problems_names.get(cond)
+        if found is None:
+            return None
+        attemptes_num = self.attemptes_num[found]
+        good_attemptes_num = self.good_attemptes_num[found]
+        return attemptes_num, good_attemptes_num, round((good_attemptes_num / attemptes_num) * 100)
+
+    def problem_scores(self, cond):
+        """
+        :param cond: condition of problem
+        :return: None if there is no problem, otherwise histogram of points of all attempts of problem
+        """
+        found = self.problems_names.get(cond)
+        return None if found is None else self.scores[found]
+
+    def student_attempts(self, name, surname, middle_name):
+        """
+        :param name: name of student
+        :param surname: surname of student
+        :param middle_name: middle_name of student
+        students are not kept in memory, so raises error
+        """
+        raise ValueError('Backend "spill" does not keep students in memory')
+
+    student_scores = student_attempts
+
+    def passing_problems(self, threshold=Scores.PASS, part=Scores.MAX_PERCENT):
+        """
+        :param threshold: points, which attempt has to reach to pass
+        :param part: percent of attempts, which have to pass
+        :return: list of conditions of problems, where at least part percent of attempts have threshold points or
+        more (with default values these are problems of output)
+        """
+        Scores.check_threshold(threshold)
+        Scores.check_threshold(part)
+        return [cond for cond, scores in zip(self.problems, self.scores) if scores.passes(threshold, part)]
+
+    def problem_periods(self, cond):
+        """
+        :param cond: condition of problem
+        :return: None if there is no problem, otherwise counters of attempts of problem by months
+        """
+        found = self.problems_names.get(cond)
+        return None if found is None else self.periods[found]
+
+    def period_report(self, start=None, end=None):
+        """
+        :param start: the first month of range -- pair of year and month, None if range has no beginning
+        :param end: the last month of range -- pair of year and month, None if range has no end
+        sums counters of months of every problem
+        :return: list of tuples of condition, quantity of attempts, quantity of good attempts and percentage of
+        good attempts in range for problems with attempts in range, in order of problems
+        """
+        Periods.bounds(start, end)
+        report = []
+        for cond, periods in zip(self.problems, self.periods):
+            counts = periods.counts(start, end)
+            if counts[0]:
+                report.append((cond,) + counts)
+        return report
+
+    def output(self, output_file, output_encoding, output_format='tsv', pipeline=None):
+        """
+        :param output_file: relative path to file where information is outputed
+        :param output_encoding: type of encoding of file where information is outputed
+        :param output_format: 'tsv', 'jsonl' or 'binary' -- format of output_file
+        :param pipeline: size of queue of thread, which writes output_file, None to write it by the same thread
+        opens writer of chosen format, calls report() method, and prints 'OK' if there are no errors
+        :return: statistics of queue of thread, which wrote output_file (empty dictionary without pipeline)
+        """
+        print(f'output {output_file}: ', end='')
+        with Writers.open_writer(output_file, output_encoding, output_format, pipeline) as writer:
+            self.report(writer)
+        print('OK')
+        return writer.queues()
+
+    def report(self, writer):
+        """
+        :param writer: writer of some format from module Writers
+        reads sorted files of partitions at once in order of problems and passes attempts of every needed problem
+        to writer, only attempts of one problem are kept in memory
+        """
+        self._sort()
+        rows = heapq.merge(*[_read(i) for i in self.sorted])
+        problem = None
+        for row in rows:
+            if row[0] != problem:
+                if problem is not None:
+                    self._problem_report(problem, students, codes, years, percents, writer)
+                problem = row[0]
+                students, codes, years, percents = [], [], [], []
+                previous = None
+            names = row[1:4]
+            if names != previous:
+                students.append((names[1], names[0], names[2]))
+                previous = names
+            codes.append(len(students) - 1)
+            years.append(row[5])
+            percents.append(-row[4])
+        if problem is not None:
+            self._problem_report(problem, students, codes, years, percents, writer)
+
+    def _problem_report(self, problem, students, codes, years, percents, writer):
+        """
+        :param problem: code of problem
+        :param students: list of names of students of problem
+        :param codes: list of indexes of students for sorted attempts of problem
+        :param years: list of years of the same attempts
+        :param percents: list of points of the same attempts
+        passes information about problem to writer
+        """
+        attemptes_num = self.attemptes_num[problem]
+        good_attemptes_num = self.good_attemptes_num[problem]
+        writer.problem(self.problems[problem], attemptes_num, good_attemptes_num,
+                       round((good_attemptes_num / attemptes_num) * 100), students, codes, years, percents)
+
+    def load(self, name: str, surname: str, percent: int, middle_name: str, cond: str, year: int, month: int, day: int):
+        """
+        :param name: name of student
+        :param surname: surname of student
+        :param percent: point for attempt
+        :param middle_name: middle_name of student
+        :param cond: condition of problem
+        :param year: year of attempt
+        :param month: month of attempt
+        :param day: day of attempt
+        checks all fields of row before data is changed (so improper row does not leave problem without
+        attempts), finds or creates code of problem, counts attempt and adds it to buffer of its partition, full
+        buffer is written to disk
+        """
+        Validation.check_row((name, surname, percent, middle_name, cond, year, month, day))
+        problem = self._find_problem(cond, False)
+        self._buffer(problem, name, surname, percent, middle_name, year, month, day)
+
+    def load_many(self, rows, times=None):
+        """
+        :param rows: iterable of rows -- tuples of fields in order of parameters of load() method
+        checks columns of all rows at once (and rows one by one only if some field is improper), adds proper rows
+        to buffers without nested checks, the first improper row is loaded by load() method, which raises the same
+        error as loading row by row, adds quantity of rows and sum of lengths of surnames to fields records_sum
+        and surnames_length
+        :param times: dictionary of times of stages, time of checks of rows is added to key 'validate' and time
+        of their loading to key 'aggregate' (None if time is not measured)
+        :return: quantity of rows and sum of lengths of their surnames
+        """
+        if not isinstance(rows, list):
+            rows = list(rows)
+        if not rows:
+            return 0, 0
+        columns = list(zip(*rows))
+        surnames = sum(map(len, columns[1]))
+        checked = time.perf_counter()
+        wrong = len(rows) if Validation.good_columns(*columns) else Validation.first_wrong_row(rows)
+        loaded = time.perf_counter()
+        start = 0
+        while True:
+            for i in range(start, wrong):
+                name, surname, percent, middle_name, cond, year, month, day = rows[i]
+                self._buffer(self._find_problem(cond, False), name, surname, percent, middle_name, year, month, day)
+            if wrong == len(rows):
+                break
+            self.load(*rows[wrong])
+            start = wrong + 1
+            wrong = Validation.first_wrong_row(rows, start)
+        self.records_sum += len(rows)
+        self.surnames_length += surnames
+        if times is not None:
+            times['validate'] += loaded - checked
+            times['aggregate'] += time.perf_counter() - loaded
+        return len(rows), surnames
+
+    def _find_problem(self, cond, check=True):
+        """
+        :param cond: condition of problem
+        :param check: False if condition has already been checked
+        finds code of problem, if there is not such a problem, checks condition and adds it
+        :return: code of problem
+        """
+        found = self.problems_names.get(cond)
+        if found is None:
+            if check:
+                Validation.check_cond(cond)
+            if self.sorted is not None:
+                raise ValueError('Loaded data of backend "spill" can not be changed')
+            found = len(self.problems)
+            cond = sys.intern(cond)
+            self.problems_names[cond] = found
+            self.problems.append(cond)
+            self.attemptes_num.append(0)
+            self.good_attemptes_num.append(0)
+            self.scores.append(Scores.Histogram())
+            self.periods.append(Periods.Periods())
+        return found
+
+    def _buffer(self, problem, name, surname, percent, middle_name, year, month, day):
+        """
+        :param problem: code of problem
+        other parameters are checked fields of attempt like in load() method
+        counts attempt, adds it to buffer of partition of problem as tuple, which is compared in order of output
+        (problem, surname, name, middle_name, descending points, year and number of row), writes buffers to disk
+        if there are spill_rows attempts in memory
+        """
+        if self.sorted is not None:
+            raise ValueError('Loaded data of backend "spill" can not be changed')
+        self.attemptes_num[problem] += 1
+        if self._Student.good_attempt(percent):
+            self.good_attemptes_num[problem] += 1
+        self.scores[problem].add(percent)
+        self.periods[problem].add(year, month, percent)
+        self.buffers[problem % PARTITIONS].append((problem, surname, name, middle_name, -percent, year, self.rows,
+                                                  month, day))
+        self.rows += 1
+        self.buffered += 1
+        if self.buffered >= self.spill_rows:
+            self._spill()
+
+    def _spill(self):
+        """
+        sorts buffers of partitions and writes every of them to new run of partition
+        """
+        for partition, buffer in enumerate(self.buffers):
+            if buffer:
+                buffer.sort()
+                self.runs[partition].append(self._write(buffer))
+                self.spilled += len(buffer)
+                self.written += 1
+        self.buffers = [[] for _ in range(PARTITIONS)]
+        self.buffered = 0
+
+    def _write(self, rows):
+        """
+        :param rows: iterable of sorted attempts
+        writes attempts to new temporary file by chunks of chunk_rows attempts
+        :return: path to this file
+        """
+        if self.temporary is None:
+            self.temporary = tempfile.TemporaryDirectory(prefix='spill', dir=self.directory)
+        descriptor, path = tempfile.mkstemp(dir=self.temporary.name)
+        with os.fdopen(descriptor, 'wb') as f:
+            chunk = []
+            for row in rows:
+                chunk.append(row)
+                if len(chunk) == self.chunk_rows:
+                    pickle.dump(chunk, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    chunk = []
+            if chunk:
+                pickle.dump(chunk, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return path
+
+    def _sort(self):
+        """
+        if it has not been done yet, writes the rest of buffers and merges runs of every partition (at most
+        MERGE_WAYS runs at once, so several passes can be needed) into one sorted file with attempts of printed
+        problems, in case of repeated attempt raises error
+        """
+        if self.sorted is not None:
+            return
+        self._spill()
+        self.sorted = []
+        try:
+            for runs in self.runs:
+                while len(runs) > MERGE_WAYS:
+                    merged = [self._write(heapq.merge(*[_read(i) for i in runs[j:j + MERGE_WAYS]]))
+                              for j in range(0, len(runs), MERGE_WAYS)]
+                    _remove(runs)
+                    runs[:] = merged
+                if runs:
+                    self.sorted.append(self._write(self._check(heapq.merge(*[_read(i) for i in runs]))))
+                    _remove(runs)
+                    runs.clear()
+        except BaseException:
+            self.sorted = None
+            raise
+
+    def _check(self, rows):
+        """
+        :param rows: sorted attempts of partition
+        checks that student has no attempts with the same date in one problem (his attempts are neighbours),
+        in case of repeated attempt raises error
+        :return: generator of attempts of printed problems
+        """
+        student = None
+        dates = set()
+        for row in rows:
+            if row[:4] != student:
+                student = row[:4]
+                dates = set()
+            date = (row[5], row[7], row[8])
+            if date in dates:
+                raise ValueError('Attempt has already been added')
+            dates.add(date)
+            if self.attemptes_num[row[0]] == self.good_attemptes_num[row[0]]:
+                yield row
+
+
+def _read(path):
+    """
+    :param path: path to temporary file with attempts
+    :return: generator of attempts of file
+    """
+    with open(path, 'rb') as f:
+        while True:
+            try:
+                chunk = pickle.load(f)
+            except EOFError:
+                return
+            yield from chunk
+
+
+def _remove(paths):
+    """
+    :param paths: list of paths to temporary files, which are not needed
+    removes files (list is not changed)
+    """
+    for path in paths:
+        os.remove(path)
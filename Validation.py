@@ -0,0 +1,197 @@
+"""
+Module of Shtonda Yelizaveta, contains functions for checking fields of .csv file
+"""
+import re
+from functools import lru_cache
+
+COND_PATTERN = re.compile(r'[-\w".,{}$+*\\)(%\]\[ ]{4,54}')
+DIGIT_PATTERN = re.compile(r'\d')
+NAME_PATTERNS = {length: re.compile(r'\b[-\w` ]{0,%d}\b' % length) for length in (25, 26, 30)}
+DAYS_IN_MONTH = ((0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+                 (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31))
+CACHE_SIZE = 1 << 16
+
+trusted = False
+
+
+def trust(value):
+    """
+    :param value: True if data has already been checked (for example, file is processed again), False otherwise
+    turns off or on all checks
+    """
+    global trusted
+    trusted = value
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _good_cond(cond):
+    """
+    :param cond: condition of problem
+    :return: True if format of condition is proper, False otherwise, answers are remembered
+    """
+    return COND_PATTERN.fullmatch(cond) is not None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _good_name(name, length):
+    """
+    :param name: name, surname or middle_name of student
+    :param length: the biggest length of name
+    :return: True if format of name is proper, False otherwise, answers are remembered
+    """
+    return DIGIT_PATTERN.search(name) is None and NAME_PATTERNS[length].fullmatch(name) is not None
+
+
+def check_cond(cond):
+    """
+    :param cond: condition of problem
+    checks accordance of condition format, in case of improper format raises error
+    :return: True
+    """
+    if not trusted and not _good_cond(cond):
+        raise ValueError('something wrong with problem`s condition')
+    return True
+
+
+def check_name(name, length=26):
+    """
+    :param name: name of student (or surname, middle_name)
+    :param length: the biggest length of name (26 for names, 25 for surnames, 30 for middle_names)
+    checks accordance of name format, in case of improper format raises error
+    :return: True
+    """
+    if not trusted and not _good_name(name, length):
+        raise ValueError('something wrong with student`s name')
+    return True
+
+
+def check_percent(percent):
+    """
+    :param percent: points of attempt
+    checks accordance of percent format, in case of improper format raises error
+    :return: True
+    """
+    if not trusted and not 0 <= percent <= 100:
+        raise ValueError('something wrong with points')
+    return True
+
+
+def check_year(year):
+    """
+    :param year: year of attempt
+    checks accordance of year format, in case of improper format raises error
+    :return: True
+    """
+    if not trusted and (not 2001 <= year or not len(str(year)) == 4):
+        raise ValueError('something wrong with year')
+    return True
+
+
+def check_month(month):
+    """
+    :param month: month of attempt
+    checks accordance of month format, in case of improper format raises error
+    :return: True
+    """
+    if not trusted and not 0 < month < 13:
+        raise ValueError('something wrong with month')
+    return True
+
+
+def check_day(year, month, day):
+    """
+    :param year: proper year of attempt
+    :param month: proper month of attempt
+    :param day: day of attempt
+    checks existence of day in table of days in months, in case of improper day raises the same error as
+    datetime.date
+    :return: True
+    """
+    if not trusted and not 1 <= day <= DAYS_IN_MONTH[year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)][month]:
+        raise ValueError('day is out of range for month')
+    return True
+
+
+def check_attempt(percent, year, month, day):
+    """
+    :param percent: points of attempt
+    :param year: year of attempt
+    :param month: month of attempt
+    :param day: day of attempt
+    checks all fields of attempt in the same order as class of attempt does
+    :return: True
+    """
+    check_percent(percent)
+    check_year(year)
+    check_month(month)
+    return check_day(year, month, day)
+
+
+def check_row(row):
+    """
+    :param row: tuple of fields in order of parameters of method Information.load()
+    checks all fields of row in the same order as class Information does (condition, names, attempt), so row can
+    be checked before it changes data
+    :return: True
+    """
+    name, surname, percent, middle_name, cond, year, month, day = row
+    check_cond(cond)
+    check_name(name, 26)
+    check_name(surname, 25)
+    check_name(middle_name, 30)
+    return check_attempt(percent, year, month, day)
+
+
+def good_columns(names, surnames, percents, middle_names, conds, years, months, days):
+    """
+    :param names: column of names of batch of rows
+    :param surnames: column of surnames
+    :param percents: column of points
+    :param middle_names: column of middle_names
+    :param conds: column of conditions
+    :param years: column of years
+    :param months: column of months
+    :param days: column of days
+    checks columns at once: numbers by their minimal and maximal values (days after 28th one by one), every
+    different name and condition once
+    :return: True if all fields are proper or checks are turned off, False otherwise (then improper row can be
+    found with first_wrong_row())
+    """
+    if trusted:
+        return True
+    if not (0 <= min(percents) and max(percents) <= 100 and 2001 <= min(years) and max(years) <= 9999
+            and 0 < min(months) and max(months) < 13 and 1 <= min(days)):
+        return False
+    if max(days) > 28:
+        for year, month, day in zip(years, months, days):
+            if day > DAYS_IN_MONTH[year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)][month]:
+                return False
+    return (all(_good_cond(i) for i in set(conds)) and all(_good_name(i, 26) for i in set(names))
+            and all(_good_name(i, 25) for i in set(surnames)) and all(_good_name(i, 30) for i in set(middle_names)))
+
+
+def first_wrong_row(rows, start=0):
+    """
+    :param rows: list of rows -- tuples of fields in order of parameters of method Information.load()
+    :param start: index of the first checked row
+    checks all fields of rows in one pass (the same checks as in functions above, without calls of them)
+    :return: index of the first row with improper field, len(rows) if all rows are proper or checks are turned off
+    """
+    if trusted:
+        return len(rows)
+    good_cond = _good_cond
+    good_name = _good_name
+    for i in range(start, len(rows)):
+        name, surname, percent, middle_name, cond, year, month, day = rows[i]
+        if not (good_cond(cond) and good_name(name, 26) and good_name(surname, 25) and good_name(middle_name, 30)
+                and 0 <= percent <= 100 and 2001 <= year <= 9999 and 0 < month < 13
+                and 1 <= day <= DAYS_IN_MONTH[year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)][month]):
+            return i
+    return len(rows)
+
+
+def cache_info():
+    """
+    :return: dictionary of statistics of remembered answers for conditions and names
+    """
+    return {'cond': _good_cond.cache_info()._asdict(), 'name': _good_name.cache_info()._asdict()}
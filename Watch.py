@@ -0,0 +1,124 @@
+"""
+Module of Shtonda Yelizaveta, contains class Watch for processing .csv file, which grows while program works
+"""
+import os
+import time
+import Builder
+import Loading
+import Validation
+
+
+class Watch:
+    """
+    remembers how many bytes of .csv file have already been loaded, loads only new lines into Information object,
+    keeps output text of every problem and recalculates it only for problems with new attempts
+    """
+
+    def __init__(self, main_file, additional_file, input_encoding, output_file, output_encoding, options=None):
+        """
+        :param main_file: relative path to .csv file
+        :param additional_file: relative path to .json file
+        :param input_encoding: type of encoding of main_file and additional_file
+        :param output_file: relative path to file where information is outputed
+        :param output_encoding: type of encoding of output_file
+        :param options: dictionary of optional keys from .ini file (backend has to be 'objects', format 'tsv')
+        """
+        if options is None:
+            options = {}
+        if options.get('backend', 'objects') != 'objects':
+            raise ValueError('Watching works only with backend "objects"')
+        if options.get('format', 'tsv') != 'tsv':
+            raise ValueError('Watching works only with format "tsv"')
+        if not Builder.Builder._bytes_splittable(input_encoding):
+            raise ValueError('Watching works only with utf-8 and one-byte encodings')
+        if Builder.input_files(main_file) != [main_file] or Builder.compressed(main_file) is not None:
+            raise ValueError('Watching works only with one not compressed .csv file')
+        self.main_file = main_file
+        self.additional_file = additional_file
+        self.input_encoding = input_encoding
+        self.output_file = output_file
+        self.output_encoding = output_encoding
+        self.data = Loading.new_data(options)
+        self.offset = 0
+        self.outputs = []
+        Validation.trust(options.get('trusted', False))
+
+    def refresh(self, final=False):
+        """
+        :param final: True if main_file is not appended any more, so the last line without new line symbol is
+        complete
+        loads new lines of main_file (or the whole file again, if it became shorter), recalculates text of
+        changed problems, checks accordance with additional_file and rewrites output_file, the last line without
+        new line symbol waits for its new line symbol (writer can pause in the middle of line), only the final
+        call loads it
+        :return: number of loaded records
+        """
+        size = os.path.getsize(self.main_file)
+        if size < self.offset:
+            self.data.clear()
+            self.offset = 0
+            self.outputs = []
+        changes = _Changes(self.data)
+        print(f'input-csv {self.main_file}: ', end='')
+        records, _, self.offset = Builder.Builder().load_from(changes, self.main_file, self.input_encoding,
+                                                         self.offset, final)
+        print(f'+{records} OK')
+        if not records and self.outputs:
+            return 0
+        self.outputs.extend([''] * (len(self.data.problems) - len(self.outputs)))
+        for cond in changes.problems:
+            index_ = self.data.problems_names[cond]
+            self.outputs[index_] = self.data.problem_output(self.data.problems[index_])
+        if Loading.fit(self.data, Loading.load_stat(self.additional_file, self.input_encoding)):
+            print('OK')
+        else:
+            print('UPS')
+        print(f'output {self.output_file}: ', end='')
+        with open(self.output_file, 'w', encoding=self.output_encoding) as f:
+            f.writelines(self.outputs)
+        print('OK')
+        return records
+
+    def run(self, interval=1.0, rounds=None):
+        """
+        :param interval: quantity of seconds between checks of main_file
+        :param rounds: quantity of checks, None to watch until program is stopped (by Ctrl+C)
+        calls refresh() method every interval seconds, after the last check (or when program is stopped) loads
+        main_file the last time with its last line without new line symbol
+        """
+        try:
+            while True:
+                self.refresh()
+                if rounds is not None:
+                    rounds -= 1
+                    if rounds <= 0:
+                        break
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            print()
+        self.refresh(final=True)
+
+
+class _Changes:
+    """
+    passes lines to Information object and remembers conditions of problems, which got new attempts
+    """
+
+    def __init__(self, data):
+        """
+        :param data: object of class Information
+        """
+        self.data = data
+        self.problems = set()
+
+    def load_many(self, rows, times=None):
+        """
+        :param rows: list of rows like in method Information.load_many()
+        :param times: dictionary of times of stages like in method Information.load_many()
+        loads rows into Information object (it adds them to quantity of records and sum of lengths of surnames)
+        and remembers their problems
+        :return: quantity of rows and sum of lengths of their surnames
+        """
+        loaded = self.data.load_many(rows, times)
+        self.problems.update(row[4] for row in rows)
+        return loaded
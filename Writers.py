@@ -0,0 +1,195 @@
+"""
+Module of Shtonda Yelizaveta, contains classes which write report in formats 'tsv', 'jsonl' and 'binary'
+"""
+import sys
+import json
+import struct
+from array import array
+import Pipeline
+
+BUFFER_SIZE = 1 << 20
+BUFFER_LINES = 1 << 14
+MAGIC = b'INFREP\0\0'
+VERSION = 1
+HEADER = struct.Struct('<8sH')
+PROBLEM = struct.Struct('<IIIBIII')
+
+
+class _Writer:
+    """
+    receives report problem by problem, collects text in list of pieces and writes it
+    to file by large batches, so the whole report is never kept in memory
+    """
+    EMPTY = ''
+
+    def __init__(self, f):
+        """
+        :param f: opened file object
+        """
+        self.f = f
+        self.lines = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        :param exc_type: error class
+        :param exc_val: error instance
+        :param exc_tb: trace object
+        writes the rest of report (only if there is no error) and closes file
+        """
+        try:
+            if exc_type is None:
+                self.flush()
+        finally:
+            self.f.close()
+
+    def problem(self, cond, attemptes_num, good_attemptes_num, percentage, students, codes, years, percents):
+        """
+        :param cond: condition of problem
+        :param attemptes_num: quantity of attempts of problem
+        :param good_attemptes_num: quantity of attempts with 60 points or more
+        :param percentage: percentage of good attempts
+        :param students: list of names of students of problem -- tuples of name, surname and middle_name
+        :param codes: list of indexes of students in list students for sorted attempts of problem
+        :param years: list of years of the same attempts
+        :param percents: list of points of the same attempts
+        adds information about next problem, writes collected pieces if there are many of them
+        """
+        if len(self.lines) >= BUFFER_LINES:
+            self.flush()
+        self._problem(cond, attemptes_num, good_attemptes_num, percentage, students, codes, years, percents)
+
+    def _problem(self, cond, attemptes_num, good_attemptes_num, percentage, students, codes, years, percents):
+        """
+        parameters are the same as in problem() method
+        adds pieces of information about problem to list of pieces
+        """
+        raise NotImplementedError
+
+    def queues(self):
+        """
+        :return: statistics of queue of thread, which writes file (like in method Pipeline.Pipeline.info()), empty
+        dictionary if file is written by the same thread
+        """
+        return self.f.info() if isinstance(self.f, Pipeline.QueuedFile) else {}
+
+    def flush(self):
+        """
+        writes collected pieces to file at once
+        """
+        self.f.write(self.EMPTY.join(self.lines))
+        self.lines = []
+
+
+class TsvWriter(_Writer):
+    """
+    writes report as text, where fields are separated by tabulation (line of problem and lines of its attempts)
+    """
+
+    def _problem(self, cond, attemptes_num, good_attemptes_num, percentage, students, codes, years, percents):
+        names = [f'{surname}\t{name}\t{middle_name}' for name, surname, middle_name in students]
+        self.lines.append(f'{cond}\t{attemptes_num}\t{good_attemptes_num}\t{percentage}\n')
+        self.lines.extend([f'\t{year}\t{names[code]}\t{percent}\n'
+                           for code, year, percent in zip(codes, years, percents)])
+
+
+class JsonlWriter(_Writer):
+    """
+    writes report as JSON Lines -- one object with condition, quantities and list of attempts for every problem
+    """
+
+    def _problem(self, cond, attemptes_num, good_attemptes_num, percentage, students, codes, years, percents):
+        names = [f'"surname": {_json(surname)}, "name": {_json(name)}, "middle_name": {_json(middle_name)}'
+                 for name, surname, middle_name in students]
+        attempts = ', '.join([f'{{"year": {year}, {names[code]}, "percent": {percent}}}'
+                              for code, year, percent in zip(codes, years, percents)])
+        self.lines.append(f'{{"cond": {_json(cond)}, "attempts_num": {attemptes_num}, '
+                          f'"good_attempts_num": {good_attemptes_num}, "percentage": {percentage}, '
+                          f'"attempts": [{attempts}]}}\n')
+
+
+class BinaryWriter(_Writer):
+    """
+    writes report in compact binary format: header (MAGIC and VERSION) and block for every problem --
+    numbers of PROBLEM structure (length of condition, quantities, percentage, quantity of students and attempts,
+    length of names), condition and names of students (name, surname and middle_name of every student separated
+    by zero byte) in utf-8, columns of indexes of students, years and points of attempts (little-endian)
+    """
+    EMPTY = b''
+
+    def __init__(self, f):
+        super().__init__(f)
+        self.lines.append(HEADER.pack(MAGIC, VERSION))
+
+    def _problem(self, cond, attemptes_num, good_attemptes_num, percentage, students, codes, years, percents):
+        cond = cond.encode('utf-8')
+        names = '\0'.join(['\0'.join(i) for i in students]).encode('utf-8')
+        columns = (array('I', codes), array('H', years), array('H', percents))
+        if sys.byteorder == 'big':
+            for i in columns:
+                i.byteswap()
+        self.lines.append(PROBLEM.pack(len(cond), attemptes_num, good_attemptes_num, percentage, len(students),
+                                       len(codes), len(names)))
+        self.lines.extend((cond, names))
+        self.lines.extend([i.tobytes() for i in columns])
+
+
+FORMATS = {'tsv': TsvWriter, 'jsonl': JsonlWriter, 'binary': BinaryWriter}
+
+
+def _json(text):
+    """
+    :param text: string field of report
+    :return: string in JSON format (usual names and conditions do not need escaping and are only quoted)
+    """
+    if text.isprintable() and '"' not in text and '\\' not in text:
+        return f'"{text}"'
+    return json.dumps(text, ensure_ascii=False)
+
+
+def open_writer(output_file, output_encoding, output_format='tsv', pipeline=None):
+    """
+    :param output_file: relative path to file where information is outputed
+    :param output_encoding: type of encoding of output_file (binary format always uses utf-8 for strings)
+    :param output_format: 'tsv', 'jsonl' or 'binary'
+    :param pipeline: quantity of pieces in queue of separate thread, which writes file, None to write file
+    by the same thread
+    opens output_file with large buffer
+    :return: writer of chosen format
+    """
+    if output_format == 'binary':
+        f = open(output_file, 'wb', buffering=BUFFER_SIZE)
+    else:
+        f = open(output_file, 'w', encoding=output_encoding, buffering=BUFFER_SIZE)
+    if pipeline is not None:
+        f = Pipeline.QueuedFile(f, pipeline)
+    return FORMATS[output_format](f)
+
+
+def read_binary(f, writer):
+    """
+    :param f: file object of binary report, opened in mode 'rb'
+    :param writer: writer of other format
+    passes problems of binary report to writer (for example, to convert report into text),
+    in case of improper file raises error
+    """
+    magic, version = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC or version != VERSION:
+        raise ValueError('Something wrong with binary report')
+    while True:
+        head = f.read(PROBLEM.size)
+        if not head:
+            break
+        cond_length, attemptes_num, good_attemptes_num, percentage, students_num, attempts_num, names_length = \
+            PROBLEM.unpack(head)
+        cond = f.read(cond_length).decode('utf-8')
+        names = f.read(names_length).decode('utf-8').split('\0')
+        students = [tuple(names[i:i + 3]) for i in range(0, 3 * students_num, 3)]
+        columns = (array('I', f.read(attempts_num * 4)), array('H', f.read(attempts_num * 2)),
+                   array('H', f.read(attempts_num * 2)))
+        if sys.byteorder == 'big':
+            for i in columns:
+                i.byteswap()
+        writer.problem(cond, attemptes_num, good_attemptes_num, percentage, students, *[i.tolist() for i in columns])
@@ -1,50 +1,172 @@
-"""
-Module of Shtonda Yelizaveta, contains main function
-"""
-import sys
-import Loading
-
-
-def developer_information():
-    """
-    prints information about student and variant
-    """
-    print('This program is coded by Shtonda Yelizaveta,  К-13/2. Variant 140.\n')
-
-
-def problem_condition():
-    """
-    prints information about condition of lab variant
-    """
-    print("""Program takes, processes data and returns information about exercises in tests, done by students. 
-Processing: program finds all the problems that were solved in each attempt by at least 60%. Prints the following
-information for each of them: condition, number of attempts, number of attempts not worse than 60%, percentage 
-of attempts not worse than 60% for all attempts. Then prints information about every prompt of problem:
-year, last name, first name, middle name, percentage of points scored, sorted by last name, first name, middle name, 
-the percentage of points scored in descending order, year.""")
-
-
-def process(path):
-    """
-    :param path: received as second parameter in cmd
-
-    calls method load_ini(), which opens and process .ini file
-    calls method load(), which loading all data in object
-    calls method output(), which write down asked information in .txt file
-    in case of error catches it and prints proper information
-    """
-    try:
-        print(f'ini {path}: ', end='')
-        main_file, additional_file, input_encoding, output_file, output_encoding = Loading.load_ini(path)
-        Loading.load(main_file, additional_file, input_encoding).output(output_file, output_encoding)
-    except BaseException as b:
-        print('\n***** program aborted *****')
-        print(b)
-
-if not len(sys.argv) == 2:
-    print('***** program aborted *****')
-else:
-    developer_information()
-    problem_condition()
-    print('*****')
-    process(sys.argv[1])
+"""
+Module of Shtonda Yelizaveta, contains main function
+"""
+import sys
+import math
+import Loading
+import Watch
+import Batch
+import Service
+import Profiling
+
+
+def developer_information():
+    """
+    prints information about student and variant
+    """
+    print('This program is coded by Shtonda Yelizaveta,  К-13/2. Variant 140.\n')
+
+
+def problem_condition():
+    """
+    prints information about condition of lab variant
+    """
+    print("""Program takes, processes data and returns information about exercises in tests, done by students. 
+Processing: program finds all the problems that were solved in each attempt by at least 60%. Prints the following
+information for each of them: condition, number of attempts, number of attempts not worse than 60%, percentage 
+of attempts not worse than 60% for all attempts. Then prints information about every prompt of problem:
+year, last name, first name, middle name, percentage of points scored, sorted by last name, first name, middle name, 
+the percentage of points scored in descending order, year.""")
+
+
+def process(path, profile=None):
+    """
+    :param path: received as second parameter in cmd
+    :param profile: settings of profiling from cmd (None if profiling is not asked there)
+
+    calls method load_ini(), which opens and process .ini file
+    calls method load(), which loading all data in object
+    calls method output(), which write down asked information in .txt file
+    if profiling is asked in cmd or in section "profile" of .ini file, writes report about all stages
+    in case of error catches it and prints proper information
+    """
+    try:
+        print(f'ini {path}: ', end='')
+        profiler = Profiling.Profiler(profile)
+        with profiler.stage('load_ini'):
+            main_file, additional_file, input_encoding, output_file, output_encoding, options = Loading.load_ini(path)
+        profiler.configure(options['profile'])
+        data = Loading.load(main_file, additional_file, input_encoding, options, profiler)
+        with profiler.stage('output'):
+            profiler.queues.update(data.output(output_file, output_encoding, options['format'], options['pipeline']))
+        profiler.finish(data)
+    except BaseException as b:
+        print('\n***** program aborted *****')
+        print(b)
+
+
+def watch(path, interval):
+    """
+    :param path: received as parameter in cmd
+    :param interval: quantity of seconds between checks of .csv file
+
+    calls method load_ini(), which opens and process .ini file
+    creates Watch object, which loads new lines of .csv file and rewrites .txt file every interval seconds
+    until program is stopped
+    in case of error catches it and prints proper information
+    """
+    try:
+        print(f'ini {path}: ', end='')
+        main_file, additional_file, input_encoding, output_file, output_encoding, options = Loading.load_ini(path)
+        Watch.Watch(main_file, additional_file, input_encoding, output_file, output_encoding, options).run(interval)
+    except BaseException as b:
+        print('\n***** program aborted *****')
+        print(b)
+
+
+def serve(paths, address, interval):
+    """
+    :param paths: received as parameters in cmd
+    :param address: port on localhost or path to Unix socket
+    :param interval: quantity of seconds between checks of files of datasets
+
+    runs local service, which loads data of every .ini file once and answers requests about it,
+    in case of error catches it and prints proper information
+    """
+    try:
+        Service.serve(paths, int(address) if address.isdigit() else address, interval)
+    except KeyboardInterrupt:
+        pass
+    except BaseException as b:
+        print('\n***** program aborted *****')
+        print(b)
+
+
+def parse_args(args):
+    """
+    :param args: parameters from cmd without name of program
+    divides parameters into flags (they start with '--', value can be given after '=') and paths
+    :return: dictionary of flags and list of paths
+    """
+    flags = {}
+    paths = []
+    for i in args:
+        if i.startswith('--'):
+            name, _, value = i[2:].partition('=')
+            flags[name] = value
+        else:
+            paths.append(i)
+    return flags, paths
+
+
+def profile_settings(flags):
+    """
+    :param flags: dictionary of flags from cmd
+    takes flags --profile (value is path to report) and --capture (value is 'cprofile' or 'tracemalloc',
+    stage can be given after ':'), in case of improper values raises error
+    :return: dictionary of settings of profiling, None if these flags are absent
+    """
+    if 'profile' not in flags and 'capture' not in flags:
+        return None
+    settings = {}
+    if flags.get('profile'):
+        settings['report'] = flags['profile']
+    if flags.get('capture'):
+        settings['capture'], _, stage = flags['capture'].partition(':')
+        if stage:
+            settings['stage'] = stage
+    Profiling.check_settings(settings)
+    return settings
+
+
+def watch_interval(flags):
+    """
+    :param flags: dictionary of flags from cmd
+    takes flag --watch (value is quantity of seconds between checks, it can be fractional, 1 by default)
+    :return: positive quantity of seconds, None if value is improper
+    """
+    try:
+        interval = float(flags.get('watch') or 1)
+    except ValueError:
+        return None
+    return interval if 0 < interval < math.inf else None
+
+
+if __name__ == '__main__':
+    flags, paths = parse_args(sys.argv[1:])
+    try:
+        profile = profile_settings(flags)
+    except ValueError:
+        flags['wrong'] = ''
+    interval = watch_interval(flags)
+    if set(flags) == {'batch'} and paths and (flags['batch'] or '0').isdigit():
+        developer_information()
+        problem_condition()
+        print('*****')
+        Batch.run(paths, int(flags['batch'] or 0))
+    elif set(flags) <= {'serve', 'watch'} and 'serve' in flags and paths and interval is not None:
+        developer_information()
+        problem_condition()
+        print('*****')
+        serve(paths, flags['serve'] or '8000', interval)
+    elif (not len(paths) == 1 or not set(flags) <= {'watch', 'profile', 'capture'}
+          or interval is None):
+        print('***** program aborted *****')
+    else:
+        developer_information()
+        problem_condition()
+        print('*****')
+        if 'watch' in flags:
+            watch(paths[0], interval)
+        else:
+            process(paths[0], profile)
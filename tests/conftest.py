@@ -0,0 +1,177 @@
+"""
+Module of Shtonda Yelizaveta, contains fixtures for tests, which run program on sample files of repository
+"""
+import os
+import sys
+import json
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import main
+import Builder
+import Validation
+
+CSV_FILE = os.path.join(ROOT, 'csv_file.csv')
+JSON_FILE = os.path.join(ROOT, 'json_file.json')
+INI_FILE = os.path.join(ROOT, 'ini_file.ini')
+RESULT_FILE = os.path.join(ROOT, 'result.txt')
+ENCODING = 'utf_8_sig'
+FIELDS = {'name': 0, 'surname': 1, 'points': 2, 'middle_name': 3, 'cond': 4, 'year': 5, 'month': 6, 'day': 7}
+ERRORS = {
+    'fields': ('fields', None, 'Some troubles with csv_file'),
+    'cond': ('cond', 'abc', 'something wrong with problem`s condition'),
+    'name': ('name', 'Ів4н', 'something wrong with student`s name'),
+    'surname': ('surname', 'Петренко!', 'something wrong with student`s name'),
+    'middle_name': ('middle_name', 'О' * 31, 'something wrong with student`s name'),
+    'points': ('points', '101', 'something wrong with points'),
+    'year': ('year', '1999', 'something wrong with year'),
+    'month': ('month', '13', 'something wrong with month'),
+    'day': ('day', '31', 'day is out of range for month'),
+    'repeated attempt': ('repeated', None, 'Attempt has already been added'),
+}
+
+
+def read_lines(path=CSV_FILE):
+    """
+    :param path: path to .csv file
+    :return: list of lines of file without new line symbols
+    """
+    with open(path, 'r', encoding=ENCODING) as f:
+        return f.read().splitlines()
+
+
+def read_rows(lines=None):
+    """
+    :param lines: lines of .csv file, None to use csv_file.csv
+    :return: list of converted rows of not empty lines in order of parameters of method Information.load()
+    """
+    return [Builder.Builder._convert_fields(i.split(';')) for i in (read_lines() if lines is None else lines) if i]
+
+
+def read_result(path=RESULT_FILE):
+    """
+    :param path: path to output file
+    :return: text of file (new lines are translated, result.txt was written with '\r\n')
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def broken_lines(field, value):
+    """
+    :param field: name of changed field, 'fields' to cut the last field or 'repeated' to repeat line
+    :param value: new value of field
+    :return: lines of csv_file.csv, where the 13th line is changed (its month is April, so day 31 is improper)
+    """
+    lines = read_lines()
+    line = lines[12].split(';')
+    assert line[FIELDS['month']] == '4' and line[FIELDS['day']] != '31'
+    if field == 'fields':
+        lines[12] = ';'.join(line[:-1])
+    elif field == 'repeated':
+        lines.insert(12, lines[12])
+    else:
+        line[FIELDS[field]] = value
+        lines[12] = ';'.join(line)
+    return lines
+
+
+def check_output(run, make_ini, input_keys=None, output_keys=None):
+    """
+    :param run: fixture run
+    :param make_ini: fixture make_ini
+    :param input_keys: dictionary of optional keys of section "input"
+    :param output_keys: dictionary of optional keys of section "output"
+    runs program on sample files and checks that output is the same as result.txt
+    :return: printed text
+    """
+    path, output_file = make_ini(input_keys, output_keys)
+    out = run(path)
+    assert 'program aborted' not in out and 'json?=csv: OK' in out
+    assert read_result(output_file) == read_result()
+    return out
+
+
+def check_error(run, make_ini, input_keys, error):
+    """
+    :param run: fixture run
+    :param make_ini: fixture make_ini
+    :param input_keys: dictionary of optional keys of section "input"
+    :param error: value of ERRORS
+    runs program on broken sample file and checks that it stops with message of the first version
+    """
+    field, value, message = error
+    path, output_file = make_ini(input_keys, lines=broken_lines(field, value))
+    out = run(path)
+    assert out.endswith(f'\n***** program aborted *****\n{message}\n')
+    assert not os.path.exists(output_file)
+
+
+@pytest.fixture(autouse=True)
+def checked_fields():
+    """
+    turns checks of fields on before every test (key "trusted" turns them off for the whole process)
+    """
+    Validation.trust(False)
+    yield
+    Validation.trust(False)
+
+
+@pytest.fixture
+def make_ini(tmp_path):
+    """
+    :param tmp_path: temporary directory of test
+    :return: function, which writes .ini file for sample files (or for given lines of .csv file and numbers of .json
+    file) into tmp_path and returns paths to .ini file and to its output file
+    """
+    def make(input_keys=None, output_keys=None, lines=None, stat=None, name='test'):
+        """
+        :param input_keys: dictionary of optional keys of section "input"
+        :param output_keys: dictionary of optional keys of section "output"
+        :param lines: lines of .csv file, None to use csv_file.csv
+        :param stat: dictionary of .json file, None to use json_file.json (or to count lines)
+        :param name: name of files without extension
+        :return: path to .ini file and path to output file
+        """
+        main_file = CSV_FILE
+        additional_file = JSON_FILE
+        if lines is not None:
+            main_file = str(tmp_path / f'{name}.csv')
+            with open(main_file, 'w', encoding=ENCODING) as f:
+                f.write(''.join(f'{i}\n' for i in lines))
+            if stat is None:
+                stat = {'сума довжин всіх прізвищ': sum(len(i.split(';')[1]) for i in lines if ';' in i),
+                        'кількість записів': sum(1 for i in lines if i)}
+        if stat is not None:
+            additional_file = str(tmp_path / f'{name}.json')
+            with open(additional_file, 'w', encoding=ENCODING) as f:
+                json.dump(stat, f, ensure_ascii=False)
+        output_file = str(tmp_path / f'{name}.txt')
+        ini = {'input': {'csv': main_file, 'json': additional_file, 'encoding': ENCODING, **(input_keys or {})},
+               'output': {'fname': output_file, 'encoding': 'utf-8', **(output_keys or {})}}
+        path = str(tmp_path / f'{name}.ini')
+        with open(path, 'w', encoding='utf8') as f:
+            json.dump(ini, f, ensure_ascii=False)
+        return path, output_file
+    return make
+
+
+@pytest.fixture
+def run(capsys):
+    """
+    :param capsys: fixture, which captures printed text
+    :return: function, which runs main.process() for .ini file and returns printed text
+    """
+    def process(path, profile=None):
+        """
+        :param path: path to .ini file
+        :param profile: settings of profiling like in main.process()
+        :return: printed text
+        """
+        capsys.readouterr()
+        main.process(path, profile)
+        return capsys.readouterr().out
+    return process
@@ -0,0 +1,80 @@
+"""
+Module of Shtonda Yelizaveta, contains tests, which compare program with its first version: output of sample
+files is result.txt, improper .csv, .json and .ini files stop program with the same messages
+"""
+import os
+import json
+import shutil
+import pytest
+from conftest import ROOT, ERRORS, check_output, check_error, read_result
+
+
+def test_result_file_is_baseline():
+    """
+    result.txt of repository is output of ini_file.ini in tsv format
+    """
+    text = read_result()
+    assert text.endswith('\n')
+    for line in text.splitlines():
+        fields = line.split('\t')
+        assert len(fields) == 6 and fields[0] == '' or len(fields) == 4 and fields[0] != ''
+
+
+def test_ini_file(run, monkeypatch, tmp_path):
+    """
+    ini_file.ini of repository gives result.txt (it is copied, so result.txt is not rewritten)
+    """
+    for name in ('ini_file.ini', 'csv_file.csv', 'json_file.json'):
+        shutil.copy(os.path.join(ROOT, name), tmp_path / name)
+    monkeypatch.chdir(tmp_path)
+    out = run('ini_file.ini')
+    assert out == ('ini ini_file.ini: OK\ninput-csv csv_file.csv: OK\ninput-json json_file.json: OK\n'
+                   'json?=csv: OK\noutput result.txt: OK\n')
+    assert read_result(tmp_path / 'result.txt') == read_result()
+
+
+def test_sample_files(run, make_ini):
+    """
+    sample files give result.txt
+    """
+    check_output(run, make_ini)
+
+
+@pytest.mark.parametrize('error', ERRORS.values(), ids=ERRORS.keys())
+def test_csv_errors(run, make_ini, error):
+    """
+    improper field or repeated attempt stops program with message of the first version
+    """
+    check_error(run, make_ini, {}, error)
+
+
+def test_json_mismatch(run, make_ini):
+    """
+    quantities of .json file, which differ from .csv file, are reported by 'UPS'
+    """
+    path, output_file = make_ini(stat={'сума довжин всіх прізвищ': 111, 'кількість записів': 14})
+    assert 'json?=csv: UPS\n' in run(path)
+
+
+def test_json_keys(run, make_ini):
+    """
+    .json file without needed keys stops program
+    """
+    path, output_file = make_ini(stat={'кількість записів': 15})
+    out = run(path)
+    assert out.endswith('\n***** program aborted *****\nThere are no needed keys in additional file\n')
+
+
+@pytest.mark.parametrize('section', ['input', 'output'])
+def test_ini_keys(run, make_ini, section):
+    """
+    .ini file without needed keys stops program
+    """
+    path, output_file = make_ini()
+    with open(path, 'r', encoding='utf8') as f:
+        ini = json.load(f)
+    del ini[section]['encoding']
+    with open(path, 'w', encoding='utf8') as f:
+        json.dump(ini, f, ensure_ascii=False)
+    out = run(path)
+    assert out == f'ini {path}: \n***** program aborted *****\nSomething wrong with {section} keys in .ini file\n'
@@ -0,0 +1,95 @@
+"""
+Module of Shtonda Yelizaveta, contains tests of batch of jobs, which share loaded .csv files
+"""
+import os
+import json
+import Batch
+from conftest import read_lines, read_result
+
+
+def ini_dict(path):
+    """
+    :param path: path to .ini file
+    :return: dictionary of .ini file (job of manifest)
+    """
+    with open(path, 'r', encoding='utf8') as f:
+        return json.load(f)
+
+
+def write_manifest(tmp_path, jobs):
+    """
+    :param tmp_path: temporary directory of test
+    :param jobs: list of jobs of manifest
+    :return: path to manifest
+    """
+    path = str(tmp_path / 'manifest.json')
+    with open(path, 'w', encoding='utf8') as f:
+        json.dump({'jobs': jobs}, f, ensure_ascii=False)
+    return path
+
+
+def test_batch(make_ini, capsys):
+    """
+    jobs of batch with the same .csv file share loaded data and give result.txt
+    """
+    first, first_output = make_ini(name='first')
+    second, second_output = make_ini(name='second')
+    assert Batch.run([first, second], 2) == []
+    out = capsys.readouterr().out
+    assert 'batch: 2 of 2 jobs OK' in out and out.count('input-csv') == 1 and out.count('json?=csv: OK') == 2
+    assert read_result(first_output) == read_result() and read_result(second_output) == read_result()
+
+
+def test_different_files(make_ini, capsys):
+    """
+    jobs with different .csv files are loaded separately
+    """
+    first, first_output = make_ini(name='first')
+    second, second_output = make_ini(lines=read_lines()[:5], name='second')
+    assert Batch.run([first, second], 1) == []
+    out = capsys.readouterr().out
+    assert out.count('input-csv') == 2 and 'batch: 2 of 2 jobs OK' in out
+    assert read_result(first_output) == read_result() and read_result(second_output) != read_result()
+
+
+def test_missing_json_of_first_job(make_ini, capsys, tmp_path):
+    """
+    absent .json file of the first job of group fails only this job
+    """
+    path, missing_output = make_ini(name='missing')
+    missing = ini_dict(path)
+    missing['input']['json'] = str(tmp_path / 'absent.json')
+    path, output_file = make_ini(name='valid')
+    manifest = write_manifest(tmp_path, [missing, ini_dict(path)])
+    assert Batch.run([manifest], 1) == [f'{manifest}[0]']
+    out = capsys.readouterr().out
+    assert 'batch: 1 of 2 jobs OK' in out and out.count('input-csv') == 1
+    assert not os.path.exists(missing_output)
+    assert read_result(output_file) == read_result()
+
+
+def test_mismatched_json(make_ini, capsys):
+    """
+    every job checks its own .json file
+    """
+    first, first_output = make_ini(name='first')
+    second, second_output = make_ini(stat={'сума довжин всіх прізвищ': 1, 'кількість записів': 1}, name='second')
+    assert Batch.run([first, second], 1) == []
+    out = capsys.readouterr().out
+    assert out.count('json?=csv: OK') == 1 and out.count('json?=csv: UPS') == 1
+    assert read_result(second_output) == read_result()
+
+
+def test_improper_jobs(make_ini, capsys, tmp_path):
+    """
+    improper manifest, .ini file or job fails only itself
+    """
+    path, output_file = make_ini()
+    manifest = str(tmp_path / 'broken.json')
+    with open(manifest, 'w', encoding='utf8') as f:
+        json.dump({'jobs': 'test.ini'}, f)
+    jobs = write_manifest(tmp_path, [{'input': {}}, path])
+    assert Batch.run([manifest, str(tmp_path / 'absent.ini'), jobs], 1) == \
+        [manifest, str(tmp_path / 'absent.ini'), f'{jobs}[0]']
+    assert 'batch: 1 of 4 jobs OK' in capsys.readouterr().out
+    assert read_result(output_file) == read_result()
@@ -0,0 +1,76 @@
+"""
+Module of Shtonda Yelizaveta, contains tests of generator of .csv files and harness of benchmarks
+"""
+import json
+import pytest
+import Benchmark
+
+
+def case(ini, load, peak_memory):
+    """
+    :param ini: path to .ini file
+    :param load: time of stage load
+    :param peak_memory: peak memory of process
+    :return: dictionary of results of one .ini file like in function Benchmark.run()
+    """
+    return {'ini': ini, 'stages': {'load_ini': 0.001, 'load': load, 'fit': 0.01, 'output': 0.1},
+            'peak_memory': peak_memory}
+
+
+def test_generate(run, tmp_path):
+    """
+    generated files are proper: program checks them with OK, the same seed gives the same .csv file
+    """
+    path = Benchmark.generate(str(tmp_path / 'first.csv'), 500, problems=7, students=40, attempts=2, seed=3)
+    assert path == str(tmp_path / 'first.ini')
+    out = run(path)
+    assert 'program aborted' not in out and 'json?=csv: OK' in out
+    with open(tmp_path / 'first.csv', 'r', encoding='utf_8_sig') as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 500 and all(len(i.split(';')) == 8 for i in lines)
+    Benchmark.generate(str(tmp_path / 'second.csv'), 500, problems=7, students=40, attempts=2, seed=3)
+    assert (tmp_path / 'first.csv').read_bytes() == (tmp_path / 'second.csv').read_bytes()
+
+
+def test_generate_too_many_rows(tmp_path):
+    """
+    rows, which can not be generated without repeated attempts, are not generated
+    """
+    with pytest.raises(ValueError):
+        Benchmark.generate(str(tmp_path / 'data.csv'), 100, problems=2, students=2, attempts=2)
+
+
+def test_measure(tmp_path):
+    """
+    measurement has time of every stage and speed of loading of all records
+    """
+    path = Benchmark.generate(str(tmp_path / 'data.csv'), 300, problems=5, students=30)
+    result = Benchmark.measure(path)
+    assert set(result['stages']) == set(Benchmark.STAGES)
+    assert result['records'] == 300 and result['fit'] and result['rows_per_second'] > 0
+
+
+def test_compare():
+    """
+    only growth of time or memory bigger than tolerance of the same .ini file is regression, unknown memory is
+    not compared
+    """
+    old = {'cases': [case('a.ini', 1.0, 100), case('b.ini', 1.0, 100)]}
+    new = {'cases': [case('a.ini', 1.05, 100), case('b.ini', 1.5, 200), case('c.ini', 9.0, 900)]}
+    assert Benchmark.compare(old, new) == [('b.ini', 'load', 1.0, 1.5), ('b.ini', 'peak_memory', 100, 200)]
+    assert Benchmark.compare(old, new, tolerance=1.0) == []
+    new['cases'][0]['peak_memory'] = None
+    old['cases'][0]['peak_memory'] = 1000
+    assert Benchmark.compare(new, old) == []
+
+
+def test_save(tmp_path):
+    """
+    saved results are loaded back and compared without regressions
+    """
+    results = {'cases': [case('a.ini', 1.0, 100)]}
+    path = str(tmp_path / 'results.json')
+    Benchmark.save(results, path)
+    with open(path, 'r', encoding='utf8') as f:
+        loaded = json.load(f)
+    assert loaded == results and Benchmark.compare(loaded, results) == []
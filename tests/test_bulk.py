@@ -0,0 +1,62 @@
+"""
+Module of Shtonda Yelizaveta, contains tests of loading of rows by batches and iterables, improper row of batch
+stops loading with the same error as loading row by row and leaves only proper rows in data
+"""
+import pytest
+import Service
+import Information
+import ColumnInformation
+import SpillInformation
+from conftest import read_rows, read_result
+
+NEW_COND = 'Знайти корені нового рівняння'
+BACKENDS = {
+    'objects': Information.Information,
+    'columns': ColumnInformation.ColumnInformation,
+    'spill': lambda: SpillInformation.SpillInformation(spill_rows=4),
+}
+
+
+def report(data, rows):
+    """
+    :param data: object of class Information, ColumnInformation or SpillInformation with loaded rows
+    :param rows: all loaded rows
+    :return: text of report of data in format 'tsv'
+    """
+    data.load_add_inf(len(rows), sum(len(i[1]) for i in rows))
+    return Service.render(data, 'tsv', 'utf-8').decode('utf-8')
+
+
+@pytest.mark.parametrize('backend', BACKENDS.values(), ids=BACKENDS.keys())
+def test_batches(backend):
+    """
+    rows, loaded by batches of different sizes, by generator or by columns, give result.txt
+    """
+    rows = read_rows()
+    for batches in ([rows], [rows[:1], rows[1:8], rows[8:]], [iter(rows)], [zip(*zip(*rows))]):
+        data = backend()
+        loaded = sum(data.load_many(i)[0] for i in batches)
+        assert loaded == len(rows)
+        assert report(data, rows) == read_result()
+
+
+@pytest.mark.parametrize('backend', BACKENDS.values(), ids=BACKENDS.keys())
+@pytest.mark.parametrize('field, value, message', [(0, 'Ів4н', 'something wrong with student`s name'),
+                                                   (7, 31, 'day is out of range for month')], ids=['name', 'day'])
+def test_state_after_error(backend, field, value, message):
+    """
+    improper row of new problem and new student does not leave them in data, rows before it stay loaded and
+    report of data is the same as before
+    """
+    rows = read_rows()
+    data = backend()
+    data.load_many(rows)
+    row = ['Іван', 'Яковенко', 70, 'Петрович', NEW_COND, 2020, 4, 3]
+    row[field] = value
+    with pytest.raises(ValueError, match=message):
+        data.load_many([tuple(row)])
+    assert data.problem_counts(NEW_COND) is None
+    assert data.counters()['problems'] == len({i[4] for i in rows})
+    if 'students' in data.counters():
+        assert data.counters()['students'] == len({(i[0], i[1], i[3]) for i in rows})
+    assert report(data, rows) == read_result()
@@ -0,0 +1,49 @@
+"""
+Module of Shtonda Yelizaveta, contains tests of backend "columns", which keeps attempts in typed columns
+"""
+import json
+import pytest
+import Service
+import Information
+import ColumnInformation
+from conftest import ERRORS, check_output, check_error, read_rows, read_result
+
+
+def test_sample_files(run, make_ini):
+    """
+    backend "columns" gives result.txt
+    """
+    check_output(run, make_ini, {'backend': 'columns'})
+
+
+def test_backend_key_first(run, make_ini):
+    """
+    key "backend" can be written before needed keys of section "input"
+    """
+    path, output_file = make_ini({'backend': 'columns'})
+    with open(path, 'r', encoding='utf8') as f:
+        ini = json.load(f)
+    ini['input'] = {'backend': 'columns', **ini['input']}
+    with open(path, 'w', encoding='utf8') as f:
+        json.dump(ini, f, ensure_ascii=False)
+    assert 'json?=csv: OK' in run(path)
+    assert read_result(output_file) == read_result()
+
+
+@pytest.mark.parametrize('error', ERRORS.values(), ids=ERRORS.keys())
+def test_csv_errors(run, make_ini, error):
+    """
+    backend "columns" stops with the same messages as backend "objects"
+    """
+    check_error(run, make_ini, {'backend': 'columns'}, error)
+
+
+def test_same_report_as_objects():
+    """
+    objects of both backends, loaded from the same rows, give the same report
+    """
+    rows = read_rows()
+    columns = ColumnInformation.ColumnInformation.from_records(rows)
+    objects = Information.Information.from_records(rows)
+    assert columns.records_sum == objects.records_sum == len(rows)
+    assert Service.render(columns, 'tsv', 'utf-8') == Service.render(objects, 'tsv', 'utf-8')
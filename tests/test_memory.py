@@ -0,0 +1,91 @@
+"""
+Module of Shtonda Yelizaveta, contains tests of memory budget: sizes of structures of data are counted during
+loading, data, which needs more memory, is loaded again into more compact backend or stops program
+"""
+import os
+import pytest
+import Memory
+import Information
+from conftest import CSV_FILE, read_rows, read_result
+
+
+@pytest.fixture
+def bytes_budget(monkeypatch):
+    """
+    makes key "memory_budget" count bytes instead of MiB, so small sample file can exceed budget
+    """
+    monkeypatch.setattr(Memory, 'MIB', 1)
+
+
+def test_enough_memory(run, make_ini):
+    """
+    data, which fits into budget, is loaded by asked backend and sizes of its structures are printed
+    """
+    path, output_file = make_ini({'memory_budget': 64})
+    out = run(path)
+    assert 'is exceeded' not in out and '\nmemory: problems ' in out
+    assert read_result(output_file) == read_result()
+
+
+def test_degrade(run, make_ini, bytes_budget):
+    """
+    backend "objects" needs more memory than budget, so data is loaded again by backend "columns" and gives
+    result.txt, line about loading of .csv file is printed once
+    """
+    path, output_file = make_ini({'memory_budget': 10000})
+    out = run(path)
+    lines = out.splitlines()
+    assert lines[1].startswith('Memory budget of 10000 MiB is exceeded: ')
+    assert lines[1].endswith(', backend "columns" is used')
+    assert lines[2] == f'input-csv {CSV_FILE}: OK'
+    assert out.count('input-csv') == 1 and 'json?=csv: OK' in out
+    assert read_result(output_file) == read_result()
+
+
+def test_fail(run, make_ini, bytes_budget):
+    """
+    with "memory_action" "fail" data, which needs more memory than budget, stops program
+    """
+    path, output_file = make_ini({'memory_budget': 10000, 'memory_action': 'fail'})
+    out = run(path)
+    assert 'is used' not in out and out.count('input-csv') == 1
+    assert '\n***** program aborted *****\nMemory budget of 10000 MiB is exceeded: ' in out
+    assert not os.path.exists(output_file)
+
+
+def test_no_compact_backend(run, make_ini, bytes_budget):
+    """
+    data, which needs more memory than budget in all backends, stops program after backend "spill"
+    """
+    path, output_file = make_ini({'memory_budget': 1000})
+    out = run(path)
+    assert 'backend "columns" is used' in out and 'backend "spill" is used' in out
+    assert out.count('input-csv') == 1 and '\n***** program aborted *****\nMemory budget of 1000 MiB' in out
+    assert not os.path.exists(output_file)
+
+
+def test_quarantine_is_not_degraded(run, make_ini, tmp_path, bytes_budget):
+    """
+    quarantine mode needs backend "objects", so it is not changed
+    """
+    path, output_file = make_ini({'memory_budget': 10000, 'quarantine': str(tmp_path / 'rejected.jsonl')})
+    out = run(path)
+    assert 'is used' not in out and '\n***** program aborted *****\nMemory budget of 10000 MiB' in out
+
+
+@pytest.mark.parametrize('streaming', [False, True])
+def test_attempts_in_memory(streaming):
+    """
+    attempts are counted by problems, which keep them (not by quantity of records, which is known only after
+    loading, attempts of dropped problems are freed)
+    """
+    rows = read_rows()
+    data = Information.Information(streaming)
+    for row in rows:
+        data.load(*row)
+    assert data.records_sum == 0
+    kept = sum(len(j.attempts) for i in data.problems if i.students is not None for j in i.order)
+    attempt = Information.Information._Problem._Student._Attempt
+    size = Memory.instance(attempt) + Memory.POINTER + Memory.INT + Memory.SET_ENTRY
+    assert data.memory()['attempts'] == kept * size
+    assert kept == len(rows) or streaming and kept < len(rows)
@@ -0,0 +1,22 @@
+"""
+Module of Shtonda Yelizaveta, contains tests of numpy engine of backend "columns"
+"""
+import pytest
+from conftest import check_output
+
+
+def test_sample_files(run, make_ini):
+    """
+    numpy engine gives result.txt
+    """
+    pytest.importorskip('numpy')
+    check_output(run, make_ini, {'backend': 'columns'}, {'engine': 'numpy'})
+
+
+def test_engine_needs_columns(run, make_ini):
+    """
+    numpy engine with backend "objects" stops program
+    """
+    path, output_file = make_ini(output_keys={'engine': 'numpy'})
+    out = run(path)
+    assert out.endswith('\n***** program aborted *****\nEngine "numpy" works only with backend "columns" in .ini file\n')
@@ -0,0 +1,33 @@
+"""
+Module of Shtonda Yelizaveta, contains tests of compact objects of class Information: objects without
+dictionaries of fields and names, which are stored once
+"""
+import sys
+import Information
+from conftest import read_rows
+
+
+def test_objects_have_slots():
+    """
+    problems, students and attempts have no dictionaries of fields
+    """
+    data = Information.Information.from_records(read_rows())
+    for problem in data.problems:
+        assert not hasattr(problem, '__dict__')
+        for student in problem.students.values():
+            assert not hasattr(student, '__dict__')
+            for attempt in student.attempts:
+                assert not hasattr(attempt, '__dict__')
+
+
+def test_strings_are_interned():
+    """
+    conditions and names, which are made from different lines, are stored once
+    """
+    rows = [tuple(''.join(list(i)) if isinstance(i, str) else i for i in row) for row in read_rows()]
+    data = Information.Information.from_records(rows)
+    for problem in data.problems:
+        assert problem.cond is sys.intern(problem.cond)
+        for student in problem.students.values():
+            assert student.surname is sys.intern(student.surname)
+            assert (student.name, student.surname, student.middle_name) in data.students_names
@@ -0,0 +1,49 @@
+"""
+Module of Shtonda Yelizaveta, contains tests of order of report: students and attempts are sorted only for
+problems, which were changed after the last sorting
+"""
+import Service
+import Information
+from conftest import read_rows, read_result
+
+
+def test_sorted_once():
+    """
+    problems are marked as not ordered after new attempts and as ordered after sorting
+    """
+    rows = read_rows()
+    data = Information.Information.from_records(rows)
+    data.sort()
+    assert all(i.ordered for i in data.problems)
+    data.load_many([('Іван', 'Яковенко', 70, 'Петрович', rows[0][4], 2020, 1, 1)])
+    assert not data.problems[0].ordered and all(i.ordered for i in data.problems[1:])
+    data.sort()
+    assert all(i.ordered for i in data.problems)
+
+
+def test_order_after_parts():
+    """
+    rows, loaded in two parts with sorting between them, give result.txt
+    """
+    rows = read_rows()
+    data = Information.Information()
+    data.load_many(rows[:7])
+    data.sort()
+    data.load_many(rows[7:])
+    data.load_add_inf(len(rows), 0)
+    assert Service.render(data, 'tsv', 'utf-8').decode('utf-8') == read_result()
+
+
+def test_order_of_report():
+    """
+    students of problem are in order of surname, name and middle name, attempts of student are in order of points
+    in descending order and year
+    """
+    data = Information.Information.from_records(read_rows())
+    data.sort()
+    for problem in data.problems:
+        names = [(i.surname, i.name, i.middle_name) for i in problem.order]
+        assert names == sorted(names)
+        for student in problem.order:
+            keys = [(-i.percent, i.year) for i in student.attempts]
+            assert keys == sorted(keys)
@@ -0,0 +1,73 @@
+"""
+Module of Shtonda Yelizaveta, contains tests of fast parser of memory-mapped .csv file and of parser of module csv
+"""
+import pytest
+import Builder
+from conftest import ENCODING, check_output, read_lines, read_result
+
+PARSERS = ['fast', 'csv']
+
+
+def quoted(line):
+    """
+    :param line: line of .csv file
+    :return: the same line with quoted name and condition and spaces after separators
+    """
+    fields = line.split(';')
+    fields[0] = f'"{fields[0]}"'
+    fields[4] = f'"{fields[4]}"'
+    return '; '.join(fields)
+
+
+@pytest.mark.parametrize('parser', PARSERS)
+def test_sample_files(run, make_ini, parser):
+    """
+    both parsers give result.txt
+    """
+    check_output(run, make_ini, {'parser': parser})
+
+
+@pytest.mark.parametrize('parser', PARSERS)
+def test_small_blocks(run, make_ini, monkeypatch, parser):
+    """
+    blocks, which are smaller than line, give result.txt
+    """
+    monkeypatch.setattr(Builder, 'BLOCK_SIZE', 7)
+    check_output(run, make_ini, {'parser': parser})
+
+
+@pytest.mark.parametrize('parser', PARSERS)
+def test_quoted_fields(run, make_ini, parser):
+    """
+    quoted fields and spaces after separators give result.txt
+    """
+    path, output_file = make_ini({'parser': parser}, lines=[quoted(i) if i else i for i in read_lines()])
+    run(path)
+    assert read_result(output_file) == read_result()
+
+
+@pytest.mark.parametrize('parser', PARSERS)
+@pytest.mark.parametrize('separator', ['\r\n', '\r'])
+def test_new_lines(run, make_ini, tmp_path, parser, separator):
+    """
+    lines, which end with '\\r\\n' or '\\r', give result.txt
+    """
+    path, output_file = make_ini({'parser': parser}, lines=read_lines())
+    main_file = path[:-len('.ini')] + '.csv'
+    with open(main_file, 'w', encoding=ENCODING, newline='') as f:
+        f.write(separator.join(read_lines()))
+    run(path)
+    assert read_result(output_file) == read_result()
+
+
+def test_quoted_new_line(run, make_ini):
+    """
+    quoted field with new line stops program with the same message with both parsers
+    """
+    lines = read_lines()
+    fields = lines[0].split(';')
+    fields[4] = f'"{fields[4][:10]}\n{fields[4][10:]}"'
+    lines[0] = ';'.join(fields)
+    for parser in PARSERS:
+        path, output_file = make_ini({'parser': parser}, lines=lines)
+        assert run(path).endswith('\n***** program aborted *****\nsomething wrong with problem`s condition\n')
@@ -0,0 +1,84 @@
+"""
+Module of Shtonda Yelizaveta, contains tests of statistics of attempts by months and ranges of months
+"""
+import pytest
+import Periods
+import Information
+import ColumnInformation
+import SpillInformation
+from conftest import read_rows
+
+BACKENDS = {
+    'objects': Information.Information,
+    'streaming': lambda: Information.Information(True),
+    'columns': ColumnInformation.ColumnInformation,
+    'spill': lambda: SpillInformation.SpillInformation(spill_rows=4),
+}
+RANGES = [(None, None), ((2010, 1), None), (None, (2015, 6)), ((2012, 3), (2012, 3)), ((2030, 1), None)]
+
+
+def counted(rows, start, end):
+    """
+    :param rows: rows of .csv file
+    :param start: the first month of range like in function Periods.bounds()
+    :param end: the last month of range like in function Periods.bounds()
+    :return: dictionary of quantities of attempts and good attempts of problems in range, counted by scanning rows
+    """
+    low, high = Periods.bounds(start, end)
+    counts = {}
+    for name, surname, percent, middle_name, cond, year, month, day in rows:
+        if low <= year * Periods.MONTHS + month - 1 <= high:
+            attempts, good = counts.get(cond, (0, 0))
+            counts[cond] = attempts + 1, good + (percent >= 60)
+    return counts
+
+
+@pytest.mark.parametrize('text, last, period', [('2020-01', False, (2020, 1)), ('2020', False, (2020, 1)),
+                                                ('2020', True, (2020, 12)), ('2020-12', True, (2020, 12))])
+def test_parse(text, last, period):
+    """
+    period is year and month or the whole year
+    """
+    assert Periods.parse(text, last) == period
+
+
+@pytest.mark.parametrize('text', ['2020-13', '2020-0', '20-01-01', 'abc', '', '2020-'])
+def test_improper_period(text):
+    """
+    improper period is not parsed
+    """
+    with pytest.raises(ValueError, match='Period has to be year or year and month like 2020-01'):
+        Periods.parse(text)
+
+
+def test_counters():
+    """
+    counters of months keep quantities of attempts and good attempts
+    """
+    periods = Periods.Periods()
+    periods.add(2020, 1, 60)
+    periods.add(2020, 1, 59)
+    periods.add(2021, 12, 100, 3)
+    assert periods.counts() == (5, 4, 80)
+    assert periods.counts((2020, 2), (2021, 11)) == (0, 0, None)
+    assert periods.months() == [(2020, 1, 2, 1), (2021, 12, 3, 3)]
+    with pytest.raises(ValueError, match='Period has to be pair of year and month'):
+        periods.counts((2020, 13))
+
+
+@pytest.mark.parametrize('backend', BACKENDS.values(), ids=BACKENDS.keys())
+@pytest.mark.parametrize('start, end', RANGES)
+def test_period_report(backend, start, end):
+    """
+    report of range has problems with attempts in range and the same quantities as found by scanning rows
+    """
+    rows = read_rows()
+    data = backend()
+    data.load_many(rows)
+    data.load_add_inf(len(rows), 0)
+    report = data.period_report(start, end)
+    assert {i[0]: i[1:3] for i in report} == counted(rows, start, end)
+    assert all(i[3] == round(i[2] / i[1] * 100) for i in report)
+    for cond, counts in counted(rows, start, end).items():
+        assert data.problem_periods(cond).counts(start, end)[:2] == counts
+    assert data.problem_periods('abc') is None
@@ -0,0 +1,163 @@
+"""
+Module of Shtonda Yelizaveta, contains tests of pipelined loading: stages in separate threads give the same output
+and errors as loading by one thread, queues are bounded and count their depth
+"""
+import io
+import json
+import threading
+import pytest
+import Pipeline
+from conftest import ERRORS, check_output, check_error, read_lines
+
+MODES = {
+    'objects': {'pipeline': True},
+    'csv parser': {'pipeline': True, 'parser': 'csv'},
+    'streaming': {'pipeline': True, 'streaming': True},
+    'columns': {'pipeline': True, 'backend': 'columns'},
+    'queue of one item': {'pipeline': 1},
+}
+
+
+@pytest.mark.parametrize('options', MODES.values(), ids=MODES.keys())
+def test_sample_files(run, make_ini, options):
+    """
+    pipelined loading gives result.txt and prints depth of queues of stages
+    """
+    out = check_output(run, make_ini, options)
+    assert ': OK, queues: read ' in out and ', parse ' in out
+
+
+def test_spill(run, make_ini, tmp_path):
+    """
+    pipelined loading with backend "spill" gives result.txt
+    """
+    check_output(run, make_ini, {'pipeline': True, 'backend': 'spill', 'spill': str(tmp_path), 'spill_rows': 4})
+
+
+@pytest.mark.parametrize('options', [MODES['objects'], MODES['columns']], ids=['objects', 'columns'])
+@pytest.mark.parametrize('error', ERRORS.values(), ids=ERRORS.keys())
+def test_errors(run, make_ini, options, error):
+    """
+    pipelined loading stops with the same messages as loading by one thread
+    """
+    check_error(run, make_ini, options, error)
+
+
+@pytest.mark.parametrize('parser', ['fast', 'csv'])
+def test_new_line_in_quotes(run, make_ini, parser):
+    """
+    condition with quoted new line is improper condition both in pipeline and without it
+    """
+    lines = read_lines()
+    line = lines[12].split(';')
+    line[4] = f'"{line[4]}\nабв"'
+    lines[12] = ';'.join(line)
+    for options in ({'parser': parser}, {'parser': parser, 'pipeline': True}):
+        path, output_file = make_ini(options, lines=lines)
+        out = run(path)
+        assert out.endswith('\n***** program aborted *****\nsomething wrong with problem`s condition\n')
+
+
+def test_json_keys(run, make_ini):
+    """
+    .json file, which is read during pipelined loading, stops program with the same message
+    """
+    path, output_file = make_ini({'pipeline': True}, stat={'кількість записів': 15})
+    out = run(path)
+    assert out.endswith('\n***** program aborted *****\nThere are no needed keys in additional file\n')
+
+
+@pytest.mark.parametrize('options', [{'workers': 2}, {'quarantine': 'rejected.jsonl'}, {'pipeline': 0}],
+                         ids=['workers', 'quarantine', 'size'])
+def test_improper_keys(run, make_ini, options):
+    """
+    pipeline works only with one worker, without quarantine and with positive size of queues
+    """
+    path, output_file = make_ini({'pipeline': True, **options})
+    out = run(path)
+    assert '\n***** program aborted *****\n' in out and 'input-csv' not in out
+
+
+def test_profile_report(run, make_ini, tmp_path):
+    """
+    statistics of queues of loading and writing are added to profiling report
+    """
+    report = str(tmp_path / 'report.json')
+    path, output_file = make_ini({'pipeline': True})
+    run(path, {'report': report})
+    with open(report, 'r', encoding='utf8') as f:
+        queues = json.load(f)['queues']
+    assert {'read', 'parse', 'write'} <= set(queues)
+    assert all(i['items'] > 0 and i['max_depth'] <= i['size'] for i in queues.values())
+
+
+def test_bounded_queue():
+    """
+    fast stage waits for slow consumer, so queue never has more items than its size
+    """
+    taken = []
+    with Pipeline.Pipeline(2) as pipeline:
+        for item in pipeline.stage('numbers', (i for i in range(50))):
+            taken.append(item)
+            info = pipeline.info()['numbers']
+            assert info['max_depth'] <= 2
+    assert taken == list(range(50))
+    assert info['items'] == 51
+
+
+def test_error_of_stage():
+    """
+    error of stage is passed through next stages and raised by caller
+    """
+    def numbers():
+        yield 1
+        raise ValueError('something wrong with points')
+
+    def doubled(items):
+        for i in items:
+            yield 2 * i
+
+    taken = []
+    with pytest.raises(ValueError, match='something wrong with points'):
+        with Pipeline.Pipeline() as pipeline:
+            for item in pipeline.stage('doubled', doubled(pipeline.stage('numbers', numbers()))):
+                taken.append(item)
+    assert taken == [2]
+
+
+def test_caller_leaves_pipeline():
+    """
+    when caller leaves pipeline before the end, stages are stopped and their threads are finished
+    """
+    def numbers():
+        i = 0
+        while True:
+            yield i
+            i += 1
+
+    with Pipeline.Pipeline(1) as pipeline:
+        for item in pipeline.stage('numbers', numbers()):
+            if item == 3:
+                break
+    assert not any(i.is_alive() for i in pipeline.threads)
+    assert all(i.name != 'numbers' for i in threading.enumerate())
+
+
+def test_queued_file():
+    """
+    pieces are written in order by thread 'write', error of writing is raised by writer
+    """
+    f = io.StringIO()
+    f.close = lambda: None
+    queued = Pipeline.QueuedFile(f, 1)
+    for i in range(20):
+        queued.write(f'{i}\n')
+    queued.close()
+    assert f.getvalue() == ''.join(f'{i}\n' for i in range(20))
+    assert queued.info()['write']['items'] == 21
+
+    queued = Pipeline.QueuedFile(io.BytesIO(), 1)
+    with pytest.raises(TypeError):
+        for i in range(20):
+            queued.write(f'{i}\n')
+        queued.close()
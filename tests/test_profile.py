@@ -0,0 +1,81 @@
+"""
+Module of Shtonda Yelizaveta, contains tests of profiling: report of stages, loading, counters and captures
+"""
+import json
+import pytest
+import main
+import Profiling
+from conftest import read_result
+
+
+def read_report(path):
+    """
+    :param path: path to report of profiling
+    :return: dictionary of report
+    """
+    with open(path, 'r', encoding='utf8') as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize('options', [{}, {'backend': 'columns'}, {'workers': 2}], ids=['objects', 'columns', 'workers'])
+def test_report(run, make_ini, tmp_path, options):
+    """
+    profiling does not change output, its report has stages, times of loading and counters of data
+    """
+    report = str(tmp_path / 'report.json')
+    path, output_file = make_ini(options)
+    out = run(path, {'report': report})
+    assert f'profile {report}: OK' in out
+    assert read_result(output_file) == read_result()
+    result = read_report(report)
+    assert set(result['stages']) == {'load_ini', 'load', 'fit', 'output'}
+    assert set(result['loading']) == {'parse', 'validate', 'aggregate'}
+    assert result['counters']['rows'] == 15 and result['counters']['problems'] > 0
+    assert result['rows_per_second'] > 0 and result['capture'] is None
+
+
+def test_profile_section(run, make_ini, tmp_path):
+    """
+    section "profile" of .ini file enables profiling, cProfile captures asked stage
+    """
+    report = str(tmp_path / 'report.json')
+    dump = str(tmp_path / 'load.prof')
+    path, output_file = make_ini()
+    with open(path, 'r', encoding='utf8') as f:
+        ini = json.load(f)
+    ini['profile'] = {'report': report, 'capture': 'cprofile', 'stage': 'output', 'top': 5, 'dump': dump}
+    with open(path, 'w', encoding='utf8') as f:
+        json.dump(ini, f, ensure_ascii=False)
+    assert f'profile {report}: OK' in run(path)
+    capture = read_report(report)['capture']
+    assert capture['tool'] == 'cprofile' and capture['stage'] == 'output'
+    assert (tmp_path / 'load.prof').exists()
+
+
+def test_tracemalloc(run, make_ini, tmp_path):
+    """
+    tracemalloc captures stage load with its peak memory
+    """
+    report = str(tmp_path / 'report.json')
+    path, output_file = make_ini()
+    run(path, {'report': report, 'capture': 'tracemalloc', 'stage': 'load'})
+    capture = read_report(report)['capture']
+    assert capture['tool'] == 'tracemalloc' and capture['peak'] > 0 and capture['top']
+
+
+@pytest.mark.parametrize('flags', [{'profile': 'report.json'}, {'capture': 'cprofile:fit'}, {'capture': 'tracemalloc'}])
+def test_profile_flags(flags):
+    """
+    flags --profile and --capture of cmd give settings of profiling
+    """
+    settings = main.profile_settings(flags)
+    assert Profiling.check_settings(settings)
+
+
+@pytest.mark.parametrize('settings', [[], {'capture': 'gprof'}, {'stage': 'sleep'}])
+def test_improper_settings(settings):
+    """
+    improper section "profile" stops program
+    """
+    with pytest.raises(ValueError, match='Something wrong with profile keys in .ini file'):
+        Profiling.check_settings(settings)
@@ -0,0 +1,110 @@
+"""
+Module of Shtonda Yelizaveta, contains tests of quarantine mode: bad rows do not stop loading, they are written to
+quarantine file with their places and reasons and are counted for check with .json file
+"""
+import json
+import pytest
+from conftest import CSV_FILE, ENCODING, ERRORS, broken_lines, read_lines, read_result
+
+
+def read_rejects(path):
+    """
+    :param path: path to quarantine file
+    :return: list of rejected rows (dictionaries)
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(i) for i in f]
+
+
+def offset(lines, number):
+    """
+    :param lines: lines of .csv file
+    :param number: number of line (from 1)
+    :return: offset of the first byte of line in file, written by fixture make_ini
+    """
+    return len(''.join(f'{i}\n' for i in lines[:number - 1]).encode(ENCODING))
+
+
+def test_without_bad_rows(run, make_ini, tmp_path):
+    """
+    good file gives result.txt and empty quarantine file
+    """
+    quarantine = str(tmp_path / 'rejected.jsonl')
+    path, output_file = make_ini({'quarantine': quarantine})
+    out = run(path)
+    assert f'input-csv {CSV_FILE}: OK, rejected 0 rows to {quarantine}\n' in out and 'json?=csv: OK' in out
+    assert read_result(output_file) == read_result()
+    assert read_rejects(quarantine) == []
+
+
+@pytest.mark.parametrize('error', ERRORS.values(), ids=ERRORS.keys())
+def test_bad_row(run, make_ini, tmp_path, error):
+    """
+    bad row is written to quarantine file, other rows give the same output as file without it, rejected row is
+    counted for check with .json file
+    """
+    field, value, message = error
+    quarantine = str(tmp_path / 'rejected.jsonl')
+    lines = broken_lines(field, value)
+    number = 14 if field == 'repeated' else 13
+    path, output_file = make_ini({'quarantine': quarantine}, lines=lines)
+    out = run(path)
+    assert f': OK, rejected 1 rows to {quarantine} ({message}: 1)\n' in out and 'json?=csv: OK' in out
+    assert read_rejects(quarantine) == [{'file': path[:-len('ini')] + 'csv', 'line': number,
+                                         'offset': offset(lines, number), 'reason': message,
+                                         'row': lines[number - 1]}]
+    clean_path, clean_output = make_ini(lines=lines[:number - 1] + lines[number:], name='clean')
+    run(clean_path)
+    assert read_result(output_file) == read_result(clean_output)
+
+
+def test_rows_of_many_lines(run, make_ini, tmp_path):
+    """
+    quoted field with new line makes one row of two lines, numbers and offsets of next lines are counted in file
+    """
+    quarantine = str(tmp_path / 'rejected.jsonl')
+    lines = read_lines()
+    line = lines[3].split(';')
+    line[1] = f'"{line[1]}\nПетренко"'
+    lines[3:4] = ';'.join(line).split('\n')
+    lines[8] = lines[8] + ';'
+    path, output_file = make_ini({'quarantine': quarantine}, lines=lines)
+    out = run(path)
+    assert ': OK, rejected 2 rows to' in out
+    rejects = read_rejects(quarantine)
+    assert [(i['line'], i['offset'], i['row']) for i in rejects] == \
+           [(4, offset(lines, 4), f'{lines[3]}\n{lines[4]}'), (9, offset(lines, 9), lines[8])]
+    assert {i['reason'] for i in rejects} == {'something wrong with student`s name', 'Some troubles with csv_file'}
+
+
+def test_undecodable_row(run, make_ini, tmp_path):
+    """
+    row, which is not text of encoding, is rejected with its bytes in text, it is counted in number of records,
+    but its surname is unknown
+    """
+    quarantine = str(tmp_path / 'rejected.jsonl')
+    lines = read_lines()
+    stat = {'сума довжин всіх прізвищ': sum(len(i.split(';')[1]) for i in lines[:4] + lines[5:] if i),
+            'кількість записів': sum(1 for i in lines if i)}
+    path, output_file = make_ini({'quarantine': quarantine}, lines=lines, stat=stat)
+    main_file = path[:-len('ini')] + 'csv'
+    with open(main_file, 'rb') as f:
+        content = f.read()
+    place = offset(lines, 5)
+    with open(main_file, 'wb') as f:
+        f.write(content[:place] + b'\xff' + content[place:])
+    out = run(path)
+    assert ': OK, rejected 1 rows to' in out and 'json?=csv: OK' in out
+    rejects = read_rejects(quarantine)
+    assert [(i['line'], i['offset'], i['row']) for i in rejects] == [(5, place, '\\xff' + lines[4])]
+    assert 'utf-8' in rejects[0]['reason']
+
+
+def test_quarantine_needs_objects(run, make_ini, tmp_path):
+    """
+    quarantine works only with backend "objects", other backends find repeated attempts after loading
+    """
+    path, output_file = make_ini({'quarantine': str(tmp_path / 'rejected.jsonl'), 'backend': 'columns'})
+    out = run(path)
+    assert out.endswith('\n***** program aborted *****\nQuarantine works only with backend "objects", one worker and '
+                        'without snapshot in .ini file\n')
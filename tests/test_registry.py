@@ -0,0 +1,77 @@
+"""
+Module of Shtonda Yelizaveta, contains tests of registry of students: every student is stored and checked once,
+problems refer to him by code, his attempts are found by his problems
+"""
+import Information
+import Scores
+from conftest import read_rows
+
+
+def test_student_is_registered_once():
+    """
+    student of many problems has one code, one names tuple and list of his problems
+    """
+    rows = read_rows()
+    data = Information.Information.from_records(rows)
+    names = {(row[0], row[1], row[3]) for row in rows}
+    assert sorted(data.students) == sorted(names) and len(data.students_names) == len(names)
+    for code, student in enumerate(data.students):
+        assert data.students_names[student] == code
+        problems = data.students_problems[code]
+        assert len(problems) == len(set(problems))
+        own = {row[4] for row in rows if (row[0], row[1], row[3]) == student}
+        assert {data.problems[i].cond for i in problems} == own
+        for found in problems:
+            found = data.problems[found]._find(code)
+            assert (found.name, found.surname, found.middle_name) == student
+            assert found.surname is student[1]
+
+
+def test_names_are_checked_once(monkeypatch):
+    """
+    names of student, loaded row by row, are checked only when he is registered
+    """
+    checked = []
+    check = Information.Information._Problem._Student._check_surname
+    monkeypatch.setattr(Information.Information._Problem._Student, '_check_surname',
+                        staticmethod(lambda surname: checked.append(surname) or check(surname)))
+    data = Information.Information()
+    for row in read_rows():
+        data.load(*row)
+    assert sorted(checked) == sorted(i[1] for i in data.students)
+
+
+def test_student_queries():
+    """
+    attempts and histogram of student are the same as found by all problems
+    """
+    rows = read_rows()
+    data = Information.Information.from_records(rows)
+    for student in data.students:
+        own = [row for row in rows if (row[0], row[1], row[3]) == student]
+        attempts = data.student_attempts(*student)
+        assert sorted(attempts) == sorted((row[4], row[5], row[6], row[7], row[2]) for row in own)
+        assert [i[0] for i in attempts] == sorted((i[0] for i in attempts), key=data._find)
+        scores = data.student_scores(*student)
+        assert scores.total() == len(own) and scores.at_least() == sum(row[2] >= Scores.PASS for row in own)
+    assert data.student_attempts('Іван', 'Невідомий', 'Петрович') == []
+    assert data.student_scores('Іван', 'Невідомий', 'Петрович') is None
+
+
+def test_merge_recodes_students():
+    """
+    students of merged part get codes of registry of the main object, their problems are added to their lists
+    """
+    rows = read_rows()
+    whole = Information.Information.from_records(rows)
+    data = Information.Information.from_records(rows[7:])
+    part = data.copy_empty()
+    part.load_many(rows[:7])
+    data.merge(part)
+    assert sorted(data.students) == sorted(whole.students)
+    for student in whole.students:
+        assert sorted(data.student_attempts(*student)) == sorted(whole.student_attempts(*student))
+        assert data.student_scores(*student) == whole.student_scores(*student)
+        code = data.students_names[student]
+        assert sorted(data.problems[i].cond for i in data.students_problems[code]) == \
+               sorted(whole.problems[i].cond for i in whole.students_problems[whole.students_names[student]])
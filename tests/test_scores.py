@@ -0,0 +1,101 @@
+"""
+Module of Shtonda Yelizaveta, contains tests of queries with pass threshold, which are answered from histograms
+of points
+"""
+from collections import Counter
+import pytest
+import Scores
+import Information
+import ColumnInformation
+import SpillInformation
+from conftest import read_rows
+
+BACKENDS = {
+    'objects': Information.Information,
+    'streaming': lambda: Information.Information(True),
+    'columns': ColumnInformation.ColumnInformation,
+    'spill': lambda: SpillInformation.SpillInformation(spill_rows=4),
+}
+
+
+def loaded(backend):
+    """
+    :param backend: class (or function) which creates empty object of backend
+    :return: object of backend with rows of sample file
+    """
+    rows = read_rows()
+    data = backend()
+    data.load_many(rows)
+    data.load_add_inf(len(rows), sum(len(i[1]) for i in rows))
+    return data
+
+
+def passing(rows, threshold, part):
+    """
+    :param rows: rows of .csv file
+    :param threshold: points, which attempt has to reach to pass
+    :param part: percent of attempts, which have to pass
+    :return: set of conditions of problems with such attempts, counted by scanning rows
+    """
+    conds = {i[4] for i in rows}
+    return {cond for cond in conds
+            if sum(1 for i in rows if i[4] == cond and i[2] >= threshold) * 100 >=
+            part * sum(1 for i in rows if i[4] == cond)}
+
+
+def test_histogram():
+    """
+    histogram counts attempts with threshold points or more, their percentage and passing of part of attempts
+    """
+    scores = Scores.Histogram({40: 2, 60: 1, 100: 1})
+    assert scores.total() == 4 and scores.at_least() == 2 and scores.at_least(0) == 4 and scores.at_least(41) == 2
+    assert scores.percentage() == 50 and scores.percentage(100) == 25
+    assert scores.passes(60, 50) and not scores.passes(60, 51)
+    scores.add(100)
+    assert scores.at_least(100) == 2
+    assert scores.dense()[40] == 2 and len(scores.dense()) == Scores.MAX_PERCENT + 1
+    assert Scores.Histogram().percentage() is None and not Scores.Histogram().passes(0, 0)
+
+
+@pytest.mark.parametrize('threshold', [-1, 101, 60.5, '60'])
+def test_improper_threshold(threshold):
+    """
+    threshold has to be integer from 0 to 100
+    """
+    with pytest.raises(ValueError, match='Threshold has to be integer from 0 to 100'):
+        Scores.check_threshold(threshold)
+
+
+@pytest.mark.parametrize('backend', BACKENDS.values(), ids=BACKENDS.keys())
+@pytest.mark.parametrize('threshold, part', [(60, 100), (0, 100), (90, 50), (50, 0), (100, 1)])
+def test_passing_problems(backend, threshold, part):
+    """
+    problems with at least part percent of attempts with threshold points or more are the same as found by
+    scanning rows (with default values these are problems of output)
+    """
+    data = loaded(backend)
+    assert set(data.passing_problems(threshold, part)) == passing(read_rows(), threshold, part)
+
+
+@pytest.mark.parametrize('backend', BACKENDS.values(), ids=BACKENDS.keys())
+def test_problem_scores(backend):
+    """
+    histogram of problem counts points of all its attempts
+    """
+    rows = read_rows()
+    data = loaded(backend)
+    for cond in {i[4] for i in rows}:
+        assert data.problem_scores(cond) == Counter(i[2] for i in rows if i[4] == cond)
+    assert data.problem_scores('abc') is None
+
+
+@pytest.mark.parametrize('backend', ['objects', 'streaming', 'columns'])
+def test_student_scores(backend):
+    """
+    histogram of student counts points of all his attempts in all problems (in streaming mode too)
+    """
+    rows = read_rows()
+    data = loaded(BACKENDS[backend])
+    for names in {(i[0], i[1], i[3]) for i in rows}:
+        assert data.student_scores(*names) == Counter(i[2] for i in rows if (i[0], i[1], i[3]) == names)
+    assert data.student_scores('Абв', 'Абв', 'Абв') is None
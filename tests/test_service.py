@@ -0,0 +1,124 @@
+"""
+Module of Shtonda Yelizaveta, contains tests of local HTTP service, which keeps loaded datasets in memory
+"""
+import json
+import asyncio
+from urllib.parse import urlencode
+import pytest
+import Service
+from conftest import ROOT, INI_FILE, read_rows, read_result
+
+STUDENT = dict(zip(('name', 'surname', 'middle_name'), (read_rows()[0][0], read_rows()[0][1], read_rows()[0][3])))
+COND = read_rows()[0][4]
+REQUESTS = {
+    'report': ('/report/objects', 200),
+    'report of columns': ('/report/columns', 200),
+    'report of spill': ('/report/spill', 200),
+    'improper format': ('/report/objects?format=xml', 400),
+    'problem': (f'/problem/objects?{urlencode({"cond": COND})}', 200),
+    'problem of spill': (f'/problem/spill?{urlencode({"cond": COND})}', 200),
+    'unknown problem': ('/problem/objects?cond=abc', 404),
+    'problem without cond': ('/problem/objects', 400),
+    'student': (f'/student/objects?{urlencode(STUDENT)}', 200),
+    'student of columns': (f'/student/columns?{urlencode(STUDENT)}', 200),
+    'unknown student': (f'/student/objects?{urlencode({**STUDENT, "name": "Абв"})}', 404),
+    'unknown student of columns': (f'/student/columns?{urlencode({**STUDENT, "name": "Абв"})}', 404),
+    'student of spill': (f'/student/spill?{urlencode(STUDENT)}', 400),
+    'student without names': ('/student/objects?name=Іван', 400),
+    'problems': ('/problems/objects?threshold=90&part=50', 200),
+    'improper threshold': ('/problems/objects?threshold=101', 400),
+    'periods': ('/periods/objects?from=2000&to=2030-12', 200),
+    'improper period': ('/periods/objects?from=2020-13', 400),
+    'unknown request': ('/reports/objects', 404),
+    'unknown dataset': ('/report/absent', 404),
+}
+
+
+async def request(port, target, method='GET'):
+    """
+    :param port: port of service on Service.HOST
+    :param target: path and query of request
+    :param method: HTTP method
+    :return: HTTP status and body of answer
+    """
+    reader, writer = await asyncio.open_connection(Service.HOST, port)
+    writer.write(f'{method} {target} HTTP/1.1\r\nHost: localhost\r\n\r\n'.encode('utf-8'))
+    await writer.drain()
+    answer = await reader.read()
+    writer.close()
+    head, _, body = answer.partition(b'\r\n\r\n')
+    return int(head.split()[1]), body
+
+
+def ask(paths, targets, method='GET'):
+    """
+    :param paths: list of paths to .ini files of datasets
+    :param targets: list of paths and queries of requests
+    :param method: HTTP method
+    starts service on free port, sends requests one by one and stops service
+    :return: list of HTTP statuses and bodies of answers
+    """
+    async def main():
+        service = Service.Service(paths, workers=2)
+        server = await service.start(0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            return [await request(port, i, method) for i in targets]
+        finally:
+            server.close()
+            await server.wait_closed()
+            service.pool.shutdown()
+    return asyncio.run(main())
+
+
+@pytest.fixture
+def datasets(make_ini, tmp_path):
+    """
+    :return: paths to .ini files of datasets 'objects', 'columns' and 'spill' of sample files
+    """
+    return [make_ini(name='objects')[0], make_ini({'backend': 'columns'}, name='columns')[0],
+            make_ini({'backend': 'spill', 'spill': str(tmp_path), 'spill_rows': 4}, name='spill')[0]]
+
+
+def test_requests(datasets, capsys):
+    """
+    every request gets proper HTTP status, reports of all backends are the same as result.txt, answers of
+    backends "objects" and "columns" are the same
+    """
+    answers = dict(zip(REQUESTS, ask(datasets, [i for i, j in REQUESTS.values()])))
+    for name, (target, status) in REQUESTS.items():
+        assert answers[name][0] == status, name
+    for name in ('report', 'report of columns', 'report of spill'):
+        assert answers[name][1].decode('utf-8') == read_result()
+    assert answers['student'][1] == answers['student of columns'][1]
+    student = json.loads(answers['student'][1])
+    assert len(student['attempts']) == sum(1 for i in read_rows() if (i[0], i[1], i[3]) == tuple(STUDENT.values()))
+    problem = json.loads(answers['problem'][1])
+    assert problem['cond'] == COND and problem['attempts_num'] == sum(1 for i in read_rows() if i[4] == COND)
+    assert json.loads(answers['unknown student'][1]) == {'error': 'Unknown student'}
+    assert 'does not keep students' in json.loads(answers['student of spill'][1])['error']
+
+
+def test_datasets(datasets, capsys):
+    """
+    request /datasets lists datasets with quantities of records
+    """
+    [(status, body)] = ask(datasets, ['/datasets'])
+    assert status == 200
+    assert {i: j['records'] for i, j in json.loads(body).items()} == {'objects': 15, 'columns': 15, 'spill': 15}
+
+
+def test_only_get(datasets, capsys):
+    """
+    methods other than GET are not allowed
+    """
+    assert ask(datasets, ['/datasets'], 'POST')[0][0] == 405
+
+
+def test_render(capsys, monkeypatch):
+    """
+    service renders the same report as result.txt
+    """
+    monkeypatch.chdir(ROOT)
+    keys, data, stamp = Service._Dataset(INI_FILE).load()
+    assert Service.render(data, 'tsv', 'utf-8').decode('utf-8') == read_result()
@@ -0,0 +1,96 @@
+"""
+Module of Shtonda Yelizaveta, contains tests of loading of several .csv files (list or glob pattern), which can be
+compressed
+"""
+import os
+import bz2
+import gzip
+import lzma
+import pytest
+from conftest import read_lines, read_result, broken_lines
+
+OPENERS = {'': open, '.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+MODES = {
+    'objects': {},
+    'workers': {'workers': 2},
+    'columns': {'backend': 'columns'},
+    'pipeline': {'pipeline': True},
+}
+
+
+def write_shards(tmp_path, lines, extension='.gz'):
+    """
+    :param tmp_path: temporary directory of test
+    :param lines: lines of .csv file
+    :param extension: extension of compression of the second shard
+    writes the first 7 lines to plain file part1.csv and others to compressed file part2.csv
+    :return: paths to both files
+    """
+    first = str(tmp_path / 'part1.csv')
+    second = str(tmp_path / f'part2.csv{extension}')
+    with open(first, 'w', encoding='utf-8') as f:
+        f.write(''.join(f'{i}\n' for i in lines[:7]))
+    with OPENERS[extension](second, 'wt', encoding='utf-8') as f:
+        f.write(''.join(f'{i}\n' for i in lines[7:]))
+    return [first, second]
+
+
+@pytest.mark.parametrize('extension', OPENERS.keys(), ids=['plain', 'gz', 'bz2', 'xz'])
+@pytest.mark.parametrize('options', MODES.values(), ids=MODES.keys())
+def test_list(run, make_ini, tmp_path, extension, options):
+    """
+    list of plain and compressed shards gives result.txt
+    """
+    path, output_file = make_ini({**options, 'csv': write_shards(tmp_path, read_lines(), extension)})
+    out = run(path)
+    assert 'json?=csv: OK' in out
+    assert read_result(output_file) == read_result()
+
+
+@pytest.mark.parametrize('options', MODES.values(), ids=MODES.keys())
+def test_glob(run, make_ini, tmp_path, options):
+    """
+    glob pattern of shards gives result.txt
+    """
+    write_shards(tmp_path, read_lines())
+    path, output_file = make_ini({**options, 'csv': str(tmp_path / 'part*.csv*')})
+    out = run(path)
+    assert 'json?=csv: OK' in out
+    assert read_result(output_file) == read_result()
+
+
+def test_pattern_without_files(run, make_ini, tmp_path):
+    """
+    glob pattern without files stops program
+    """
+    pattern = str(tmp_path / 'absent*.csv')
+    path, output_file = make_ini({'csv': pattern})
+    assert run(path).endswith(f'\n***** program aborted *****\nThere are no files {pattern}\n')
+
+
+@pytest.mark.parametrize('options', MODES.values(), ids=MODES.keys())
+def test_error_in_compressed_shard(run, make_ini, tmp_path, options):
+    """
+    improper row of compressed shard stops program with the same message as in one file
+    """
+    path, output_file = make_ini({**options, 'csv': write_shards(tmp_path, broken_lines('day', '31'))})
+    out = run(path)
+    assert out.endswith('\n***** program aborted *****\nday is out of range for month\n')
+    assert not os.path.exists(output_file)
+
+
+def test_snapshot_of_shards(run, make_ini, tmp_path):
+    """
+    snapshot of shards is loaded only while all shards are the same
+    """
+    snapshot = str(tmp_path / 'data.snap')
+    files = write_shards(tmp_path, read_lines())
+    path, output_file = make_ini({'csv': files, 'snapshot': snapshot})
+    run(path)
+    assert f'input-snapshot {snapshot}: OK' in run(path)
+    lines = read_lines()
+    lines[8], lines[9] = lines[9], lines[8]
+    write_shards(tmp_path, lines)
+    out = run(path)
+    assert 'input-snapshot' not in out
+    assert read_result(output_file) == read_result()
@@ -0,0 +1,118 @@
+"""
+Module of Shtonda Yelizaveta, contains tests of snapshots: saved data is loaded instead of .csv file only with
+the same backend and checks of fields, damaged or forged snapshots are not loaded
+"""
+import os
+import hashlib
+import pytest
+import Information
+import Snapshot
+import Validation
+from conftest import CSV_FILE, read_rows, read_result
+
+BACKENDS = {
+    'objects': {},
+    'streaming': {'streaming': True},
+    'columns': {'backend': 'columns'},
+}
+
+
+@pytest.mark.parametrize('options', BACKENDS.values(), ids=BACKENDS.keys())
+def test_snapshot(run, make_ini, tmp_path, options):
+    """
+    the first run saves snapshot, the second run loads it instead of .csv file, both give result.txt
+    """
+    snapshot = str(tmp_path / 'data.snap')
+    path, output_file = make_ini({**options, 'snapshot': snapshot})
+    out = run(path)
+    assert 'input-snapshot' not in out and os.path.exists(snapshot)
+    assert read_result(output_file) == read_result()
+    os.remove(output_file)
+    out = run(path)
+    assert f'input-snapshot {snapshot}: OK' in out and 'input-csv' not in out
+    assert read_result(output_file) == read_result()
+
+
+def test_snapshot_keeps_state(run, make_ini, tmp_path):
+    """
+    loaded snapshot has the same registry, problems, students and attempts as loaded .csv file
+    """
+    snapshot = str(tmp_path / 'data.snap')
+    path, output_file = make_ini({'snapshot': snapshot})
+    run(path)
+    data = Information.Information()
+    data.load_many(read_rows())
+    data.load_add_inf(0, 0)
+    loaded = Information.Information()
+    assert Snapshot.load(loaded, CSV_FILE, snapshot)
+    assert loaded.students == data.students and loaded.students_names == data.students_names
+    assert loaded.students_scores == data.students_scores and loaded.students_problems == data.students_problems
+    assert loaded.problems_names == data.problems_names
+    for i, j in zip(loaded.problems, data.problems):
+        assert (i.cond, i.scores, i.periods, i._attempt_num(), i._good_attempt_num()) == \
+               (j.cond, j.scores, j.periods, j._attempt_num(), j._good_attempt_num())
+        assert [(k.name, k.surname, k.middle_name, k.dates, [(a.percent, a.year, a.month, a.day) for a in k.attempts])
+                for k in i.order] == \
+               [(k.name, k.surname, k.middle_name, k.dates, [(a.percent, a.year, a.month, a.day) for a in k.attempts])
+                for k in j.order]
+
+
+def test_trusted_snapshot_is_not_loaded_with_checks(run, make_ini, tmp_path):
+    """
+    snapshot, saved without checks of fields, is not loaded, when fields are checked
+    """
+    snapshot = str(tmp_path / 'data.snap')
+    path, output_file = make_ini({'trusted': True, 'snapshot': snapshot})
+    run(path)
+    Validation.trust(False)
+    assert not Snapshot.load(Information.Information(), CSV_FILE, snapshot)
+    Validation.trust(True)
+    assert Snapshot.load(Information.Information(), CSV_FILE, snapshot)
+    path, output_file = make_ini({'snapshot': snapshot}, name='checked')
+    out = run(path)
+    assert 'input-snapshot' not in out
+    assert read_result(output_file) == read_result()
+
+
+def test_corrupted_snapshot_is_not_loaded(run, make_ini, tmp_path):
+    """
+    snapshot with changed byte of fields is not loaded, .csv file is loaded instead
+    """
+    snapshot = str(tmp_path / 'data.snap')
+    path, output_file = make_ini({'snapshot': snapshot})
+    run(path)
+    with open(snapshot, 'rb') as f:
+        content = bytearray(f.read())
+    place = content.find('Тесленко'.encode('utf-8'), Snapshot.HEADER.size)
+    assert place != -1
+    content[place + 1] ^= 1
+    with open(snapshot, 'wb') as f:
+        f.write(content)
+    assert not Snapshot.load(Information.Information(), CSV_FILE, snapshot)
+    os.remove(output_file)
+    out = run(path)
+    assert 'input-snapshot' not in out
+    assert read_result(output_file) == read_result()
+
+
+@pytest.mark.parametrize('backend', ['objects', 'columns'])
+@pytest.mark.parametrize('change', ['cut', 'append'])
+def test_forged_snapshot_is_not_loaded(run, make_ini, tmp_path, backend, change):
+    """
+    snapshot with improper blocks is not loaded, even if hash in its header is calculated for changed blocks
+    """
+    snapshot = str(tmp_path / 'data.snap')
+    path, output_file = make_ini({'backend': backend, 'snapshot': snapshot})
+    run(path)
+    with open(snapshot, 'rb') as f:
+        header = f.read(Snapshot.HEADER.size)
+        payload = f.read()
+    payload = payload[:-1] if change == 'cut' else payload + Snapshot.BLOCK.pack(b'I', 0)
+    magic, version, size, digest, payload_digest = Snapshot.HEADER.unpack(header)
+    with open(snapshot, 'wb') as f:
+        f.write(Snapshot.HEADER.pack(magic, version, size, digest, hashlib.sha256(payload).digest()))
+        f.write(payload)
+    os.remove(output_file)
+    out = run(path)
+    assert 'input-snapshot' not in out
+    assert read_result(output_file) == read_result()
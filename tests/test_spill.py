@@ -0,0 +1,66 @@
+"""
+Module of Shtonda Yelizaveta, contains tests of backend "spill", which writes attempts to sorted temporary files
+and merges them after loading
+"""
+import os
+from collections import Counter
+import pytest
+import Service
+import SpillInformation
+from conftest import ERRORS, check_output, check_error, read_rows, read_result
+
+
+@pytest.mark.parametrize('spill_rows', [1, 4, SpillInformation.SPILL_ROWS])
+def test_sample_files(run, make_ini, tmp_path, spill_rows):
+    """
+    backend "spill" with any size of buffer gives result.txt, temporary files are removed
+    """
+    check_output(run, make_ini, {'backend': 'spill', 'spill': str(tmp_path), 'spill_rows': spill_rows})
+
+
+@pytest.mark.parametrize('error', ERRORS.values(), ids=ERRORS.keys())
+def test_csv_errors(run, make_ini, tmp_path, error):
+    """
+    backend "spill" stops with the same messages as backend "objects" (repeated attempts are found during merging)
+    """
+    check_error(run, make_ini, {'backend': 'spill', 'spill': str(tmp_path), 'spill_rows': 4}, error)
+
+
+def test_merge_passes(monkeypatch, tmp_path):
+    """
+    runs are merged by several passes, when there are more of them than MERGE_WAYS, temporary files are removed
+    after clearing
+    """
+    monkeypatch.setattr(SpillInformation, 'MERGE_WAYS', 2)
+    rows = read_rows()
+    data = SpillInformation.SpillInformation(str(tmp_path), 1)
+    data.load_many(rows)
+    data.load_add_inf(len(rows), sum(len(i[1]) for i in rows))
+    assert max(Counter(i[4] for i in rows).values()) > SpillInformation.MERGE_WAYS
+    assert data.counters()['spilled_rows'] == data.counters()['runs'] == len(rows)
+    assert Service.render(data, 'tsv', 'utf-8').decode('utf-8') == read_result()
+    assert os.listdir(tmp_path)
+    data.clear()
+    assert os.listdir(tmp_path) == []
+
+
+def test_loaded_data_is_not_changed(tmp_path):
+    """
+    new problem can not be added after merging
+    """
+    rows = read_rows()
+    data = SpillInformation.SpillInformation(str(tmp_path), 4)
+    data.load_many(rows)
+    data.load_add_inf(len(rows), 0)
+    with pytest.raises(ValueError, match='Loaded data of backend "spill" can not be changed'):
+        data.load('Іван', 'Яковенко', 70, 'Петрович', 'Знайти корені нового рівняння', 2020, 4, 3)
+
+
+@pytest.mark.parametrize('options', [{'workers': 2}, {'snapshot': 'data.snap'}], ids=['workers', 'snapshot'])
+def test_improper_options(run, make_ini, options):
+    """
+    backend "spill" works only with one worker and without snapshot
+    """
+    path, output_file = make_ini({'backend': 'spill', **options})
+    out = run(path)
+    assert out.endswith('Backend "spill" works only with one worker and without snapshot in .ini file\n')
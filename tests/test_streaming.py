@@ -0,0 +1,45 @@
+"""
+Module of Shtonda Yelizaveta, contains tests of streaming mode, which drops problems after not good attempt
+"""
+import pytest
+import Information
+from conftest import ERRORS, check_output, check_error, read_rows
+
+
+def test_sample_files(run, make_ini):
+    """
+    streaming mode gives result.txt
+    """
+    check_output(run, make_ini, {'streaming': True})
+
+
+@pytest.mark.parametrize('error', [i for i in ERRORS.values() if i[0] != 'repeated'],
+                         ids=[i for i in ERRORS if i != 'repeated attempt'])
+def test_csv_errors(run, make_ini, error):
+    """
+    streaming mode stops with the same messages (repeated attempts of dropped problems are not checked)
+    """
+    check_error(run, make_ini, {'streaming': True}, error)
+
+
+def test_problems_are_dropped():
+    """
+    problems with not good attempts keep only quantities of attempts
+    """
+    rows = read_rows()
+    data = Information.Information.from_records(rows, streaming=True)
+    full = Information.Information.from_records(rows)
+    dropped = [i for i in data.problems if i.students is None]
+    assert dropped and data.counters()['dropped_problems'] == len(dropped)
+    for problem in dropped:
+        other = full.problems[full.problems_names[problem.cond]]
+        assert not other.good_problem()
+        assert (problem.attemptes_num, problem.good_attemptes_num) == (other.attemptes_num, other.good_attemptes_num)
+
+
+def test_streaming_needs_objects(run, make_ini):
+    """
+    streaming mode with backend "columns" stops program
+    """
+    path, output_file = make_ini({'streaming': True, 'backend': 'columns'})
+    assert run(path).endswith('\nStreaming works only with backend "objects" in .ini file\n')
@@ -0,0 +1,54 @@
+"""
+Module of Shtonda Yelizaveta, contains tests of module Validation, which checks fields by columns and remembers
+answers for names and conditions
+"""
+import pytest
+import Validation
+from conftest import ERRORS, check_output, broken_lines, read_lines, read_rows
+
+
+def test_trusted(run, make_ini):
+    """
+    trusted mode gives result.txt
+    """
+    check_output(run, make_ini, {'trusted': True})
+
+
+def test_trusted_loads_improper_fields(run, make_ini):
+    """
+    trusted mode does not check fields
+    """
+    path, output_file = make_ini({'trusted': True}, lines=broken_lines('points', '101'))
+    assert 'program aborted' not in run(path)
+
+
+@pytest.mark.parametrize('error', [i for i in ERRORS.values() if i[0] not in ('fields', 'repeated')],
+                         ids=[i for i in ERRORS if i not in ('fields', 'repeated attempt')])
+def test_columns_and_rows(error):
+    """
+    improper field is found by check of columns, by check of rows and by check of row
+    """
+    field, value, message = error
+    rows = read_rows(broken_lines(field, value))
+    wrong = len([i for i in read_lines()[:12] if i])
+    assert rows[wrong] != read_rows()[wrong]
+    assert Validation.good_columns(*zip(*read_rows()))
+    assert not Validation.good_columns(*zip(*rows))
+    assert Validation.first_wrong_row(rows) == wrong
+    assert Validation.first_wrong_row(rows, wrong + 1) == len(rows)
+    with pytest.raises(ValueError, match=message):
+        Validation.check_row(rows[wrong])
+    Validation.trust(True)
+    assert Validation.good_columns(*zip(*rows)) and Validation.first_wrong_row(rows) == len(rows)
+
+
+def test_cache():
+    """
+    answers for repeated names and conditions are remembered
+    """
+    before = Validation.cache_info()
+    for _ in range(3):
+        Validation.check_row(read_rows()[0])
+    after = Validation.cache_info()
+    assert after['cond']['hits'] >= before['cond']['hits'] + 2
+    assert after['name']['hits'] >= before['name']['hits'] + 6
@@ -0,0 +1,70 @@
+"""
+Module of Shtonda Yelizaveta, contains tests of watching of .csv file, which is appended by other program
+"""
+import pytest
+import main
+import Loading
+import Watch
+from conftest import ROOT, CSV_FILE, JSON_FILE, INI_FILE, ENCODING, read_lines, read_result
+
+
+def test_watch(monkeypatch, tmp_path):
+    """
+    watching of sample file gives result.txt
+    """
+    monkeypatch.chdir(ROOT)
+    output_file = str(tmp_path / 'watch.txt')
+    keys = Loading.load_ini(INI_FILE)
+    watch = Watch.Watch(CSV_FILE, keys[1], keys[2], output_file, 'utf-8', keys[5])
+    watch.run(0, 1)
+    assert read_result(output_file) == read_result()
+
+
+def test_watch_appended_lines(capsys, tmp_path):
+    """
+    lines, appended in several parts, give the same output as the whole file
+    """
+    lines = read_lines()
+    main_file = tmp_path / 'watch.csv'
+    output_file = str(tmp_path / 'watch.txt')
+    main_file.write_text(''.join(f'{i}\n' for i in lines[:5]), encoding=ENCODING)
+    watch = Watch.Watch(str(main_file), JSON_FILE, ENCODING, output_file, 'utf-8')
+    assert watch.refresh() == 5
+    with open(main_file, 'a', encoding='utf-8') as f:
+        f.write(''.join(f'{i}\n' for i in lines[5:]))
+    assert watch.refresh() == len([i for i in lines[5:] if i])
+    assert 'json?=csv: OK' in capsys.readouterr().out
+    assert read_result(output_file) == read_result()
+
+
+def test_watch_partial_line(capsys, tmp_path):
+    """
+    the last line without new line symbol is loaded only when its new line symbol is written or watching
+    is finished
+    """
+    lines = [i for i in read_lines() if i]
+    main_file = tmp_path / 'watch.csv'
+    output_file = str(tmp_path / 'watch.txt')
+    text = ''.join(f'{i}\n' for i in lines[:-1])
+    main_file.write_text(text + lines[-1][:20], encoding=ENCODING)
+    watch = Watch.Watch(str(main_file), JSON_FILE, ENCODING, output_file, 'utf-8')
+    assert watch.refresh() == len(lines) - 1
+    assert watch.refresh() == 0
+    with open(main_file, 'a', encoding='utf-8') as f:
+        f.write(lines[-1][20:])
+    assert watch.refresh() == 0
+    assert watch.refresh(final=True) == 1
+    assert 'json?=csv: OK' in capsys.readouterr().out
+    assert read_result(output_file) == read_result()
+    with open(main_file, 'a', encoding='utf-8') as f:
+        f.write('\n')
+    assert watch.refresh() == 0
+
+
+@pytest.mark.parametrize('value, interval', [('', 1), ('5', 5), ('0.5', 0.5), ('1e-1', 0.1), ('0', None),
+                                             ('-1', None), ('abc', None), ('nan', None), ('inf', None)])
+def test_watch_interval(value, interval):
+    """
+    value of flag --watch is positive quantity of seconds, which can be fractional
+    """
+    assert main.watch_interval({'watch': value}) == interval
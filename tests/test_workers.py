@@ -0,0 +1,46 @@
+"""
+Module of Shtonda Yelizaveta, contains tests of loading of parts of .csv file by several processes
+"""
+import pytest
+import Service
+import Information
+import ColumnInformation
+from conftest import ERRORS, check_output, check_error, read_rows
+
+MODES = {
+    'objects': {'workers': 2},
+    'csv parser': {'parser': 'csv', 'workers': 3},
+    'columns': {'backend': 'columns', 'workers': 2},
+}
+
+
+@pytest.mark.parametrize('options', MODES.values(), ids=MODES.keys())
+def test_sample_files(run, make_ini, options):
+    """
+    several workers give result.txt
+    """
+    check_output(run, make_ini, options)
+
+
+@pytest.mark.parametrize('error', ERRORS.values(), ids=ERRORS.keys())
+@pytest.mark.parametrize('options', MODES.values(), ids=MODES.keys())
+def test_csv_errors(run, make_ini, options, error):
+    """
+    several workers stop with the same messages as one worker
+    """
+    check_error(run, make_ini, options, error)
+
+
+@pytest.mark.parametrize('backend', [Information.Information, ColumnInformation.ColumnInformation])
+def test_merge(backend):
+    """
+    merged parts give the same report as object loaded at once
+    """
+    rows = read_rows()
+    whole = backend.from_records(rows)
+    data = backend.from_records(rows[:5])
+    for start, end in ((5, 9), (9, len(rows))):
+        part = data.copy_empty()
+        part.load_many(rows[start:end])
+        data.merge(part)
+    assert Service.render(data, 'tsv', 'utf-8') == Service.render(whole, 'tsv', 'utf-8')
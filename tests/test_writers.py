@@ -0,0 +1,84 @@
+"""
+Module of Shtonda Yelizaveta, contains tests of writers of report in formats 'tsv', 'jsonl' and 'binary'
+"""
+import io
+import json
+import pytest
+import Writers
+from conftest import read_result
+
+
+def tsv_of_jsonl(path):
+    """
+    :param path: path to report in format 'jsonl'
+    :return: the same report in format 'tsv'
+    """
+    lines = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            problem = json.loads(line)
+            lines.append(f'{problem["cond"]}\t{problem["attempts_num"]}\t{problem["good_attempts_num"]}\t'
+                         f'{problem["percentage"]}\n')
+            lines.extend(f'\t{i["year"]}\t{i["surname"]}\t{i["name"]}\t{i["middle_name"]}\t{i["percent"]}\n'
+                         for i in problem['attempts'])
+    return ''.join(lines)
+
+
+def tsv_of_binary(path):
+    """
+    :param path: path to report in format 'binary'
+    :return: the same report in format 'tsv', converted by function Writers.read_binary()
+    """
+    f = io.StringIO()
+    writer = Writers.TsvWriter(f)
+    with open(path, 'rb') as binary:
+        Writers.read_binary(binary, writer)
+    writer.flush()
+    return f.getvalue()
+
+
+@pytest.mark.parametrize('backend', ['objects', 'columns'])
+def test_jsonl(run, make_ini, backend):
+    """
+    report in format 'jsonl' has the same problems and attempts as result.txt
+    """
+    path, output_file = make_ini({'backend': backend}, {'format': 'jsonl'})
+    assert 'output' in run(path)
+    assert tsv_of_jsonl(output_file) == read_result()
+
+
+@pytest.mark.parametrize('backend', ['objects', 'columns'])
+def test_binary(run, make_ini, backend):
+    """
+    report in format 'binary', read back by function Writers.read_binary(), is the same as result.txt
+    """
+    path, output_file = make_ini({'backend': backend}, {'format': 'binary'})
+    run(path)
+    with open(output_file, 'rb') as f:
+        assert f.read(Writers.HEADER.size) == Writers.HEADER.pack(Writers.MAGIC, Writers.VERSION)
+    assert tsv_of_binary(output_file) == read_result()
+
+
+def test_improper_binary(tmp_path):
+    """
+    file without header of binary report is not read
+    """
+    path = tmp_path / 'report.bin'
+    path.write_bytes(b'not a report')
+    with open(path, 'rb') as f, pytest.raises(ValueError, match='Something wrong with binary report'):
+        Writers.read_binary(f, Writers.TsvWriter(io.StringIO()))
+
+
+@pytest.mark.parametrize('output_format', ['tsv', 'jsonl', 'binary'])
+def test_small_buffer(run, make_ini, monkeypatch, output_format):
+    """
+    report, written by many small batches, is the same as report written at once
+    """
+    path, output_file = make_ini(output_keys={'format': output_format})
+    run(path)
+    with open(output_file, 'rb') as f:
+        whole = f.read()
+    monkeypatch.setattr(Writers, 'BUFFER_LINES', 2)
+    run(path)
+    with open(output_file, 'rb') as f:
+        assert f.read() == whole